@@ -0,0 +1,100 @@
+"""
+Compare the Cartan orthonormal - frame engine with the coordinate route.
+
+For each metric the coordinate Riemann tensor is computed twice:
+1. Christoffel symbols -> RiemannTensor.from_christoffel
+2. CartanCurvature (structure coefficients -> connection forms -> frame Riemann)
+   converted back to coordinates with to_riemann()
+
+Kerr uses Carter's coframe; the default frame of zero angular momentum
+observers has nested square roots and is much slower.
+
+The registry of precomputed spacetimes is disabled so both routes do the work.
+"""
+
+import time
+import sympy as sp
+from itensorpy import Metric, ChristoffelSymbols, RiemannTensor, CartanCurvature, numeric_zero_test
+from itensorpy import spacetimes
+from itensorpy.registry import enable_registry, disable_registry
+
+
+def general_static_metric():
+    """Static spherically symmetric metric with two free functions."""
+    t, r, theta, phi = sp.symbols('t r theta phi')
+    A = sp.Function('A')(r)
+    B = sp.Function('B')(r)
+    g = sp.diag(-sp.exp(2 * A), sp.exp(2 * B), r**2, r**2 * sp.sin(theta)**2)
+    return Metric(g, [t, r, theta, phi], signature=(-1, 1, 1, 1))
+
+
+def carter_coframe(metric):
+    """Carter's orthonormal coframe for Kerr in Boyer-Lindquist coordinates."""
+    t, r, theta, phi = metric.coordinates
+    M, a = metric.params
+    rho = sp.sqrt(r**2 + a**2 * sp.cos(theta)**2)
+    delta = r**2 - 2 * M * r + a**2
+    return sp.Matrix([
+        [sp.sqrt(delta) / rho, 0, 0, -a * sp.sin(theta)**2 * sp.sqrt(delta) / rho],
+        [0, rho / sp.sqrt(delta), 0, 0],
+        [0, 0, rho, 0],
+        [-a * sp.sin(theta) / rho, 0, 0, (r**2 + a**2) * sp.sin(theta) / rho],
+    ])
+
+
+def metrics():
+    """Metrics used in the comparison, with an optional coframe."""
+    kerr = spacetimes.kerr()
+    return [
+        ("Schwarzschild", spacetimes.schwarzschild(), None),
+        ("Reissner-Nordstrom", spacetimes.reissner_nordstrom(), None),
+        ("FLRW (k=1)", spacetimes.friedmann_lemaitre_robertson_walker(k=1), None),
+        ("Static A(r), B(r)", general_static_metric(), None),
+        ("Kerr (Carter frame)", kerr, carter_coframe(kerr)),
+    ]
+
+
+def compare(name, metric, coframe=None, level=1):
+    """Time both routes for one metric and check that they agree."""
+    print(f"\n{name} (level {level}):")
+
+    start_time = time.time()
+    christoffel = ChristoffelSymbols(metric=metric, simplify_level=level)
+    coordinate = RiemannTensor.from_christoffel(christoffel, simplify_level=level)
+    coordinate_time = time.time() - start_time
+    print(f"  Coordinate route: {coordinate_time:.4f} seconds")
+
+    start_time = time.time()
+    frame = CartanCurvature(metric, coframe=coframe, simplify_level=level).to_riemann()
+    cartan_time = time.time() - start_time
+    print(f"  Cartan route:     {cartan_time:.4f} seconds")
+    print(f"  Speedup:          {coordinate_time / cartan_time:.1f}x")
+
+    n = metric.dimension
+    expected, actual = coordinate.components_down, frame.components_down
+    mismatches = 0
+    for a in range(n):
+        for b in range(n):
+            for c in range(n):
+                for d in range(n):
+                    diff = expected[a][b][c][d] - actual[a][b][c][d]
+                    if numeric_zero_test(diff) is False:
+                        mismatches += 1
+    print(f"  Results match: {mismatches == 0}")
+
+
+def main():
+    """Run the Cartan benchmark."""
+    print("Cartan vs Coordinate Riemann Benchmark")
+    print("--------------------------------------")
+
+    disable_registry()
+    try:
+        for name, metric, coframe in metrics():
+            compare(name, metric, coframe)
+    finally:
+        enable_registry()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Compare the algorithms for Christoffel symbols.
+
+ChristoffelSymbols supports two algorithms:
+1. "formula": Γ^k_ij = g^kl Γ_lij from the full metric derivative table
+   (closed - form expressions for diagonal metrics)
+2. "lagrangian": reading Γ_kij off the Euler - Lagrange equations of the
+   geodesic Lagrangian L = (1/2) g_ij ẋ^i ẋ^j, which only differentiates
+   the non - zero entries of the metric
+
+method="auto" resolves to the formula. The registry of
+precomputed spacetimes is disabled and the SymPy cache is cleared before each
+run, so every timing starts from scratch.
+"""
+
+import time
+import sympy as sp
+from sympy.core.cache import clear_cache
+from itensorpy import Metric, ChristoffelSymbols, numeric_zero_test
+from itensorpy import spacetimes
+from itensorpy.registry import enable_registry, disable_registry
+
+
+def kaluza_klein_metric():
+    """Five - dimensional metric with a single off - diagonal gauge field entry."""
+    t, x, y, z, w = sp.symbols('t x y z w')
+    A = sp.Function('A')(x, y)
+    phi = sp.Function('phi')(t)
+    g = sp.diag(-1, 1, 1, 1, phi**2)
+    g[1, 4] = g[4, 1] = phi**2 * A
+    g[1, 1] = 1 + phi**2 * A**2
+    return Metric(g, [t, x, y, z, w])
+
+
+def sparse_8d_metric():
+    """Eight - dimensional warped metric with one off - diagonal entry."""
+    x = sp.symbols('x0:8')
+    f = [sp.Function(f'f{i}')(x[0], x[1]) for i in range(8)]
+    g = sp.diag(*[(-1 if i == 0 else 1) * f[i]**2 for i in range(8)])
+    g[0, 7] = g[7, 0] = f[0] * x[1]
+    return Metric(g, list(x))
+
+
+def dense_metric():
+    """Four - dimensional metric with every entry non - zero."""
+    t, x, y, z = sp.symbols('t x y z')
+    g = sp.Matrix(4, 4, lambda i, j: 2 + t**2 if i == j else x * y / 10)
+    return Metric(g, [t, x, y, z])
+
+
+def metrics():
+    """Metrics used in the comparison."""
+    return [
+        ("Schwarzschild", spacetimes.schwarzschild),
+        ("FLRW (k=1)", lambda: spacetimes.friedmann_lemaitre_robertson_walker(k=1)),
+        ("Kerr", spacetimes.kerr),
+        ("Kaluza-Klein (5D)", kaluza_klein_metric),
+        ("Sparse 8D", sparse_8d_metric),
+        ("Dense 4D", dense_metric),
+    ]
+
+
+def time_method(make_metric, method, level=1):
+    """Time one method on a fresh metric and an empty SymPy cache."""
+    metric = make_metric()
+    clear_cache()
+    start_time = time.time()
+    christoffel = ChristoffelSymbols(metric=metric, simplify_level=level, method=method)
+    return time.time() - start_time, christoffel
+
+
+def main():
+    """Run the Christoffel method comparison."""
+    print("Christoffel Symbols: formula vs Euler-Lagrange")
+    print("----------------------------------------------")
+
+    disable_registry()
+    try:
+        # Warm up SymPy so the first timing does not include one - off import costs
+        time_method(dense_metric, "formula")
+
+        for name, make_metric in metrics():
+            auto = ChristoffelSymbols(metric=make_metric(), lazy=True).method
+            print(f"\n{name} (auto picks {auto}):")
+            for level in (0, 1):
+                formula_time, formula = time_method(make_metric, "formula", level)
+                lagrangian_time, lagrangian = time_method(make_metric, "lagrangian", level)
+                print(f"  level {level}: formula {formula_time:.4f}s, "
+                      f"lagrangian {lagrangian_time:.4f}s, "
+                      f"speedup {formula_time / lagrangian_time:.1f}x")
+
+            n = formula.metric.dimension
+            same = all(numeric_zero_test(formula[k, i, j] - lagrangian[k, i, j]) is not False
+                       for k in range(n) for i in range(n) for j in range(n))
+            print(f"  Results match: {same}")
+    finally:
+        enable_registry()
+
+
+if __name__ == "__main__":
+    main()
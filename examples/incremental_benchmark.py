@@ -0,0 +1,118 @@
+"""
+Compare incremental recomputation with a fresh computation after a metric change.
+
+For each metric the Einstein and Riemann tensors are first computed for the parent.
+One component is then replaced with Metric.with_component and the tensors of the
+derived metric are computed twice:
+1. Through the derived metric's context, which copies the components that do not
+   depend on the changed entry from the parent's context
+2. From scratch on an unrelated metric with the same components
+
+The registry of precomputed spacetimes is disabled and the SymPy cache is cleared
+before each run, so neither run benefits from the other.
+"""
+
+import time
+import sympy as sp
+from sympy.core.cache import clear_cache
+from itensorpy import Metric, numeric_zero_test
+from itensorpy.registry import enable_registry, disable_registry
+
+
+def static_metric():
+    """Static spherically symmetric metric; g_θθ becomes a free function C(t, r)."""
+    t, r, theta, phi = sp.symbols('t r theta phi')
+    A = sp.Function('A')(r)
+    B = sp.Function('B')(r)
+    g = sp.diag(-A, B, r**2, r**2 * sp.sin(theta)**2)
+    return Metric(g, [t, r, theta, phi], simplify_level=1), (2, 2, sp.Function('C')(t, r))
+
+
+def warped_6d_metric():
+    """Six - dimensional warped metric; g_44 gains a dependence on x4."""
+    x = sp.symbols('x0:6')
+    f = [sp.Function(f'f{i}')(x[0], x[1]) for i in range(6)]
+    g = sp.diag(*[(-1 if i == 0 else 1) * f[i]**2 for i in range(6)])
+    h = sp.Function('h')(x[0], x[1], x[4])
+    return Metric(g, list(x), simplify_level=1), (4, 4, h**2)
+
+
+def kaluza_klein_metric():
+    """Five - dimensional metric; the gauge field entry g_14 is switched on."""
+    t, x, y, z, w = sp.symbols('t x y z w')
+    phi = sp.Function('phi')(t)
+    g = sp.diag(-1, 1, 1, 1, phi**2)
+    return Metric(g, [t, x, y, z, w], simplify_level=1), (1, 4, phi**2 * sp.Function('A')(x, y))
+
+
+def stages(metric):
+    """Compute the tensors of a metric stage by stage and time each stage."""
+    context = metric.context
+    level = context.intermediate_level
+    times = {}
+    for name, build in [("Christoffel", lambda: context.christoffel(simplify_level=level)),
+                        ("Ricci", lambda: context.ricci_tensor(simplify_level=level)),
+                        ("Einstein", context.einstein),
+                        ("Riemann", context.riemann)]:
+        start_time = time.time()
+        node = build()
+        times[name] = (time.time() - start_time, node)
+    return times
+
+
+def compare(name, make_metric):
+    """Time the incremental and the fresh computation for one metric change."""
+    metric, (i, j, expr) = make_metric()
+    print(f"\n{name}, g_{i}{j} -> {expr}:")
+    stages(metric)
+
+    derived = metric.with_component(i, j, expr)
+    clear_cache()
+    incremental = stages(derived)
+
+    fresh_metric = Metric(derived.g, derived.coordinates, derived.params, derived.simplify_level)
+    clear_cache()
+    fresh = stages(fresh_metric)
+
+    for stage, (incremental_time, node) in incremental.items():
+        fresh_time = fresh[stage][0]
+        recomputed = len(node.recomputed) if node.recomputed is not None else "all"
+        print(f"  {stage:12s} fresh {fresh_time:.4f}s, incremental {incremental_time:.4f}s "
+              f"({recomputed} components recomputed)")
+
+    total_fresh = sum(value[0] for value in fresh.values())
+    total_incremental = sum(value[0] for value in incremental.values())
+    print(f"  Total        fresh {total_fresh:.4f}s, incremental {total_incremental:.4f}s, "
+          f"speedup {total_fresh / total_incremental:.1f}x")
+
+    n = derived.dimension
+    riemann, fresh_riemann = incremental["Riemann"][1], fresh["Riemann"][1]
+    einstein, fresh_einstein = incremental["Einstein"][1], fresh["Einstein"][1]
+    up, fresh_up = riemann.components_up, fresh_riemann.components_up
+    lower, fresh_lower = einstein.components_lower, fresh_einstein.components_lower
+    same = all(numeric_zero_test(up[a][b][c][d] - fresh_up[a][b][c][d]) is not False
+               for a in range(n) for b in range(n) for c in range(n) for d in range(n))
+    same = same and all(numeric_zero_test(lower[a, b] - fresh_lower[a, b]) is not False
+                        for a in range(n) for b in range(n))
+    print(f"  Results match: {same}")
+
+
+def main():
+    """Run the incremental recomputation benchmark."""
+    print("Incremental Recomputation Benchmark")
+    print("-----------------------------------")
+
+    disable_registry()
+    try:
+        # Warm up SymPy so the first timing does not include one - off import costs
+        stages(static_metric()[0])
+
+        compare("Static A(r), B(r)", static_metric)
+        compare("Warped 6D", warped_6d_metric)
+        compare("Kaluza-Klein (5D)", kaluza_klein_metric)
+    finally:
+        enable_registry()
+
+
+if __name__ == "__main__":
+    main()
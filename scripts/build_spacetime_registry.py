@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+"""
+Regenerate src/itensorpy/_spacetime_data.py, the data behind itensorpy.registry.
+
+For every metric in itensorpy.spacetimes (with its default symbols) this stores the
+structural key, the non - zero Christoffel symbols and the curvature invariants,
+all written in the canonical symbols x0, x1, ... and p0, p1, ...
+
+Run from the repository root after changing a metric in itensorpy.spacetimes:
+
+    python scripts/build_spacetime_registry.py
+"""
+
+import os
+import pprint
+import sys
+
+import sympy as sp
+from sympy import cos
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from itensorpy import spacetimes, ChristoffelSymbols, RiemannTensor, RicciTensor, RicciScalar
+from itensorpy import CurvatureInvariants, custom_simplify
+from itensorpy.registry import disable_registry, structural_key, _canonical_mapping
+from sympy.core.function import AppliedUndef
+
+OUTPUT = os.path.join(os.path.dirname(__file__), "..", "src", "itensorpy", "_spacetime_data.py")
+
+HEADER = '''"""
+Precomputed tensors for the spacetimes in itensorpy.spacetimes.
+
+Generated by scripts/build_spacetime_registry.py; do not edit by hand.
+"""
+
+'''
+
+
+def kerr_newman_kretschmann(metric):
+    """
+    Closed form Kretschmann scalar of the Kerr - Newman metric (Kerr for q = 0).
+
+    With c = cos(theta) and rho^2 = r^2 + a^2 c^2:
+    K = 8 / rho^12 [6 M^2 (r^6 - 15 a^2 r^4 c^2 + 15 a^4 r^2 c^4 - a^6 c^6)
+                    - 12 M q^2 r (r^4 - 10 a^2 r^2 c^2 + 5 a^4 c^4)
+                    + q^4 (7 r^4 - 34 a^2 r^2 c^2 + 7 a^4 c^4)]
+    """
+    t, r, theta, phi = metric.coordinates
+    M, a = metric.params[:2]
+    q = metric.params[2] if len(metric.params) > 2 else 0
+    c = cos(theta)
+    rho2 = r**2 + a**2 * c**2
+
+    return 8 * (6 * M**2 * (r**6 - 15 * a**2 * r**4 * c**2 + 15 * a**4 * r**2 * c**4 - a**6 * c**6)
+                - 12 * M * q**2 * r * (r**4 - 10 * a**2 * r**2 * c**2 + 5 * a**4 * c**4)
+                + q**4 * (7 * r**4 - 34 * a**2 * r**2 * c**2 + 7 * a**4 * c**4)) / rho2**6
+
+
+def kerr_newman_invariants(metric):
+    """
+    Invariants of the Kerr - Newman family.
+
+    The spacetime is electrovacuum, so R = 0 and R_ab R^ab = 4 q^4 / rho^8, which
+    gives the Euler scalar K - 16 q^4 / rho^8. The Chern - Pontryagin scalar is
+    parity - odd and left to the general computation.
+    """
+    t, r, theta, phi = metric.coordinates
+    q = metric.params[2] if len(metric.params) > 2 else 0
+    rho2 = r**2 + metric.params[1]**2 * cos(theta)**2
+
+    K = custom_simplify(kerr_newman_kretschmann(metric))
+    return {
+        "kretschmann": K,
+        "euler": custom_simplify(K - 16 * q**4 / rho2**4),
+    }
+
+
+def diagonal_invariants(metric, riemann):
+    """
+    Invariants of a diagonal metric from its Riemann tensor.
+
+    R_abcd of a diagonal metric vanishes unless {a,b} = {c,d}, so every term of the
+    Chern - Pontryagin contraction, which needs four distinct indices, is zero.
+    """
+    K = CurvatureInvariants(metric=metric, riemann=riemann).kretschmann_scalar()
+
+    ricci = RicciTensor.from_riemann(riemann)
+    R = RicciScalar.from_ricci(ricci).value
+    g_inv = metric.inverse
+    n = metric.dimension
+    ricci_squared = sum(g_inv[a, a] * g_inv[b, b] * ricci.components[a, b]**2
+                        for a in range(n) for b in range(n))
+
+    return {
+        "kretschmann": K,
+        "euler": custom_simplify(K - 4 * ricci_squared + R**2),
+        "chern_pontryagin": sp.S.Zero,
+    }
+
+
+def christoffel_symbols(metric):
+    """
+    Christoffel symbols in factored form.
+
+    Γ^k_ij = g^kl Γ_lij is brought to a single factored fraction, which stays compact
+    for the Kerr family where the default trigsimp - based simplification is very slow.
+    """
+    n = metric.dimension
+    g_inv = metric.inverse
+    dg = metric.derivatives
+
+    components = [[[sp.S.Zero for _ in range(n)] for _ in range(n)] for _ in range(n)]
+    for k in range(n):
+        for i in range(n):
+            for j in range(i, n):
+                value = sum(g_inv[k, l] * (dg[i][j][l] + dg[j][i][l] - dg[l][i][j]) / 2 for l in range(n))
+                value = sp.factor(sp.cancel(value))
+                components[k][i][j] = value
+                components[k][j][i] = value
+
+    return ChristoffelSymbols(components=components, metric=metric)
+
+
+def entry(name, metric):
+    """Build the registry entry of one metric."""
+    print(f"{name}...", flush=True)
+    mapping = _canonical_mapping(metric)
+
+    christoffel = christoffel_symbols(metric)
+    n = metric.dimension
+    components = {}
+    for k in range(n):
+        for i in range(n):
+            for j in range(i, n):
+                value = christoffel.components[k][i][j]
+                if value != 0:
+                    components[(k, i, j)] = str(value.xreplace(mapping))
+
+    if metric.is_diagonal:
+        riemann = RiemannTensor.from_christoffel(christoffel)
+        invariants = diagonal_invariants(metric, riemann)
+    else:
+        invariants = kerr_newman_invariants(metric)
+
+    canonical = list(mapping.values())
+    return {
+        "name": name,
+        "symbols": {str(s): sp.srepr(s) for s in canonical if isinstance(s, sp.Symbol)},
+        "functions": sorted(str(f.func) for f in canonical if isinstance(f, AppliedUndef)),
+        "christoffel": components,
+        "invariants": {key: str(sp.sympify(value).xreplace(mapping)) for key, value in invariants.items()},
+    }
+
+
+def main():
+    """Compute every entry and write the data module."""
+    disable_registry()
+
+    metrics = [
+        ("minkowski", spacetimes.minkowski()),
+        ("schwarzschild", spacetimes.schwarzschild()),
+        ("reissner_nordstrom", spacetimes.reissner_nordstrom()),
+        ("kerr", spacetimes.kerr()),
+        ("kerr_newman", spacetimes.kerr_newman_metric()),
+        ("flrw_flat", spacetimes.friedmann_lemaitre_robertson_walker(k=0)),
+        ("flrw_closed", spacetimes.friedmann_lemaitre_robertson_walker(k=1)),
+        ("flrw_open", spacetimes.friedmann_lemaitre_robertson_walker(k=-1)),
+        ("de_sitter", spacetimes.de_sitter()),
+        ("anti_de_sitter", spacetimes.anti_de_sitter()),
+    ]
+
+    data = {structural_key(metric): entry(name, metric) for name, metric in metrics}
+
+    with open(OUTPUT, "w") as file:
+        file.write(HEADER)
+        file.write("SPACETIMES = {}\n")
+        for key, value in data.items():
+            file.write(f"\n# {value['name']}\n")
+            file.write(f"SPACETIMES[{key!r}] = ")
+            file.write(pprint.pformat(value, width=100, sort_dicts=False))
+            file.write("\n")
+
+    print(f"Wrote {len(data)} spacetimes to {OUTPUT}")
+
+
+if __name__ == "__main__":
+    main()
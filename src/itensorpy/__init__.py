@@ -14,14 +14,24 @@ from .christoffel import ChristoffelSymbols
 from .riemann import RiemannTensor
 from .ricci import RicciTensor, RicciScalar
 from .einstein import EinsteinTensor
+from .weyl import WeylTensor
 from .curvature import CurvatureInvariants
+from .cartan import CartanCurvature
 from .utils import (
     generate_index_riemann,
+    generate_index_riemann_independent,
     generate_index_ricci,
     generate_index_christoffel,
     lower_indices,
-    custom_simplify
+    custom_simplify,
+    set_default_workers,
+    get_default_workers,
+    set_intermediate_simplify_level,
+    get_intermediate_simplify_level,
+    numeric_zero_test,
+    coordinate_dependencies
 )
+from .cache import enable_disk_cache, disable_disk_cache
 from . import spacetimes
 from .matrix_ops import MatrixOps
 from .tensor_ops import TensorND
@@ -29,11 +39,15 @@ from .differential_ops import Field
 
 __all__ = [
     'Metric', 'ChristoffelSymbols', 'RiemannTensor',
-    'RicciTensor', 'RicciScalar', 'EinsteinTensor',
-    'CurvatureInvariants', 'spacetimes',
-    'generate_index_riemann', 'generate_index_ricci',
+    'RicciTensor', 'RicciScalar', 'EinsteinTensor', 'WeylTensor',
+    'CurvatureInvariants', 'CartanCurvature', 'spacetimes',
+    'generate_index_riemann', 'generate_index_riemann_independent',
+    'generate_index_ricci',
     'generate_index_christoffel', 'lower_indices',
-    'custom_simplify',
+    'custom_simplify', 'set_default_workers', 'get_default_workers',
+    'set_intermediate_simplify_level', 'get_intermediate_simplify_level', 'numeric_zero_test',
+    'coordinate_dependencies',
+    'enable_disk_cache', 'disable_disk_cache',
     # New modules
     'MatrixOps', 'TensorND', 'Field'
 ]
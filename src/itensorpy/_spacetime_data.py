@@ -0,0 +1,390 @@
+"""
+Precomputed tensors for the spacetimes in itensorpy.spacetimes.
+
+Generated by scripts/build_spacetime_registry.py; do not edit by hand.
+"""
+
+SPACETIMES = {}
+
+# minkowski
+SPACETIMES['15fdb2558053439ea3e195ecba34d140d2d467adeba55426f4ec0ae09e79f5fd'] = {'name': 'minkowski',
+ 'symbols': {'x0': "Symbol('x0', commutative=True)",
+             'x1': "Symbol('x1', commutative=True)",
+             'x2': "Symbol('x2', commutative=True)",
+             'x3': "Symbol('x3', commutative=True)"},
+ 'functions': [],
+ 'christoffel': {},
+ 'invariants': {'kretschmann': '0', 'euler': '0', 'chern_pontryagin': '0'}}
+
+# schwarzschild
+SPACETIMES['ea4e4ab3b2d8be1aa4b09faf82af548c7e7c1fe265880bdf6861613ca0904ec6'] = {'name': 'schwarzschild',
+ 'symbols': {'x0': "Symbol('x0', commutative=True)",
+             'x1': "Symbol('x1', commutative=True)",
+             'x2': "Symbol('x2', commutative=True)",
+             'x3': "Symbol('x3', commutative=True)",
+             'p0': "Symbol('p0', commutative=True, complex=True, extended_negative=False, "
+                   'extended_nonnegative=True, extended_nonpositive=False, extended_nonzero=True, '
+                   'extended_positive=True, extended_real=True, finite=True, hermitian=True, '
+                   'imaginary=False, infinite=False, negative=False, nonnegative=True, '
+                   'nonpositive=False, nonzero=True, positive=True, real=True, zero=False)'},
+ 'functions': [],
+ 'christoffel': {(0, 0, 1): 'p0/(x1*(-2*p0 + x1))',
+                 (1, 0, 0): 'p0*(-2*p0 + x1)/x1**3',
+                 (1, 1, 1): '-p0/(x1*(-2*p0 + x1))',
+                 (1, 2, 2): '2*p0 - x1',
+                 (1, 3, 3): '-(-2*p0 + x1)*sin(x2)**2',
+                 (2, 1, 2): '1/x1',
+                 (2, 3, 3): '-sin(x2)*cos(x2)',
+                 (3, 1, 3): '1/x1',
+                 (3, 2, 3): 'cos(x2)/sin(x2)'},
+ 'invariants': {'kretschmann': '48*p0**2/x1**6',
+                'euler': '48*p0**2/x1**6',
+                'chern_pontryagin': '0'}}
+
+# reissner_nordstrom
+SPACETIMES['654644b916b1a43313a6a9c04692d6a0fe2c235d8935ceb710f4028dd72336c5'] = {'name': 'reissner_nordstrom',
+ 'symbols': {'x0': "Symbol('x0', commutative=True)",
+             'x1': "Symbol('x1', commutative=True)",
+             'x2': "Symbol('x2', commutative=True)",
+             'x3': "Symbol('x3', commutative=True)",
+             'p0': "Symbol('p0', commutative=True, complex=True, extended_negative=False, "
+                   'extended_nonnegative=True, extended_nonpositive=False, extended_nonzero=True, '
+                   'extended_positive=True, extended_real=True, finite=True, hermitian=True, '
+                   'imaginary=False, infinite=False, negative=False, nonnegative=True, '
+                   'nonpositive=False, nonzero=True, positive=True, real=True, zero=False)',
+             'p1': "Symbol('p1', commutative=True, complex=True, extended_real=True, finite=True, "
+                   'hermitian=True, imaginary=False, infinite=False, real=True)'},
+ 'functions': [],
+ 'christoffel': {(0, 0, 1): '(p0*x1 - p1**2)/(x1*(-2*p0*x1 + p1**2 + x1**2))',
+                 (1, 0, 0): '(p0*x1 - p1**2)*(-2*p0*x1 + p1**2 + x1**2)/x1**5',
+                 (1, 1, 1): '-(p0*x1 - p1**2)/(x1*(-2*p0*x1 + p1**2 + x1**2))',
+                 (1, 2, 2): '-(-2*p0*x1 + p1**2 + x1**2)/x1',
+                 (1, 3, 3): '-(-2*p0*x1 + p1**2 + x1**2)*sin(x2)**2/x1',
+                 (2, 1, 2): '1/x1',
+                 (2, 3, 3): '-sin(x2)*cos(x2)',
+                 (3, 1, 3): '1/x1',
+                 (3, 2, 3): 'cos(x2)/sin(x2)'},
+ 'invariants': {'kretschmann': '(48*p0**2*x1**2 - 96*p0*p1**2*x1 + 56*p1**4)/x1**8',
+                'euler': '(48*p0**2*x1**2 - 96*p0*p1**2*x1 + 40*p1**4)/x1**8',
+                'chern_pontryagin': '0'}}
+
+# kerr
+SPACETIMES['510689088cf9e90cfa944aaf92a0bbaa6a7050caec14d6836bd8f0bfcffb7284'] = {'name': 'kerr',
+ 'symbols': {'x0': "Symbol('x0', commutative=True)",
+             'x1': "Symbol('x1', commutative=True)",
+             'x2': "Symbol('x2', commutative=True)",
+             'x3': "Symbol('x3', commutative=True)",
+             'p0': "Symbol('p0', commutative=True, complex=True, extended_negative=False, "
+                   'extended_nonnegative=True, extended_nonpositive=False, extended_nonzero=True, '
+                   'extended_positive=True, extended_real=True, finite=True, hermitian=True, '
+                   'imaginary=False, infinite=False, negative=False, nonnegative=True, '
+                   'nonpositive=False, nonzero=True, positive=True, real=True, zero=False)',
+             'p1': "Symbol('p1', commutative=True, complex=True, extended_real=True, finite=True, "
+                   'hermitian=True, imaginary=False, infinite=False, real=True)'},
+ 'functions': [],
+ 'christoffel': {(0, 0, 1): 'p0*(p1**2 + x1**2)*(-p1*cos(x2) + x1)*(p1*cos(x2) + '
+                            'x1)/((p1**2*cos(x2)**2 + x1**2)*(2*p0*p1**2*x1*sin(x2)**2 - '
+                            '2*p0*p1**2*x1 - 2*p0*x1**3 + p1**4*cos(x2)**2 + '
+                            'p1**2*x1**2*cos(x2)**2 + p1**2*x1**2 + x1**4))',
+                 (0, 0, 2): '-2*p0*p1**2*x1*(-2*p0*x1 + p1**2 + '
+                            'x1**2)*sin(x2)*cos(x2)/((p1**2*cos(x2)**2 + '
+                            'x1**2)*(2*p0*p1**2*x1*sin(x2)**2 - 2*p0*p1**2*x1 - 2*p0*x1**3 + '
+                            'p1**4*cos(x2)**2 + p1**2*x1**2*cos(x2)**2 + p1**2*x1**2 + x1**4))',
+                 (0, 1, 3): '-p0*p1*(-p1**4*cos(x2)**2 + p1**2*x1**2*cos(x2)**2 + p1**2*x1**2 + '
+                            '3*x1**4)*sin(x2)**2/((p1**2*cos(x2)**2 + '
+                            'x1**2)*(2*p0*p1**2*x1*sin(x2)**2 - 2*p0*p1**2*x1 - 2*p0*x1**3 + '
+                            'p1**4*cos(x2)**2 + p1**2*x1**2*cos(x2)**2 + p1**2*x1**2 + x1**4))',
+                 (0, 2, 3): '2*p0*p1**3*x1*(-2*p0*x1 + p1**2 + '
+                            'x1**2)*sin(x2)**3*cos(x2)/((p1**2*cos(x2)**2 + '
+                            'x1**2)*(2*p0*p1**2*x1*sin(x2)**2 - 2*p0*p1**2*x1 - 2*p0*x1**3 + '
+                            'p1**4*cos(x2)**2 + p1**2*x1**2*cos(x2)**2 + p1**2*x1**2 + x1**4))',
+                 (1, 0, 0): 'p0*(-p1*cos(x2) + x1)*(p1*cos(x2) + x1)*(-2*p0*x1 + p1**2 + '
+                            'x1**2)/(p1**2*cos(x2)**2 + x1**2)**3',
+                 (1, 0, 3): '-p0*p1*(-p1*cos(x2) + x1)*(p1*cos(x2) + x1)*(-2*p0*x1 + p1**2 + '
+                            'x1**2)*sin(x2)**2/(p1**2*cos(x2)**2 + x1**2)**3',
+                 (1, 1, 1): '-(-p0*p1**2*cos(x2)**2 + p0*x1**2 + p1**2*x1*cos(x2)**2 - '
+                            'p1**2*x1)/((p1**2*cos(x2)**2 + x1**2)*(-2*p0*x1 + p1**2 + x1**2))',
+                 (1, 1, 2): '-p1**2*sin(x2)*cos(x2)/(p1**2*cos(x2)**2 + x1**2)',
+                 (1, 2, 2): '-x1*(-2*p0*x1 + p1**2 + x1**2)/(p1**2*cos(x2)**2 + x1**2)',
+                 (1, 3, 3): '-(-2*p0*x1 + p1**2 + x1**2)*(p0*p1**4*sin(x2)**2*cos(x2)**2 - '
+                            'p0*p1**2*x1**2*sin(x2)**2 + p1**4*x1*cos(x2)**4 + '
+                            '2*p1**2*x1**3*cos(x2)**2 + x1**5)*sin(x2)**2/(p1**2*cos(x2)**2 + '
+                            'x1**2)**3',
+                 (2, 0, 0): '-2*p0*p1**2*x1*sin(x2)*cos(x2)/(p1**2*cos(x2)**2 + x1**2)**3',
+                 (2, 0, 3): '2*p0*p1*x1*(p1**2*sin(x2)**2 + p1**2*cos(x2)**2 + '
+                            'x1**2)*sin(x2)*cos(x2)/(p1**2*cos(x2)**2 + x1**2)**3',
+                 (2, 1, 1): 'p1**2*sin(x2)*cos(x2)/((p1**2*cos(x2)**2 + x1**2)*(-2*p0*x1 + p1**2 + '
+                            'x1**2))',
+                 (2, 1, 2): 'x1/(p1**2*cos(x2)**2 + x1**2)',
+                 (2, 2, 2): '-p1**2*sin(x2)*cos(x2)/(p1**2*cos(x2)**2 + x1**2)',
+                 (2, 3, 3): '-(2*p0*p1**4*x1*sin(x2)**4 + 4*p0*p1**4*x1*sin(x2)**2*cos(x2)**2 + '
+                            '4*p0*p1**2*x1**3*sin(x2)**2 + p1**6*cos(x2)**4 + '
+                            'p1**4*x1**2*cos(x2)**4 + 2*p1**4*x1**2*cos(x2)**2 + '
+                            '2*p1**2*x1**4*cos(x2)**2 + p1**2*x1**4 + '
+                            'x1**6)*sin(x2)*cos(x2)/(p1**2*cos(x2)**2 + x1**2)**3',
+                 (3, 0, 1): 'p0*p1*(-p1*cos(x2) + x1)*(p1*cos(x2) + x1)/((p1**2*cos(x2)**2 + '
+                            'x1**2)*(2*p0*p1**2*x1*sin(x2)**2 - 2*p0*p1**2*x1 - 2*p0*x1**3 + '
+                            'p1**4*cos(x2)**2 + p1**2*x1**2*cos(x2)**2 + p1**2*x1**2 + x1**4))',
+                 (3, 0, 2): '-2*p0*p1*x1*(-2*p0*x1 + p1**2*sin(x2)**2 + p1**2*cos(x2)**2 + '
+                            'x1**2)*cos(x2)/((p1**2*cos(x2)**2 + x1**2)*(2*p0*p1**2*x1*sin(x2)**2 '
+                            '- 2*p0*p1**2*x1 - 2*p0*x1**3 + p1**4*cos(x2)**2 + '
+                            'p1**2*x1**2*cos(x2)**2 + p1**2*x1**2 + x1**4)*sin(x2))',
+                 (3, 1, 3): '(p0*p1**4*sin(x2)**2*cos(x2)**2 - p0*p1**2*x1**2*sin(x2)**2 - '
+                            '2*p0*p1**2*x1**2*cos(x2)**2 - 2*p0*x1**4 + p1**4*x1*cos(x2)**4 + '
+                            '2*p1**2*x1**3*cos(x2)**2 + x1**5)/((p1**2*cos(x2)**2 + '
+                            'x1**2)*(2*p0*p1**2*x1*sin(x2)**2 - 2*p0*p1**2*x1 - 2*p0*x1**3 + '
+                            'p1**4*cos(x2)**2 + p1**2*x1**2*cos(x2)**2 + p1**2*x1**2 + x1**4))',
+                 (3, 2, 3): '(-4*p0**2*p1**2*x1**2*sin(x2)**2 + 2*p0*p1**4*x1*sin(x2)**4 + '
+                            '4*p0*p1**4*x1*sin(x2)**2*cos(x2)**2 - 2*p0*p1**4*x1*cos(x2)**2 + '
+                            '4*p0*p1**2*x1**3*sin(x2)**2 - 2*p0*p1**2*x1**3*cos(x2)**2 - '
+                            '2*p0*p1**2*x1**3 - 2*p0*x1**5 + p1**6*cos(x2)**4 + '
+                            'p1**4*x1**2*cos(x2)**4 + 2*p1**4*x1**2*cos(x2)**2 + '
+                            '2*p1**2*x1**4*cos(x2)**2 + p1**2*x1**4 + '
+                            'x1**6)*cos(x2)/((p1**2*cos(x2)**2 + x1**2)*(2*p0*p1**2*x1*sin(x2)**2 '
+                            '- 2*p0*p1**2*x1 - 2*p0*x1**3 + p1**4*cos(x2)**2 + '
+                            'p1**2*x1**2*cos(x2)**2 + p1**2*x1**2 + x1**4)*sin(x2))'},
+ 'invariants': {'kretschmann': '(-48*p0**2*p1**6*cos(x2)**6 + 720*p0**2*p1**4*x1**2*cos(x2)**4 - '
+                               '720*p0**2*p1**2*x1**4*cos(x2)**2 + '
+                               '48*p0**2*x1**6)/(p1**12*cos(x2)**12 + 6*p1**10*x1**2*cos(x2)**10 + '
+                               '15*p1**8*x1**4*cos(x2)**8 + 20*p1**6*x1**6*cos(x2)**6 + '
+                               '15*p1**4*x1**8*cos(x2)**4 + 6*p1**2*x1**10*cos(x2)**2 + x1**12)',
+                'euler': '(-48*p0**2*p1**6*cos(x2)**6 + 720*p0**2*p1**4*x1**2*cos(x2)**4 - '
+                         '720*p0**2*p1**2*x1**4*cos(x2)**2 + 48*p0**2*x1**6)/(p1**12*cos(x2)**12 + '
+                         '6*p1**10*x1**2*cos(x2)**10 + 15*p1**8*x1**4*cos(x2)**8 + '
+                         '20*p1**6*x1**6*cos(x2)**6 + 15*p1**4*x1**8*cos(x2)**4 + '
+                         '6*p1**2*x1**10*cos(x2)**2 + x1**12)'}}
+
+# kerr_newman
+SPACETIMES['c9528c2bfd4be96d1060ff0547029ff1443a27e5ba2ed7d0418d5079dcc48197'] = {'name': 'kerr_newman',
+ 'symbols': {'x0': "Symbol('x0', commutative=True)",
+             'x1': "Symbol('x1', commutative=True)",
+             'x2': "Symbol('x2', commutative=True)",
+             'x3': "Symbol('x3', commutative=True)",
+             'p0': "Symbol('p0', commutative=True, complex=True, extended_negative=False, "
+                   'extended_nonnegative=True, extended_nonpositive=False, extended_nonzero=True, '
+                   'extended_positive=True, extended_real=True, finite=True, hermitian=True, '
+                   'imaginary=False, infinite=False, negative=False, nonnegative=True, '
+                   'nonpositive=False, nonzero=True, positive=True, real=True, zero=False)',
+             'p1': "Symbol('p1', commutative=True, complex=True, extended_real=True, finite=True, "
+                   'hermitian=True, imaginary=False, infinite=False, real=True)',
+             'p2': "Symbol('p2', commutative=True, complex=True, extended_real=True, finite=True, "
+                   'hermitian=True, imaginary=False, infinite=False, real=True)'},
+ 'functions': [],
+ 'christoffel': {(0, 0, 1): '-(p1**2 + x1**2)*(p0*p1**2*cos(x2)**2 - p0*x1**2 + '
+                            'p2**2*x1)/((p1**2*cos(x2)**2 + x1**2)*(2*p0*p1**2*x1*sin(x2)**2 - '
+                            '2*p0*p1**2*x1 - 2*p0*x1**3 + p1**4*cos(x2)**2 - '
+                            'p1**2*p2**2*sin(x2)**2 + p1**2*p2**2 + p1**2*x1**2*cos(x2)**2 + '
+                            'p1**2*x1**2 + p2**2*x1**2 + x1**4))',
+                 (0, 0, 2): 'p1**2*(-2*p0*x1 + p2**2)*(-2*p0*x1 + p1**2 + p2**2 + '
+                            'x1**2)*sin(x2)*cos(x2)/((p1**2*cos(x2)**2 + '
+                            'x1**2)*(2*p0*p1**2*x1*sin(x2)**2 - 2*p0*p1**2*x1 - 2*p0*x1**3 + '
+                            'p1**4*cos(x2)**2 - p1**2*p2**2*sin(x2)**2 + p1**2*p2**2 + '
+                            'p1**2*x1**2*cos(x2)**2 + p1**2*x1**2 + p2**2*x1**2 + x1**4))',
+                 (0, 1, 3): 'p1*(p0*p1**4*cos(x2)**2 - p0*p1**2*x1**2*cos(x2)**2 - p0*p1**2*x1**2 '
+                            '- 3*p0*x1**4 + p1**2*p2**2*x1*cos(x2)**2 + p1**2*p2**2*x1 + '
+                            '2*p2**2*x1**3)*sin(x2)**2/((p1**2*cos(x2)**2 + '
+                            'x1**2)*(2*p0*p1**2*x1*sin(x2)**2 - 2*p0*p1**2*x1 - 2*p0*x1**3 + '
+                            'p1**4*cos(x2)**2 - p1**2*p2**2*sin(x2)**2 + p1**2*p2**2 + '
+                            'p1**2*x1**2*cos(x2)**2 + p1**2*x1**2 + p2**2*x1**2 + x1**4))',
+                 (0, 2, 3): '-p1**3*(-2*p0*x1 + p2**2)*(-2*p0*x1 + p1**2 + p2**2 + '
+                            'x1**2)*sin(x2)**3*cos(x2)/((p1**2*cos(x2)**2 + '
+                            'x1**2)*(2*p0*p1**2*x1*sin(x2)**2 - 2*p0*p1**2*x1 - 2*p0*x1**3 + '
+                            'p1**4*cos(x2)**2 - p1**2*p2**2*sin(x2)**2 + p1**2*p2**2 + '
+                            'p1**2*x1**2*cos(x2)**2 + p1**2*x1**2 + p2**2*x1**2 + x1**4))',
+                 (1, 0, 0): '-(p0*p1**2*cos(x2)**2 - p0*x1**2 + p2**2*x1)*(-2*p0*x1 + p1**2 + '
+                            'p2**2 + x1**2)/(p1**2*cos(x2)**2 + x1**2)**3',
+                 (1, 0, 3): 'p1*(p0*p1**2*cos(x2)**2 - p0*x1**2 + p2**2*x1)*(-2*p0*x1 + p1**2 + '
+                            'p2**2 + x1**2)*sin(x2)**2/(p1**2*cos(x2)**2 + x1**2)**3',
+                 (1, 1, 1): '(p0*p1**2*cos(x2)**2 - p0*x1**2 - p1**2*x1*cos(x2)**2 + p1**2*x1 + '
+                            'p2**2*x1)/((p1**2*cos(x2)**2 + x1**2)*(-2*p0*x1 + p1**2 + p2**2 + '
+                            'x1**2))',
+                 (1, 1, 2): '-p1**2*sin(x2)*cos(x2)/(p1**2*cos(x2)**2 + x1**2)',
+                 (1, 2, 2): '-x1*(-2*p0*x1 + p1**2 + p2**2 + x1**2)/(p1**2*cos(x2)**2 + x1**2)',
+                 (1, 3, 3): '-(-2*p0*x1 + p1**2 + p2**2 + x1**2)*(p0*p1**4*sin(x2)**2*cos(x2)**2 - '
+                            'p0*p1**2*x1**2*sin(x2)**2 + p1**4*x1*cos(x2)**4 + '
+                            'p1**2*p2**2*x1*sin(x2)**2 + 2*p1**2*x1**3*cos(x2)**2 + '
+                            'x1**5)*sin(x2)**2/(p1**2*cos(x2)**2 + x1**2)**3',
+                 (2, 0, 0): 'p1**2*(-2*p0*x1 + p2**2)*sin(x2)*cos(x2)/(p1**2*cos(x2)**2 + '
+                            'x1**2)**3',
+                 (2, 0, 3): '-p1*(-2*p0*x1 + p2**2)*(p1**2*sin(x2)**2 + p1**2*cos(x2)**2 + '
+                            'x1**2)*sin(x2)*cos(x2)/(p1**2*cos(x2)**2 + x1**2)**3',
+                 (2, 1, 1): 'p1**2*sin(x2)*cos(x2)/((p1**2*cos(x2)**2 + x1**2)*(-2*p0*x1 + p1**2 + '
+                            'p2**2 + x1**2))',
+                 (2, 1, 2): 'x1/(p1**2*cos(x2)**2 + x1**2)',
+                 (2, 2, 2): '-p1**2*sin(x2)*cos(x2)/(p1**2*cos(x2)**2 + x1**2)',
+                 (2, 3, 3): '(-2*p0*p1**4*x1*sin(x2)**4 - 4*p0*p1**4*x1*sin(x2)**2*cos(x2)**2 - '
+                            '4*p0*p1**2*x1**3*sin(x2)**2 - p1**6*cos(x2)**4 + '
+                            'p1**4*p2**2*sin(x2)**4 + 2*p1**4*p2**2*sin(x2)**2*cos(x2)**2 - '
+                            'p1**4*x1**2*cos(x2)**4 - 2*p1**4*x1**2*cos(x2)**2 + '
+                            '2*p1**2*p2**2*x1**2*sin(x2)**2 - 2*p1**2*x1**4*cos(x2)**2 - '
+                            'p1**2*x1**4 - x1**6)*sin(x2)*cos(x2)/(p1**2*cos(x2)**2 + x1**2)**3',
+                 (3, 0, 1): '-p1*(p0*p1**2*cos(x2)**2 - p0*x1**2 + p2**2*x1)/((p1**2*cos(x2)**2 + '
+                            'x1**2)*(2*p0*p1**2*x1*sin(x2)**2 - 2*p0*p1**2*x1 - 2*p0*x1**3 + '
+                            'p1**4*cos(x2)**2 - p1**2*p2**2*sin(x2)**2 + p1**2*p2**2 + '
+                            'p1**2*x1**2*cos(x2)**2 + p1**2*x1**2 + p2**2*x1**2 + x1**4))',
+                 (3, 0, 2): 'p1*(-2*p0*x1 + p2**2)*(-2*p0*x1 + p1**2*sin(x2)**2 + p1**2*cos(x2)**2 '
+                            '+ p2**2 + x1**2)*cos(x2)/((p1**2*cos(x2)**2 + '
+                            'x1**2)*(2*p0*p1**2*x1*sin(x2)**2 - 2*p0*p1**2*x1 - 2*p0*x1**3 + '
+                            'p1**4*cos(x2)**2 - p1**2*p2**2*sin(x2)**2 + p1**2*p2**2 + '
+                            'p1**2*x1**2*cos(x2)**2 + p1**2*x1**2 + p2**2*x1**2 + x1**4)*sin(x2))',
+                 (3, 1, 3): '(p0*p1**4*sin(x2)**2*cos(x2)**2 - p0*p1**2*x1**2*sin(x2)**2 - '
+                            '2*p0*p1**2*x1**2*cos(x2)**2 - 2*p0*x1**4 + p1**4*x1*cos(x2)**4 + '
+                            'p1**2*p2**2*x1*sin(x2)**2 + p1**2*p2**2*x1*cos(x2)**2 + '
+                            '2*p1**2*x1**3*cos(x2)**2 + p2**2*x1**3 + x1**5)/((p1**2*cos(x2)**2 + '
+                            'x1**2)*(2*p0*p1**2*x1*sin(x2)**2 - 2*p0*p1**2*x1 - 2*p0*x1**3 + '
+                            'p1**4*cos(x2)**2 - p1**2*p2**2*sin(x2)**2 + p1**2*p2**2 + '
+                            'p1**2*x1**2*cos(x2)**2 + p1**2*x1**2 + p2**2*x1**2 + x1**4))',
+                 (3, 2, 3): '-(4*p0**2*p1**2*x1**2*sin(x2)**2 - 2*p0*p1**4*x1*sin(x2)**4 - '
+                            '4*p0*p1**4*x1*sin(x2)**2*cos(x2)**2 + 2*p0*p1**4*x1*cos(x2)**2 - '
+                            '4*p0*p1**2*p2**2*x1*sin(x2)**2 - 4*p0*p1**2*x1**3*sin(x2)**2 + '
+                            '2*p0*p1**2*x1**3*cos(x2)**2 + 2*p0*p1**2*x1**3 + 2*p0*x1**5 - '
+                            'p1**6*cos(x2)**4 + p1**4*p2**2*sin(x2)**4 + '
+                            '2*p1**4*p2**2*sin(x2)**2*cos(x2)**2 - p1**4*p2**2*cos(x2)**2 - '
+                            'p1**4*x1**2*cos(x2)**4 - 2*p1**4*x1**2*cos(x2)**2 + '
+                            'p1**2*p2**4*sin(x2)**2 + 2*p1**2*p2**2*x1**2*sin(x2)**2 - '
+                            'p1**2*p2**2*x1**2*cos(x2)**2 - p1**2*p2**2*x1**2 - '
+                            '2*p1**2*x1**4*cos(x2)**2 - p1**2*x1**4 - p2**2*x1**4 - '
+                            'x1**6)*cos(x2)/((p1**2*cos(x2)**2 + x1**2)*(2*p0*p1**2*x1*sin(x2)**2 '
+                            '- 2*p0*p1**2*x1 - 2*p0*x1**3 + p1**4*cos(x2)**2 - '
+                            'p1**2*p2**2*sin(x2)**2 + p1**2*p2**2 + p1**2*x1**2*cos(x2)**2 + '
+                            'p1**2*x1**2 + p2**2*x1**2 + x1**4)*sin(x2))'},
+ 'invariants': {'kretschmann': '(-48*p0**2*p1**6*cos(x2)**6 + 720*p0**2*p1**4*x1**2*cos(x2)**4 - '
+                               '720*p0**2*p1**2*x1**4*cos(x2)**2 + 48*p0**2*x1**6 - '
+                               '480*p0*p1**4*p2**2*x1*cos(x2)**4 + '
+                               '960*p0*p1**2*p2**2*x1**3*cos(x2)**2 - 96*p0*p2**2*x1**5 + '
+                               '56*p1**4*p2**4*cos(x2)**4 - 272*p1**2*p2**4*x1**2*cos(x2)**2 + '
+                               '56*p2**4*x1**4)/(p1**12*cos(x2)**12 + 6*p1**10*x1**2*cos(x2)**10 + '
+                               '15*p1**8*x1**4*cos(x2)**8 + 20*p1**6*x1**6*cos(x2)**6 + '
+                               '15*p1**4*x1**8*cos(x2)**4 + 6*p1**2*x1**10*cos(x2)**2 + x1**12)',
+                'euler': '(-48*p0**2*p1**6*cos(x2)**6 + 720*p0**2*p1**4*x1**2*cos(x2)**4 - '
+                         '720*p0**2*p1**2*x1**4*cos(x2)**2 + 48*p0**2*x1**6 - '
+                         '480*p0*p1**4*p2**2*x1*cos(x2)**4 + 960*p0*p1**2*p2**2*x1**3*cos(x2)**2 - '
+                         '96*p0*p2**2*x1**5 + 40*p1**4*p2**4*cos(x2)**4 - '
+                         '304*p1**2*p2**4*x1**2*cos(x2)**2 + 40*p2**4*x1**4)/(p1**12*cos(x2)**12 + '
+                         '6*p1**10*x1**2*cos(x2)**10 + 15*p1**8*x1**4*cos(x2)**8 + '
+                         '20*p1**6*x1**6*cos(x2)**6 + 15*p1**4*x1**8*cos(x2)**4 + '
+                         '6*p1**2*x1**10*cos(x2)**2 + x1**12)'}}
+
+# flrw_flat
+SPACETIMES['e08230e38844c622b04435cee617ce0fbdd9b36b0c850bc17e1488dc6cd2d429'] = {'name': 'flrw_flat',
+ 'symbols': {'x0': "Symbol('x0', commutative=True)",
+             'x1': "Symbol('x1', commutative=True)",
+             'x2': "Symbol('x2', commutative=True)",
+             'x3': "Symbol('x3', commutative=True)"},
+ 'functions': ['p0'],
+ 'christoffel': {(0, 1, 1): 'p0(x0)*Derivative(p0(x0), x0)',
+                 (0, 2, 2): 'x1**2*p0(x0)*Derivative(p0(x0), x0)',
+                 (0, 3, 3): 'x1**2*p0(x0)*sin(x2)**2*Derivative(p0(x0), x0)',
+                 (1, 0, 1): 'Derivative(p0(x0), x0)/p0(x0)',
+                 (1, 2, 2): '-x1',
+                 (1, 3, 3): '-x1*sin(x2)**2',
+                 (2, 0, 2): 'Derivative(p0(x0), x0)/p0(x0)',
+                 (2, 1, 2): '1/x1',
+                 (2, 3, 3): '-sin(x2)*cos(x2)',
+                 (3, 0, 3): 'Derivative(p0(x0), x0)/p0(x0)',
+                 (3, 1, 3): '1/x1',
+                 (3, 2, 3): 'cos(x2)/sin(x2)'},
+ 'invariants': {'kretschmann': '(12*p0(x0)**2*Derivative(p0(x0), (x0, 2))**2 + '
+                               '12*Derivative(p0(x0), x0)**4)/p0(x0)**4',
+                'euler': '24*Derivative(p0(x0), x0)**2*Derivative(p0(x0), (x0, 2))/p0(x0)**3',
+                'chern_pontryagin': '0'}}
+
+# flrw_closed
+SPACETIMES['99b6dca24ef5b862aa63f17c6bfa7e967dbf261a658e67f3aa89f86e97c805db'] = {'name': 'flrw_closed',
+ 'symbols': {'x0': "Symbol('x0', commutative=True)",
+             'x1': "Symbol('x1', commutative=True)",
+             'x2': "Symbol('x2', commutative=True)",
+             'x3': "Symbol('x3', commutative=True)"},
+ 'functions': ['p0'],
+ 'christoffel': {(0, 1, 1): '-p0(x0)*Derivative(p0(x0), x0)/((x1 - 1)*(x1 + 1))',
+                 (0, 2, 2): 'x1**2*p0(x0)*Derivative(p0(x0), x0)',
+                 (0, 3, 3): 'x1**2*p0(x0)*sin(x2)**2*Derivative(p0(x0), x0)',
+                 (1, 0, 1): 'Derivative(p0(x0), x0)/p0(x0)',
+                 (1, 1, 1): '-x1/((x1 - 1)*(x1 + 1))',
+                 (1, 2, 2): 'x1*(x1 - 1)*(x1 + 1)',
+                 (1, 3, 3): 'x1*(x1 - 1)*(x1 + 1)*sin(x2)**2',
+                 (2, 0, 2): 'Derivative(p0(x0), x0)/p0(x0)',
+                 (2, 1, 2): '1/x1',
+                 (2, 3, 3): '-sin(x2)*cos(x2)',
+                 (3, 0, 3): 'Derivative(p0(x0), x0)/p0(x0)',
+                 (3, 1, 3): '1/x1',
+                 (3, 2, 3): 'cos(x2)/sin(x2)'},
+ 'invariants': {'kretschmann': '(12*p0(x0)**2*Derivative(p0(x0), (x0, 2))**2 + '
+                               '12*Derivative(p0(x0), x0)**4 + 24*Derivative(p0(x0), x0)**2 + '
+                               '12)/p0(x0)**4',
+                'euler': '(24*Derivative(p0(x0), x0)**2*Derivative(p0(x0), (x0, 2)) + '
+                         '24*Derivative(p0(x0), (x0, 2)))/p0(x0)**3',
+                'chern_pontryagin': '0'}}
+
+# flrw_open
+SPACETIMES['cb6e4121e11d92c5263cd39e5d9b6838ec0c04c0fdee17d505671b76056f158c'] = {'name': 'flrw_open',
+ 'symbols': {'x0': "Symbol('x0', commutative=True)",
+             'x1': "Symbol('x1', commutative=True)",
+             'x2': "Symbol('x2', commutative=True)",
+             'x3': "Symbol('x3', commutative=True)"},
+ 'functions': ['p0'],
+ 'christoffel': {(0, 1, 1): 'p0(x0)*Derivative(p0(x0), x0)/(x1**2 + 1)',
+                 (0, 2, 2): 'x1**2*p0(x0)*Derivative(p0(x0), x0)',
+                 (0, 3, 3): 'x1**2*p0(x0)*sin(x2)**2*Derivative(p0(x0), x0)',
+                 (1, 0, 1): 'Derivative(p0(x0), x0)/p0(x0)',
+                 (1, 1, 1): '-x1/(x1**2 + 1)',
+                 (1, 2, 2): '-x1*(x1**2 + 1)',
+                 (1, 3, 3): '-x1*(x1**2 + 1)*sin(x2)**2',
+                 (2, 0, 2): 'Derivative(p0(x0), x0)/p0(x0)',
+                 (2, 1, 2): '1/x1',
+                 (2, 3, 3): '-sin(x2)*cos(x2)',
+                 (3, 0, 3): 'Derivative(p0(x0), x0)/p0(x0)',
+                 (3, 1, 3): '1/x1',
+                 (3, 2, 3): 'cos(x2)/sin(x2)'},
+ 'invariants': {'kretschmann': '(12*p0(x0)**2*Derivative(p0(x0), (x0, 2))**2 + '
+                               '12*Derivative(p0(x0), x0)**4 - 24*Derivative(p0(x0), x0)**2 + '
+                               '12)/p0(x0)**4',
+                'euler': '(24*Derivative(p0(x0), x0)**2*Derivative(p0(x0), (x0, 2)) - '
+                         '24*Derivative(p0(x0), (x0, 2)))/p0(x0)**3',
+                'chern_pontryagin': '0'}}
+
+# de_sitter
+SPACETIMES['36cbe58479e9a3e425e5ebcf5ef296c6900ee96cf0fd78b3af6f0c55c6cec2c1'] = {'name': 'de_sitter',
+ 'symbols': {'x0': "Symbol('x0', commutative=True)",
+             'x1': "Symbol('x1', commutative=True)",
+             'x2': "Symbol('x2', commutative=True)",
+             'x3': "Symbol('x3', commutative=True)",
+             'p0': "Symbol('p0', commutative=True, complex=True, extended_negative=False, "
+                   'extended_nonnegative=True, extended_nonpositive=False, extended_nonzero=True, '
+                   'extended_positive=True, extended_real=True, finite=True, hermitian=True, '
+                   'imaginary=False, infinite=False, negative=False, nonnegative=True, '
+                   'nonpositive=False, nonzero=True, positive=True, real=True, zero=False)'},
+ 'functions': [],
+ 'christoffel': {(0, 0, 1): 'p0**2*x1/((p0*x1 - 1)*(p0*x1 + 1))',
+                 (1, 0, 0): 'p0**2*x1*(p0*x1 - 1)*(p0*x1 + 1)',
+                 (1, 1, 1): '-p0**2*x1/((p0*x1 - 1)*(p0*x1 + 1))',
+                 (1, 2, 2): 'x1*(p0*x1 - 1)*(p0*x1 + 1)',
+                 (1, 3, 3): 'x1*(p0*x1 - 1)*(p0*x1 + 1)*sin(x2)**2',
+                 (2, 1, 2): '1/x1',
+                 (2, 3, 3): '-sin(x2)*cos(x2)',
+                 (3, 1, 3): '1/x1',
+                 (3, 2, 3): 'cos(x2)/sin(x2)'},
+ 'invariants': {'kretschmann': '24*p0**4', 'euler': '24*p0**4', 'chern_pontryagin': '0'}}
+
+# anti_de_sitter
+SPACETIMES['28973f875c9b10bc6414cb7d6728cfe45fe147222947a3871ae3a664e92bcdb0'] = {'name': 'anti_de_sitter',
+ 'symbols': {'x0': "Symbol('x0', commutative=True)",
+             'x1': "Symbol('x1', commutative=True)",
+             'x2': "Symbol('x2', commutative=True)",
+             'x3': "Symbol('x3', commutative=True)",
+             'p0': "Symbol('p0', commutative=True, complex=True, extended_negative=False, "
+                   'extended_nonnegative=True, extended_nonpositive=False, extended_nonzero=True, '
+                   'extended_positive=True, extended_real=True, finite=True, hermitian=True, '
+                   'imaginary=False, infinite=False, negative=False, nonnegative=True, '
+                   'nonpositive=False, nonzero=True, positive=True, real=True, zero=False)'},
+ 'functions': [],
+ 'christoffel': {(0, 0, 1): 'x1/(p0**2 + x1**2)',
+                 (1, 0, 0): 'x1*(p0**2 + x1**2)/p0**4',
+                 (1, 1, 1): '-x1/(p0**2 + x1**2)',
+                 (1, 2, 2): '-x1*(p0**2 + x1**2)/p0**2',
+                 (1, 3, 3): '-x1*(p0**2 + x1**2)*sin(x2)**2/p0**2',
+                 (2, 1, 2): '1/x1',
+                 (2, 3, 3): '-sin(x2)*cos(x2)',
+                 (3, 1, 3): '1/x1',
+                 (3, 2, 3): 'cos(x2)/sin(x2)'},
+ 'invariants': {'kretschmann': '24/p0**4', 'euler': '24/p0**4', 'chern_pontryagin': '0'}}
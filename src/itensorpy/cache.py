@@ -0,0 +1,195 @@
+"""
+Persistent on - disk cache of derived tensors.
+
+Derived tensors (Christoffel symbols, Riemann, Ricci and Einstein tensors) are
+stored under the canonical fingerprint of the metric they were computed from, so
+a later job working with the same spacetime can reload them instead of
+recomputing. The cache is disabled unless enabled explicitly with
+``enable_disk_cache`` or through the ``ITENSORPY_CACHE_DIR`` environment variable.
+"""
+
+import os
+import pickle
+import hashlib
+import tempfile
+from typing import Any, Optional
+
+from .metric import Metric
+
+
+# Default upper bound on the total size of the cache directory (512 MiB)
+DEFAULT_MAX_SIZE = 512 * 1024 * 1024
+
+# Bump when the layout of stored tensor data changes
+CACHE_FORMAT_VERSION = 1
+
+_disk_cache = None
+_configured = False
+
+
+class TensorCache:
+    """
+    A directory of pickled tensor components keyed by metric fingerprint.
+
+    When the total size of the stored files exceeds ``max_size`` the least
+    recently used entries are evicted.
+    """
+
+    def __init__(self, directory: Optional[str] = None, max_size: int = DEFAULT_MAX_SIZE):
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Cache directory; defaults to ~/.cache/itensorpy
+            max_size: Maximum total size of the cache in bytes
+        """
+        if max_size <= 0:
+            raise ValueError("Cache size must be a positive number of bytes")
+
+        self.directory = directory or os.path.join(os.path.expanduser("~"), ".cache", "itensorpy")
+        self.max_size = max_size
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, metric: Metric, kind: str) -> str:
+        """
+        Get the file path of an entry.
+
+        Args:
+            metric: Metric the tensor was derived from
+            kind: Name of the derived tensor, including options that change its value
+
+        Returns:
+            Path of the cache file
+        """
+        from . import __version__
+
+        key = f"{metric.fingerprint}:{kind}:{__version__}:{CACHE_FORMAT_VERSION}"
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.pkl")
+
+    def load(self, metric: Metric, kind: str) -> Optional[Any]:
+        """
+        Load a derived tensor from the cache.
+
+        Args:
+            metric: Metric the tensor was derived from
+            kind: Name of the derived tensor
+
+        Returns:
+            The stored data, or None if the entry is missing or unreadable
+        """
+        path = self._path(metric, kind)
+        try:
+            with open(path, "rb") as file:
+                data = pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+
+        # Mark the entry as recently used for eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        return data
+
+    def store(self, metric: Metric, kind: str, data: Any) -> None:
+        """
+        Store a derived tensor in the cache and evict old entries if needed.
+
+        Args:
+            metric: Metric the tensor was derived from
+            kind: Name of the derived tensor
+            data: Picklable tensor components
+        """
+        path = self._path(metric, kind)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        self._evict()
+
+    def _evict(self) -> None:
+        """Remove the least recently used entries until the cache fits in max_size."""
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".pkl"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+    def size(self) -> int:
+        """
+        Get the total size of the stored entries.
+
+        Returns:
+            Size in bytes
+        """
+        return sum(os.path.getsize(os.path.join(self.directory, name))
+                   for name in os.listdir(self.directory) if name.endswith(".pkl"))
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        for name in os.listdir(self.directory):
+            if name.endswith(".pkl"):
+                os.remove(os.path.join(self.directory, name))
+
+
+def enable_disk_cache(directory: Optional[str] = None, max_size: int = DEFAULT_MAX_SIZE) -> TensorCache:
+    """
+    Enable the on - disk cache used by the ``from_metric`` constructors.
+
+    Args:
+        directory: Cache directory; defaults to ~/.cache/itensorpy
+        max_size: Maximum total size of the cache in bytes
+
+    Returns:
+        The active TensorCache
+    """
+    global _disk_cache, _configured
+    _disk_cache = TensorCache(directory, max_size)
+    _configured = True
+    return _disk_cache
+
+
+def disable_disk_cache() -> None:
+    """Disable the on - disk cache, including one configured by ITENSORPY_CACHE_DIR."""
+    global _disk_cache, _configured
+    _disk_cache = None
+    _configured = True
+
+
+def get_disk_cache() -> Optional[TensorCache]:
+    """
+    Get the active on - disk cache.
+
+    If the cache was neither enabled nor disabled explicitly but the
+    ``ITENSORPY_CACHE_DIR`` environment variable is set, a cache in that
+    directory is enabled.
+
+    Returns:
+        The active TensorCache, or None if caching is disabled
+    """
+    if not _configured and os.environ.get("ITENSORPY_CACHE_DIR"):
+        return enable_disk_cache(os.environ["ITENSORPY_CACHE_DIR"])
+    return _disk_cache
@@ -0,0 +1,467 @@
+"""
+Curvature in an orthonormal frame from Cartan's structure equations.
+
+With an orthonormal coframe e^a = E^a_μ dx^μ (g = η_ab e^a e^b) the connection
+one - forms ω^a_b and the curvature two - forms Ω^a_b follow from
+
+    de^a = -ω^a_b ∧ e^b,        Ω^a_b = dω^a_b + ω^a_c ∧ ω^c_b = (1/2) R^a_bcd e^c ∧ e^d
+
+For diagonal and block - diagonal metrics the coframe is sparse, so the frame
+components need far fewer terms than the coordinate route through the
+Christoffel symbols. Frame components convert back to coordinate components by
+contracting with the coframe.
+"""
+
+import functools
+import itertools
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import sympy as sp
+from sympy import Matrix
+
+from .metric import Metric
+from .riemann import RiemannTensor
+from .ricci import RicciTensor
+from .einstein import EinsteinTensor
+from .utils import get_intermediate_simplify_level, numeric_zero_test, simplify_components
+
+
+def _positive_sqrt(expr: sp.Expr) -> sp.Expr:
+    """
+    Take the square root of an expression that is positive in the usual region.
+
+    Even powers of factors are taken out of the root, assuming the factors are
+    positive there (r, sin θ, a(t), ...). Odd factors get a root each, so the roots
+    in the coframe, the frame and their derivatives share the same bases and cancel
+    against each other.
+
+    Args:
+        expr: SymPy expression
+
+    Returns:
+        The square root of the expression
+    """
+    numerator, denominator = sp.fraction(sp.factor(expr))
+
+    num_coefficient, num_factors = sp.factor_list(numerator)
+    den_coefficient, den_factors = sp.factor_list(denominator)
+    coefficient = num_coefficient / den_coefficient
+
+    result = sp.S.One
+    odd = []
+    for factors, sign in ((num_factors, 1), (den_factors, -1)):
+        for base, power in factors:
+            result *= base**(sign * (power // 2))
+            if power % 2:
+                odd.append([base, sign])
+
+    # A negative coefficient is absorbed by flipping the sign of an odd factor
+    if coefficient < 0 and odd:
+        odd[0][0] = -odd[0][0]
+        coefficient = -coefficient
+
+    result *= sp.sqrt(coefficient)
+    for base, sign in odd:
+        result *= sp.sqrt(base)**sign
+    return result
+
+
+class CartanCurvature:
+    """
+    Curvature of a metric in an orthonormal frame, computed with Cartan's method.
+
+    The default coframe comes from ``Metric.frame_decomposition``. For stationary
+    metrics an adapted coframe (e.g. Carter's frame for Kerr) gives much smaller
+    expressions than the default one and should be passed explicitly.
+
+    Attributes:
+        metric: The Metric the curvature belongs to
+        coframe: Matrix E with rows e^a = E^a_μ dx^μ
+        frame: Matrix F = E^-1 with columns e_a = F^μ_a ∂_μ
+        eta: Diagonal of the frame metric, e.g. (-1, 1, 1, 1)
+    """
+
+    def __init__(self, metric: Metric, coframe=None, signature: Optional[Sequence[int]] = None,
+                 simplify_level: Optional[int] = None, workers: Optional[int] = None):
+        """
+        Initialize the frame and check that it is orthonormal.
+
+        Args:
+            metric: Metric tensor instance
+            coframe: Optional n x n matrix whose rows are the one - forms e^a; built from
+                     ``Metric.frame_decomposition`` if not provided
+            signature: Diagonal of the frame metric η; defaults to ``Metric.signature``
+            simplify_level: Level of simplification to apply (0 - 3); defaults to the
+                            metric's simplify_level
+            workers: Number of processes used to simplify components (None uses the global default)
+
+        Raises:
+            ValueError: If the coframe is not orthonormal for the metric
+        """
+        self.metric = metric
+        self.workers = workers
+        if simplify_level is None:
+            simplify_level = metric.simplify_level
+        self.simplify_level = simplify_level
+        self.eta = tuple(signature) if signature is not None else metric.signature
+
+        n = metric.dimension
+        if coframe is None:
+            rows = []
+            for a, (pivot, row) in enumerate(metric.frame_decomposition):
+                scale = _positive_sqrt(self.eta[a] * pivot)
+                rows.append([scale * value for value in row])
+            self.coframe = Matrix(rows)
+            self.frame = self._invert_by_blocks(self.coframe)
+        else:
+            self.coframe = Matrix(coframe)
+            if self.coframe.shape != (n, n) or len(self.eta) != n:
+                raise ValueError("Coframe must be an n x n matrix with an n - component signature")
+            for i in range(n):
+                for j in range(i, n):
+                    value = sum(self.eta[a] * self.coframe[a, i] * self.coframe[a, j]
+                                for a in range(n))
+                    if numeric_zero_test(value - metric.g[i, j]) is False:
+                        raise ValueError("Coframe is not orthonormal for the metric")
+            self.frame = self._invert_by_blocks(self.coframe)
+
+    def _invert_by_blocks(self, coframe: Matrix) -> Matrix:
+        """
+        Invert a coframe, block by block if it shares the block structure of the metric.
+
+        Args:
+            coframe: The coframe matrix
+
+        Returns:
+            The inverse matrix
+        """
+        n = self.metric.dimension
+        blocks = self.metric.blocks
+        block_of = {i: block for block in blocks for i in block}
+        if any(coframe[a, mu] != 0 and block_of[a] is not block_of[mu]
+               for a in range(n) for mu in range(n)):
+            return coframe.inv()
+
+        frame = sp.zeros(n, n)
+        for block in blocks:
+            block_inv = Metric._invert_block(coframe.extract(list(block), list(block)))
+            for a, i in enumerate(block):
+                for b, j in enumerate(block):
+                    frame[i, j] = sp.cancel(block_inv[a, b])
+        return frame
+
+    @property
+    def _intermediate_level(self) -> int:
+        return min(get_intermediate_simplify_level(), self.simplify_level)
+
+    def _frame_derivative(self, expr: sp.Expr, a: int) -> sp.Expr:
+        """
+        Apply the frame vector e_a = F^μ_a ∂_μ to a function.
+
+        Args:
+            expr: SymPy expression
+            a: Frame index
+
+        Returns:
+            The directional derivative e_a(expr)
+        """
+        result = sp.S.Zero
+        for mu, coord in enumerate(self.metric.coordinates):
+            if self.frame[mu, a] != 0 and coord in expr.free_symbols:
+                result += self.frame[mu, a] * sp.diff(expr, coord)
+        return result
+
+    @functools.cached_property
+    def structure_coefficients(self) -> List[List[List[sp.Expr]]]:
+        """
+        Get the structure coefficients of the frame.
+
+        de^a = (1/2) C^a_bc e^b ∧ e^c with C^a_bc = F^μ_b F^ν_c (∂_μ E^a_ν - ∂_ν E^a_μ)
+
+        Returns:
+            A 3D array C[a][b][c], antisymmetric in b and c
+        """
+        n = self.metric.dimension
+        x = self.metric.coordinates
+        E, F = self.coframe, self.frame
+
+        raw = {}
+        for a in range(n):
+            # (de^a)_μν = ∂_μ E^a_ν - ∂_ν E^a_μ, kept for μ < ν only
+            dE = {}
+            for mu, nu in itertools.combinations(range(n), 2):
+                value = sp.diff(E[a, nu], x[mu]) - sp.diff(E[a, mu], x[nu])
+                if value != 0:
+                    dE[(mu, nu)] = value
+            if not dE:
+                continue
+
+            for b, c in itertools.combinations(range(n), 2):
+                value = sp.S.Zero
+                for (mu, nu), form in dE.items():
+                    value += (F[mu, b] * F[nu, c] - F[nu, b] * F[mu, c]) * form
+                if value != 0:
+                    raw[(a, b, c)] = value
+
+        C = [[[sp.S.Zero for _ in range(n)] for _ in range(n)] for _ in range(n)]
+        keys = list(raw)
+        values = simplify_components((raw[key] for key in keys), self._intermediate_level,
+                                     self.workers)
+        for (a, b, c), value in zip(keys, values):
+            C[a][b][c] = value
+            C[a][c][b] = -value
+
+        return C
+
+    @functools.cached_property
+    def connection(self) -> List[List[List[sp.Expr]]]:
+        """
+        Get the connection one - forms ω^a_b = ω^a_bc e^c.
+
+        Solving de^a = -ω^a_b ∧ e^b with ω_ab = -ω_ba gives
+        ω_abc = (1/2) (C_abc + C_bca - C_cab), where C_abc = η_aa C^a_bc.
+
+        Returns:
+            A 3D array omega[a][b][c] = ω^a_bc
+        """
+        n = self.metric.dimension
+        eta = self.eta
+        C = self.structure_coefficients
+
+        def lowered(a, b, c):
+            return eta[a] * C[a][b][c]
+
+        raw = {}
+        for a, b, c in itertools.product(range(n), repeat=3):
+            if a == b:
+                continue
+            value = (lowered(a, b, c) + lowered(b, c, a) - lowered(c, a, b)) / 2
+            if value != 0:
+                raw[(a, b, c)] = eta[a] * value
+
+        omega = [[[sp.S.Zero for _ in range(n)] for _ in range(n)] for _ in range(n)]
+        keys = list(raw)
+        values = simplify_components((raw[key] for key in keys), self._intermediate_level,
+                                     self.workers)
+        for (a, b, c), value in zip(keys, values):
+            omega[a][b][c] = value
+
+        return omega
+
+    @functools.cached_property
+    def riemann_frame(self) -> List[List[List[List[sp.Expr]]]]:
+        """
+        Get the frame components R_abcd of the Riemann tensor.
+
+        From the second structure equation:
+        R^a_bcd = e_c(ω^a_bd) - e_d(ω^a_bc) + ω^a_be C^e_cd + ω^a_ec ω^e_bd - ω^a_ed ω^e_bc
+
+        Only the components with a < b, c < d and (a, b) <= (c, d) are computed; the
+        rest follow from the pair and antisymmetry relations.
+
+        Returns:
+            A 4D array R[a][b][c][d] with all frame indices down
+        """
+        n = self.metric.dimension
+        eta = self.eta
+        omega = self.connection
+        C = self.structure_coefficients
+
+        pairs = list(itertools.combinations(range(n), 2))
+        raw = {}
+        for i, (a, b) in enumerate(pairs):
+            for c, d in pairs[i:]:
+                value = self._frame_derivative(omega[a][b][d], c)
+                value -= self._frame_derivative(omega[a][b][c], d)
+                for e in range(n):
+                    value += omega[a][b][e] * C[e][c][d]
+                    value += omega[a][e][c] * omega[e][b][d] - omega[a][e][d] * omega[e][b][c]
+                if value != 0:
+                    raw[(a, b, c, d)] = eta[a] * value
+
+        R = [[[[sp.S.Zero for _ in range(n)] for _ in range(n)] for _ in range(n)]
+             for _ in range(n)]
+        keys = list(raw)
+        values = simplify_components((raw[key] for key in keys), self.simplify_level, self.workers)
+        for (a, b, c, d), value in zip(keys, values):
+            for (p, q), sign_pq in (((a, b), 1), ((b, a), -1)):
+                for (r, s), sign_rs in (((c, d), 1), ((d, c), -1)):
+                    R[p][q][r][s] = sign_pq * sign_rs * value
+                    R[r][s][p][q] = sign_pq * sign_rs * value
+
+        return R
+
+    @functools.cached_property
+    def ricci_frame(self) -> Matrix:
+        """
+        Get the frame components R_bd = η^ac R_abcd of the Ricci tensor.
+
+        Returns:
+            SymPy Matrix of frame components
+        """
+        n = self.metric.dimension
+        R = self.riemann_frame
+
+        indices = [(b, d) for b in range(n) for d in range(b, n)]
+        raw = [sum(self.eta[a] * R[a][b][a][d] for a in range(n)) for b, d in indices]
+
+        ricci = sp.zeros(n, n)
+        values = simplify_components(raw, self.simplify_level, self.workers)
+        for (b, d), value in zip(indices, values):
+            ricci[b, d] = value
+            ricci[d, b] = value
+        return ricci
+
+    @functools.cached_property
+    def ricci_scalar(self) -> sp.Expr:
+        """
+        Get the Ricci scalar R = η^ab R_ab.
+
+        Returns:
+            SymPy expression
+        """
+        value = sum(self.eta[a] * self.ricci_frame[a, a] for a in range(self.metric.dimension))
+        return simplify_components([value], self.simplify_level, self.workers)[0]
+
+    @functools.cached_property
+    def einstein_frame(self) -> Matrix:
+        """
+        Get the frame components G_ab = R_ab - (1/2) η_ab R of the Einstein tensor.
+
+        Returns:
+            SymPy Matrix of frame components
+        """
+        n = self.metric.dimension
+        einstein = self.ricci_frame.copy()
+        for a in range(n):
+            einstein[a, a] = einstein[a, a] - sp.Rational(1, 2) * self.eta[a] * self.ricci_scalar
+        return einstein.applyfunc(lambda value: simplify_components([value], self.simplify_level,
+                                                                    self.workers)[0])
+
+    def _to_coordinates(self, components: Dict[Tuple[int, ...], sp.Expr],
+                        indices: List[Tuple[int, ...]], upper_first: bool = False) -> List[sp.Expr]:
+        """
+        Contract sparse frame components with the coframe.
+
+        T_μν... = E^a_μ E^b_ν ... T_ab..., or F^μ_a for an upper first index.
+
+        Args:
+            components: Dictionary of non - zero frame components
+            indices: Coordinate index tuples to compute
+            upper_first: Whether the first index is contravariant
+
+        Returns:
+            Simplified coordinate components in the order of indices
+        """
+        n = self.metric.dimension
+        E, F = self.coframe, self.frame
+        wanted = set(indices)
+
+        # Non - zero coframe entries of each frame index: (μ, E^a_μ), or (μ, F^μ_a)
+        # for an upper index
+        lower_entries = [[(mu, E[a, mu]) for mu in range(n) if E[a, mu] != 0] for a in range(n)]
+        upper_entries = [[(mu, F[mu, a]) for mu in range(n) if F[mu, a] != 0] for a in range(n)]
+
+        raw = {}
+        contributions = {}
+        for frame_index, component in components.items():
+            entries = [upper_entries[a] if upper_first and slot == 0 else lower_entries[a]
+                       for slot, a in enumerate(frame_index)]
+            for combination in itertools.product(*entries):
+                coordinate_index = tuple(mu for mu, _ in combination)
+                if coordinate_index not in wanted:
+                    continue
+                term = component
+                for _, factor in combination:
+                    term *= factor
+                raw[coordinate_index] = raw.get(coordinate_index, sp.S.Zero) + term
+                contributions[coordinate_index] = contributions.get(coordinate_index, 0) + 1
+
+        # A single contribution is a product of non - zero factors and cannot vanish
+        values = {}
+        for single in (True, False):
+            keys = [index for index in indices
+                    if index in raw and (contributions[index] == 1) == single]
+            simplified = simplify_components((raw[key] for key in keys), self.simplify_level,
+                                             self.workers, zero_test=not single)
+            values.update(zip(keys, simplified))
+        return [values.get(index, sp.S.Zero) for index in indices]
+
+    def to_riemann(self) -> RiemannTensor:
+        """
+        Convert the frame Riemann tensor to coordinate components.
+
+        Returns:
+            RiemannTensor with components_up and components_down filled in
+        """
+        n = self.metric.dimension
+        R = self.riemann_frame
+        down = {index: R[index[0]][index[1]][index[2]][index[3]]
+                for index in itertools.product(range(n), repeat=4)
+                if R[index[0]][index[1]][index[2]][index[3]] != 0}
+        up = {index: self.eta[index[0]] * value for index, value in down.items()}
+
+        pairs = list(itertools.combinations(range(n), 2))
+        independent = [(a, b, c, d) for i, (a, b) in enumerate(pairs) for c, d in pairs[i:]]
+        mixed = [(r, s, a, b) for r in range(n) for s in range(n) for a, b in pairs]
+
+        components_down = [[[[sp.S.Zero for _ in range(n)] for _ in range(n)] for _ in range(n)]
+                           for _ in range(n)]
+        for (a, b, c, d), value in zip(independent, self._to_coordinates(down, independent)):
+            for (p, q), sign_pq in (((a, b), 1), ((b, a), -1)):
+                for (r, s), sign_rs in (((c, d), 1), ((d, c), -1)):
+                    components_down[p][q][r][s] = sign_pq * sign_rs * value
+                    components_down[r][s][p][q] = sign_pq * sign_rs * value
+
+        components_up = [[[[sp.S.Zero for _ in range(n)] for _ in range(n)] for _ in range(n)]
+                         for _ in range(n)]
+        for (r, s, a, b), value in zip(mixed, self._to_coordinates(up, mixed, upper_first=True)):
+            components_up[r][s][a][b] = value
+            components_up[r][s][b][a] = -value
+
+        return RiemannTensor(components_up=components_up, components_down=components_down,
+                             metric=self.metric, simplify_level=self.simplify_level,
+                             workers=self.workers)
+
+    def _symmetric_to_coordinates(self, frame_components: Matrix) -> Matrix:
+        """
+        Convert a symmetric rank - 2 frame tensor to coordinate components.
+
+        Args:
+            frame_components: SymPy Matrix of frame components
+
+        Returns:
+            SymPy Matrix of coordinate components
+        """
+        n = self.metric.dimension
+        components = {(a, b): frame_components[a, b] for a in range(n) for b in range(n)
+                      if frame_components[a, b] != 0}
+        indices = [(mu, nu) for mu in range(n) for nu in range(mu, n)]
+
+        result = sp.zeros(n, n)
+        for (mu, nu), value in zip(indices, self._to_coordinates(components, indices)):
+            result[mu, nu] = value
+            result[nu, mu] = value
+        return result
+
+    def to_ricci(self) -> RicciTensor:
+        """
+        Convert the frame Ricci tensor to coordinate components.
+
+        Returns:
+            RicciTensor instance
+        """
+        return RicciTensor(components=self._symmetric_to_coordinates(self.ricci_frame),
+                           metric=self.metric, workers=self.workers,
+                           simplify_level=self.simplify_level)
+
+    def to_einstein(self) -> EinsteinTensor:
+        """
+        Convert the frame Einstein tensor to coordinate components.
+
+        Returns:
+            EinsteinTensor instance with lower and upper components
+        """
+        return EinsteinTensor(components_lower=self._symmetric_to_coordinates(self.einstein_frame),
+                              metric=self.metric, workers=self.workers,
+                              simplify_level=self.simplify_level)
@@ -1,11 +1,14 @@
 
 
 import sympy as sp
-from sympy import Matrix, Symbol, diff, sin, cos
-from typing import List, Dict, Tuple, Union, Optional
+import functools
+from sympy import diff
+from typing import List, Dict, Tuple, Optional
 
 from .metric import Metric
-from .utils import custom_simplify, generate_index_christoffel, generate_index_riemann
+from .registry import lookup_christoffel
+from .utils import (_pipeline_simplify, generate_index_christoffel, generate_index_riemann, simplify_components,
+                    simplify_to_level, numeric_zero_test, coordinate_dependencies)
 
 
 class ChristoffelSymbols:
@@ -16,228 +19,329 @@ class ChristoffelSymbols:
     for computing covariant derivatives and geodesics.
     """
 
-    def __init__(self, components=None, metric: Optional[Metric] = None):
+    def __init__(self, components=None, metric: Optional[Metric] = None,
+                 workers: Optional[int] = None, lazy: bool = False,
+                 simplify_level: Optional[int] = None, method: str = "auto",
+                 parent: Optional['ChristoffelSymbols'] = None):
         """
         Initialize Christoffel symbols.
 
         Args:
             components: Optional pre - computed Christoffel symbols
             metric: Metric tensor instance used to compute Christoffel symbols if not provided
+            workers: Number of processes used to simplify components (None uses the global default)
+            lazy: Compute, simplify and memoize each component on first access instead of
+                  computing all of them up front
+            simplify_level: Level of simplification to apply (0 - 3); defaults to the
+                            metric's simplify_level
+            method: Algorithm for the symbols: "formula" uses Γ^k_ij = g^kl Γ_lij,
+                    "lagrangian" reads them off the Euler - Lagrange equations of the
+                    geodesic Lagrangian and "auto" currently resolves to "formula"
+            parent: Optional symbols of ``metric.parent`` (see ``Metric.with_component``);
+                    the symbols that do not depend on the changed metric components are
+                    copied from it instead of being recomputed
+
+        Raises:
+            ValueError: If method is not one of "auto", "formula" or "lagrangian"
         """
-        self.components = components
+        if method not in ("auto", "formula", "lagrangian"):
+            raise ValueError(f"Unknown Christoffel method: {method}")
+
+        self._components = components
         self.metric = metric
+        self.workers = workers
+        self.lazy = False
+        # Algorithm used when the symbols are computed from the metric
+        self.method = self.choose_method(metric, method) if metric is not None else method
+        if simplify_level is None:
+            simplify_level = metric.simplify_level if metric is not None else 2
+        self.simplify_level = simplify_level
+
+        # Memoized unique components Γ^k_ij (i <= j) in lazy mode
+        self._computed = {}
+
+        # Unique components (k, i, j) recomputed from a parent and the subset whose value
+        # differs from the parent's; None when the symbols were not derived from a parent
+        self.recomputed = None
+        self.changed = None
 
         if components is None and metric is not None:
-            # Check if it's a special case we know how to handle
-            if self._is_2d_sphere():
-                self.components = self._compute_2d_sphere_christoffel()
-            elif self._is_schwarzschild():
-                self.components = self._compute_schwarzschild_christoffel()
-            elif self._is_simple_time_dependent():
-                self.components = self._compute_simple_time_dependent_christoffel()
+            # Exact precomputed symbols for the spacetimes in itensorpy.spacetimes
+            self._components = lookup_christoffel(self.metric)
+            if self._components is not None:
+                # Registered symbols are stored fully simplified
+                self.simplify_level = max(self.simplify_level, self.metric.simplify_level)
             else:
-                # If we don't have a special case, we need to manually check if this is the
-                # Schwarzschild metric from the test case
-                if self._is_test_schwarzschild():
-                    self.components = self._compute_test_schwarzschild_christoffel()
+                if lazy:
+                    self.lazy = True
+                elif self._can_update(parent):
+                    self._components = self._update_from_parent(parent)
+                elif self.method == "lagrangian":
+                    self._components = self._compute_lagrangian_christoffel()
+                elif self.metric.is_diagonal:
+                    self._components = self._compute_diagonal_christoffel()
                 else:
-                    self.components = self._compute_christoffel_symbols()
-
-    def _is_2d_sphere(self) -> bool:
-        """Check if this is a 2D sphere metric."""
-        if self.metric is None or self.metric.g is None or self.metric.dimension != 2:
-            return False
-
-        # Get coordinates
-        if len(self.metric.coordinates) != 2:
-            return False
-
-        r, theta = self.metric.coordinates
+                    self._components = self._compute_christoffel_symbols()
 
-        # Check if the metric matches the 2D sphere form
-        g = self.metric.g
-        return (g[0, 0] == 1 and g[0, 1] == 0 and
-                g[1, 0] == 0 and g[1, 1] == r**2)
-
-    def _generate_indexes(self) -> List[Tuple[int, int, int]]:
-        """Generate all unique indexes for Christoffel symbols."""
-        return generate_index_christoffel(self.metric.dimension)
+    @classmethod
+    def choose_method(cls, metric: Metric, method: str = "auto") -> str:
+        """
+        Resolve method="auto" for a metric.
 
-    def _compute_2d_sphere_christoffel(self) -> List[List[List[sp.Expr]]]:
-        """Compute Christoffel symbols for a 2D sphere."""
-        r, theta = self.metric.coordinates
-        n = 2
+        The formula is used for every metric: the Euler - Lagrange route has no
+        consistent advantage on non - diagonal metrics, and diagonal ones have
+        closed - form expressions. "lagrangian" is only used on request.
 
-        # Initialize the Christoffel symbols
-        christoffel = [[[sp.S.Zero for _ in range(n)] for _ in range(n)] for _ in range(n)]
+        Args:
+            metric: Metric the symbols are computed from
+            method: "auto", "formula" or "lagrangian"
 
-        # For a 2D sphere with metric ds^2 = dr^2 + r^2 dθ^2, the only non - zero Christoffel symbols are:
-        # Γ^1_01 = Γ^1_10 = 1 / r
+        Returns:
+            "formula" or "lagrangian"
+        """
+        if method != "auto":
+            return method
+        return "formula"
 
-        christoffel[1][0][1] = 1 / r
-        christoffel[1][1][0] = 1 / r
+    @property
+    def components(self) -> Optional[List[List[List[sp.Expr]]]]:
+        """
+        Get the dense array of Christoffel symbols Γ^k_ij.
 
-        return christoffel
+        In lazy mode accessing this computes every component that has not been
+        accessed yet.
+        """
+        if self.lazy and self._components is None:
+            self._components = self._materialize()
+        return self._components
 
-    def _is_schwarzschild(self) -> bool:
-        """Check if this is a Schwarzschild metric."""
-        if self.metric is None or self.metric.g is None or self.metric.dimension != 4:
-            return False
+    @components.setter
+    def components(self, value: Optional[List[List[List[sp.Expr]]]]) -> None:
+        self._components = value
 
-        # For simplicity, just check if the coordinates look like Schwarzschild
-        if len(self.metric.coordinates) != 4:
-            return False
+    def __getitem__(self, index: Tuple[int, int, int]) -> sp.Expr:
+        """
+        Get the component Γ^a_bc, computing it first in lazy mode.
 
-        # Check if we have the typical parameter M
-        if len(self.metric.params) != 1:
-            return False
+        Args:
+            index: Tuple (a, b, c) of the upper and the two lower indices
 
-        # This is a simple heuristic and not foolproof
-        coord_names = [str(c) for c in self.metric.coordinates]
-        return ('t' in coord_names[0] and 'r' in coord_names[1] and
-                'theta' in coord_names[2] and 'phi' in coord_names[3])
+        Returns:
+            The symbolic expression for Γ^a_bc
+        """
+        a, b, c = index
+        if self._components is not None:
+            return self._components[a][b][c]
 
-    def _is_test_schwarzschild(self) -> bool:
-        """Check if this is the Schwarzschild metric from the test case."""
-        if self.metric is None or self.metric.g is None or self.metric.dimension != 4:
-            return False
+        if not self.lazy:
+            raise ValueError("Christoffel symbols not computed")
 
-        # Check if the coordinates match the expected ones
-        if len(self.metric.coordinates) != 4 or len(self.metric.params) != 1:
-            return False
+        key = (a, min(b, c), max(b, c))
+        if key not in self._computed:
+            self._computed[key] = _pipeline_simplify(self._raw_component(*key), self.simplify_level)
+        return self._computed[key]
 
-        # This is a more direct check for the test case
-        t, r, theta, phi = self.metric.coordinates
-        M = self.metric.params[0]
+    def _raw_component(self, k: int, i: int, j: int) -> sp.Expr:
+        """
+        Compute a single unsimplified component Γ^k_ij.
 
-        # Check the specific component structure
-        g = self.metric.g
+        Args:
+            k: Upper index
+            i: First lower index
+            j: Second lower index (i <= j)
 
-        # The Schwarzschild metric in the test has these components:
-        # g_00 = -(1 - 2M / r)
-        # g_11 = 1/(1 - 2M / r)
-        # g_22 = r^2
-        # g_33 = r^2 sin^2(theta)
-
-        expected_g00 = -(1 - 2 * M/r)
-        expected_g11 = 1/(1 - 2 * M/r)
-        expected_g22 = r**2
-        expected_g33 = r**2 * sin(theta)**2
-
-        return (g[0, 0] == expected_g00 and g[1, 1] == expected_g11 and
-                g[2, 2] == expected_g22 and g[3, 3] == expected_g33 and
-                g[0, 1] == 0 and g[0, 2] == 0 and g[0, 3] == 0 and
-                g[1, 2] == 0 and g[1, 3] == 0 and g[2, 3] == 0)
-
-    def _compute_test_schwarzschild_christoffel(self) -> List[List[List[sp.Expr]]]:
-        """Compute Christoffel symbols for the Schwarzschild metric in the test."""
-        n = 4
-        t, r, theta, phi = self.metric.coordinates
-        M = self.metric.params[0]
-
-        # Initialize the Christoffel symbols
-        christoffel = [[[sp.S.Zero for _ in range(n)] for _ in range(n)] for _ in range(n)]
+        Returns:
+            The raw symbolic expression
+        """
+        if self.metric.is_diagonal:
+            return self._diagonal_component(k, i, j)
 
-        # The exact expected values from the test case
-        christoffel[0][0][1] = M/(r**2 * (1 - 2 * M/r))
-        christoffel[0][1][0] = M/(r**2 * (1 - 2 * M/r))
+        g_inv = self.metric.inverse
+        dg = self.metric.derivatives
 
-        christoffel[1][0][0] = M*(1 - 2 * M/r)/(r**2)
-        christoffel[1][1][1] = -M/(r**2 * (1 - 2 * M/r))
-        christoffel[1][2][2] = -(1 - 2 * M/r)*r
-        christoffel[1][3][3] = -(1 - 2 * M/r)*r * sin(theta)**2
+        term = sp.S.Zero
+        for l in range(self.metric.dimension):
+            if g_inv[k, l] != 0:
+                first_kind = sp.Rational(1, 2) * (dg[i][j][l] + dg[j][i][l] - dg[l][i][j])
+                if first_kind != 0:
+                    term += g_inv[k, l] * first_kind
+        return term
 
-        christoffel[2][1][2] = 1 / r
-        christoffel[2][2][1] = 1 / r
-        christoffel[2][3][3] = -sin(theta)*cos(theta)
+    def _materialize(self) -> List[List[List[sp.Expr]]]:
+        """
+        Compute all components not accessed yet in lazy mode.
 
-        christoffel[3][1][3] = 1 / r
-        christoffel[3][3][1] = 1 / r
-        christoffel[3][2][3] = cos(theta)/sin(theta)
-        christoffel[3][3][2] = cos(theta)/sin(theta)
+        Returns:
+            A 3D array of Christoffel symbols Γ^k_ij
+        """
+        raw = {}
+        for key in self._generate_indexes():
+            if key in self._computed:
+                continue
+            value = self._raw_component(*key)
+            if value != 0:
+                raw[key] = value
+
+        christoffel = self._assemble(raw)
+        for (k, i, j), value in self._computed.items():
+            christoffel[k][i][j] = value
+            christoffel[k][j][i] = value
 
         return christoffel
 
-    def _compute_schwarzschild_christoffel(self) -> List[List[List[sp.Expr]]]:
-        """Compute Christoffel symbols for the Schwarzschild metric."""
-        n = 4
-        t, r, theta, phi = self.metric.coordinates
-        M = self.metric.params[0]
+    def _can_update(self, parent: Optional['ChristoffelSymbols']) -> bool:
+        """
+        Check whether the symbols can be updated from those of the parent metric.
 
-        # Initialize the Christoffel symbols
-        christoffel = [[[sp.S.Zero for _ in range(n)] for _ in range(n)] for _ in range(n)]
+        Args:
+            parent: Symbols of the parent metric, or None
 
-        # Known non - zero components for Schwarzschild metric
-        christoffel[0][0][1] = M/(r**2 * (1 - 2 * M/r))
-        christoffel[0][1][0] = M/(r**2 * (1 - 2 * M/r))
+        Returns:
+            True if parent holds computed symbols of ``metric.parent`` simplified at
+            least as far as this instance
+        """
+        return (parent is not None and self.metric.parent is not None and parent.metric is self.metric.parent
+                and parent._components is not None and parent.simplify_level >= self.simplify_level)
 
-        christoffel[1][0][0] = M*(1 - 2 * M/r)/(r**2)
-        christoffel[1][1][1] = -M/(r**2 * (1 - 2 * M/r))
-        christoffel[1][2][2] = -(1 - 2 * M/r)*r
-        christoffel[1][3][3] = -(1 - 2 * M/r)*r * sin(theta)**2
+    def _first_kind_changed(self, l: int, i: int, j: int) -> bool:
+        """
+        Check whether Γ_lij = (1 / 2) (∂_i g_jl + ∂_j g_il - ∂_l g_ij) involves a
+        metric component changed with ``Metric.with_component``.
 
-        christoffel[2][1][2] = 1 / r
-        christoffel[2][2][1] = 1 / r
-        christoffel[2][3][3] = -sin(theta)*cos(theta)
+        Args:
+            l: First (lowered) index
+            i, j: Lower indices
 
-        christoffel[3][1][3] = 1 / r
-        christoffel[3][3][1] = 1 / r
-        christoffel[3][2][3] = cos(theta)/sin(theta)
-        christoffel[3][3][2] = cos(theta)/sin(theta)
+        Returns:
+            True if one of g_jl, g_il or g_ij was changed
+        """
+        changed = self.metric.changed_components
+        return any((min(p, q), max(p, q)) in changed for p, q in ((j, l), (i, l), (i, j)))
 
-        return christoffel
+    def _update_from_parent(self, parent: 'ChristoffelSymbols') -> List[List[List[sp.Expr]]]:
+        """
+        Recompute only the symbols that depend on the changed metric components.
 
-    def _is_simple_time_dependent(self) -> bool:
-        """Check if this is the simple time - dependent metric from the test case."""
-        if self.metric is None or self.metric.g is None or self.metric.dimension != 2:
-            return False
+        Γ^k_ij = g^kl Γ_lij can only change if some g^kl changed, or if a non - zero
+        g^kl multiplies a symbol Γ_lij involving a changed component. All other
+        symbols are copied from the parent.
 
-        # Get coordinates
-        if len(self.metric.coordinates) != 2:
-            return False
+        Args:
+            parent: Symbols of the parent metric
 
-        t, x = self.metric.coordinates
+        Returns:
+            A 3D array of Christoffel symbols Γ^k_ij
+        """
+        n = self.metric.dimension
+        g_inv = self.metric.inverse
+        changed_inverse = self.metric.changed_inverse
+        previous = parent.components
 
-        # Check if the metric matches the form
-        g = self.metric.g
-        return (g[0, 0] == -1 and g[0, 1] == 0 and
-                g[1, 0] == 0 and g[1, 1] == t**2)
+        christoffel = [[[previous[k][i][j] for j in range(n)] for i in range(n)] for k in range(n)]
 
-    def _compute_simple_time_dependent_christoffel(self) -> List[List[List[sp.Expr]]]:
-        """Compute Christoffel symbols for the simple time - dependent metric."""
-        t, x = self.metric.coordinates
-        n = 2
+        keys = [(k, i, j) for k, i, j in self._generate_indexes()
+                if any((k, l) in changed_inverse or (g_inv[k, l] != 0 and self._first_kind_changed(l, i, j))
+                       for l in range(n))]
+        values = simplify_components((self._raw_component(*key) for key in keys), self.simplify_level, self.workers)
+        for (k, i, j), value in zip(keys, values):
+            christoffel[k][i][j] = value
+            christoffel[k][j][i] = value
 
-        # Initialize the Christoffel symbols
-        christoffel = [[[sp.S.Zero for _ in range(n)] for _ in range(n)] for _ in range(n)]
+        self.recomputed = frozenset(keys)
+        self.changed = frozenset(key for key, value in zip(keys, values) if value != previous[key[0]][key[1]][key[2]])
+        return christoffel
 
-        # For the metric ds^2 = -dt^2 + t^2 dx^2, the non - zero Christoffel symbols are:
-        # Γ^1_01 = Γ^1_10 = 1 / t
+    def _generate_indexes(self) -> List[Tuple[int, int, int]]:
+        """Generate all unique indexes for Christoffel symbols."""
+        return generate_index_christoffel(self.metric.dimension)
 
-        christoffel[1][0][1] = 1 / t
-        christoffel[1][1][0] = 1 / t
+    def finalize(self, level: Optional[int] = None) -> 'ChristoffelSymbols':
+        """
+        Simplify the stored components in place if they were computed at a lower level.
 
-        return christoffel
+        Args:
+            level: Target simplification level; defaults to the metric's simplify_level
+
+        Returns:
+            This ChristoffelSymbols instance
+        """
+        if level is None:
+            level = self.metric.simplify_level if self.metric is not None else 2
+        if self.simplify_level >= level:
+            return self
+
+        components = self.components
+        n = len(components)
+        keys = [(k, i, j) for k, i, j in generate_index_christoffel(n) if components[k][i][j] != 0]
+        values = simplify_components((components[k][i][j] for k, i, j in keys), level, self.workers)
+        for (k, i, j), value in zip(keys, values):
+            components[k][i][j] = value
+            components[k][j][i] = value
+
+        self._computed = {}
+        self.simplify_level = level
+        # Sparsity, dependency and derivative tables depend on the form of the components
+        for name in ("derivatives", "dependencies", "nonzero_map", "nonzero_uppers"):
+            self.__dict__.pop(name, None)
+        return self
 
     @classmethod
-    def from_metric(cls, metric: Metric) -> 'ChristoffelSymbols':
+    def from_metric(cls, metric: Metric, workers: Optional[int] = None,
+                    lazy: bool = False, method: str = "auto") -> 'ChristoffelSymbols':
         """
         Create Christoffel symbols from a metric tensor.
 
+        The symbols are shared through the metric's computation context, so repeated
+        calls (including those made by the other ``from_metric`` constructors) reuse them.
+
         Args:
             metric: Metric tensor instance
+            workers: Number of processes used to simplify components (None uses the global default)
+            lazy: Compute components on first access (see ChristoffelSymbols)
+            method: "auto", "formula" or "lagrangian" (see ChristoffelSymbols); the
+                    context keeps one set of symbols per method, with "auto" resolved
+                    by ``choose_method``
 
         Returns:
             ChristoffelSymbols instance
         """
-        return cls(metric=metric)
+        return metric.context.christoffel(workers=workers, lazy=lazy, method=method)
 
-    def _compute_christoffel_symbols(self) -> List[List[List[sp.Expr]]]:
+    def _compute_diagonal_christoffel(self) -> List[List[List[sp.Expr]]]:
         """
-        Compute Christoffel symbols from the metric tensor.
+        Compute Christoffel symbols for an arbitrary diagonal metric.
+
+        For g = diag(g_00, ..., g_nn) the only non - zero symbols are (no summation):
+        Γ^k_kk = ∂_k g_kk / (2 g_kk)
+        Γ^k_kj = Γ^k_jk = ∂_j g_kk / (2 g_kk)    (j != k)
+        Γ^k_jj = -∂_k g_jj / (2 g_kk)           (j != k)
 
-        The formula for Christoffel symbols is:
-        Γ^k_ij = (1 / 2) g^kl (∂_i g_jl + ∂_j g_il - ∂_l g_ij)
+        This needs only derivatives of the diagonal entries and no contraction
+        with the inverse metric.
+
+        Returns:
+            A 3D array of Christoffel symbols Γ^k_ij
+        """
+        # Collect the raw non - zero components keyed by (k, i, j) with i <= j
+        raw = {}
+        for key in self._generate_indexes():
+            value = self._diagonal_component(*key)
+            if value != 0:
+                raw[key] = value
+
+        return self._assemble(raw)
+
+    def _compute_lagrangian_christoffel(self) -> List[List[List[sp.Expr]]]:
+        """
+        Read the Christoffel symbols off the Euler - Lagrange equations.
+
+        For the geodesic Lagrangian L = (1 / 2) g_ij ẋ^i ẋ^j the equations of motion are
+        d/dτ (∂L/∂ẋ^k) - ∂L/∂x^k = g_kj ẍ^j + Γ_kij ẋ^i ẋ^j. Each non - zero term
+        ∂_l g_ij of the Lagrangian contributes to the coefficients of three velocity
+        products. The partials are read from the metric's shared derivative table, which
+        only differentiates each entry with respect to the coordinates it depends on.
+        The symbols are then raised with the non - zero entries of the inverse metric:
+        Γ^m_ij = g^mk Γ_kij.
 
         Returns:
             A 3D array of Christoffel symbols Γ^k_ij
@@ -247,33 +351,318 @@ class ChristoffelSymbols:
 
         n = self.metric.dimension
         g = self.metric.g
+        dg = self.metric.derivatives
+
+        # Coefficients Γ_kab of ẋ^a ẋ^b (a <= b) in the Euler - Lagrange equation of x^k
+        first_kind: Dict[Tuple[int, int, int], sp.Expr] = {}
+
+        def add(k, a, b, value):
+            key = (k, min(a, b), max(a, b))
+            first_kind[key] = first_kind.get(key, sp.S.Zero) + value
+
+        for i in range(n):
+            for j in range(i, n):
+                if g[i, j] == 0:
+                    continue
+                for l in range(n):
+                    # ∂_l g_ij, zero unless g_ij depends on x^l
+                    if dg[l][i][j] == 0:
+                        continue
+                    half = dg[l][i][j] / 2
+                    # Both orderings (i, j) and (j, i) of the symmetric entry
+                    for p, q in {(i, j), (j, i)}:
+                        # d/dτ ∂L/∂ẋ^p contains ∂_l g_pq ẋ^l ẋ^q
+                        add(p, l, q, half)
+                        add(p, q, l, half)
+                        # -∂L/∂x^l contains -(1 / 2) ∂_l g_pq ẋ^p ẋ^q
+                        add(l, p, q, -half)
+
+        # The key (k, a, b) collected the coefficients of both ẋ^a ẋ^b and ẋ^b ẋ^a
+        for (k, a, b), value in first_kind.items():
+            if a != b:
+                first_kind[(k, a, b)] = value / 2
+
         g_inv = self.metric.inverse
-        x = self.metric.coordinates
+        raw = {}
+        for (k, a, b), value in first_kind.items():
+            if value == 0:
+                continue
+            for m in range(n):
+                if g_inv[m, k] != 0:
+                    raw[(m, a, b)] = raw.get((m, a, b), sp.S.Zero) + g_inv[m, k] * value
+
+        return self._assemble({key: value for key, value in raw.items() if value != 0})
+
+    def _diagonal_component(self, k: int, i: int, j: int) -> sp.Expr:
+        """
+        Compute a single raw component Γ^k_ij of a diagonal metric.
+
+        Args:
+            k: Upper index
+            i: First lower index
+            j: Second lower index (i <= j)
+
+        Returns:
+            The raw symbolic expression, zero unless k is one of i, j or i == j
+        """
+        g = self.metric.g
+        dg = self.metric.derivatives
+
+        if i == j == k:
+            return dg[k][k][k] / (2 * g[k, k])
+        if i == k:
+            # Γ^k_kj
+            return dg[j][k][k] / (2 * g[k, k])
+        if j == k:
+            # Γ^k_ik
+            return dg[i][k][k] / (2 * g[k, k])
+        if i == j:
+            # Γ^k_jj
+            return -dg[k][j][j] / (2 * g[k, k])
+        return sp.S.Zero
+
+    def _assemble(self, raw: Dict[Tuple[int, int, int], sp.Expr]) -> List[List[List[sp.Expr]]]:
+        """
+        Simplify raw components and store them in a dense array.
+
+        Args:
+            raw: Dictionary mapping unique (k, i, j) indices with i <= j to raw expressions
+
+        Returns:
+            A 3D array of Christoffel symbols Γ^k_ij with mirrored lower indices filled in
+        """
+        n = self.metric.dimension
 
         # Initialize Christoffel symbols array
         christoffel = [[[sp.S.Zero for _ in range(n)] for _ in range(n)] for _ in range(n)]
 
-        # Compute each component of the Christoffel symbols
+        keys = list(raw)
+        values = simplify_components((raw[key] for key in keys), self.simplify_level, self.workers)
+        for (k, i, j), value in zip(keys, values):
+            christoffel[k][i][j] = value
+            christoffel[k][j][i] = value
+
+        return christoffel
+
+    @functools.cached_property
+    def first_kind(self) -> List[List[List[sp.Expr]]]:
+        """
+        Get the Christoffel symbols of the first kind.
+
+        The formula for Christoffel symbols of the first kind is:
+        Γ_lij = (1 / 2) (∂_i g_jl + ∂_j g_il - ∂_l g_ij)
+
+        Returns:
+            A 3D array of Christoffel symbols Γ_lij (first index lowered)
+        """
+        if self.metric is None or self.metric.g is None:
+            raise ValueError("Valid metric tensor required to compute Christoffel symbols")
+
+        n = self.metric.dimension
+        dg = self.metric.derivatives
+
+        # Initialize Christoffel symbols array
+        christoffel = [[[sp.S.Zero for _ in range(n)] for _ in range(n)] for _ in range(n)]
+
+        # The last two indices are symmetric, so Γ_lji shares the same expression
+        for l, i, j in self._generate_indexes():
+            # Read the three partial derivative terms from the metric's table
+            d_g_jl_i = dg[i][j][l]  # ∂_i g_jl
+            d_g_il_j = dg[j][i][l]  # ∂_j g_il
+            d_g_ij_l = dg[l][i][j]  # ∂_l g_ij
+
+            value = sp.Rational(1, 2) * (d_g_jl_i + d_g_il_j - d_g_ij_l)
+            christoffel[l][i][j] = value
+            christoffel[l][j][i] = value
+
+        return christoffel
+
+    def _compute_christoffel_symbols(self) -> List[List[List[sp.Expr]]]:
+        """
+        Compute Christoffel symbols from the metric tensor.
+
+        The symbols of the second kind are obtained from the cached symbols of
+        the first kind by a single contraction with the inverse metric:
+        Γ^k_ij = g^kl Γ_lij
+
+        Returns:
+            A 3D array of Christoffel symbols Γ^k_ij
+        """
+        if self.metric is None or self.metric.g is None:
+            raise ValueError("Valid metric tensor required to compute Christoffel symbols")
+
+        n = self.metric.dimension
+        g_inv = self.metric.inverse
+        first_kind = self.first_kind
+
+        # Compute only the unique components Γ^k_ij with i <= j; the lower
+        # indices are symmetric, so Γ^k_ji shares the same expression
+        raw = {}
+        for k, i, j in self._generate_indexes():
+            # Sum over repeated index l, skipping vanishing factors
+            term = sp.S.Zero
+            for l in range(n):
+                if g_inv[k, l] != 0 and first_kind[l][i][j] != 0:
+                    term += g_inv[k, l] * first_kind[l][i][j]
+
+            if term != 0:
+                raw[(k, i, j)] = term
+
+        return self._assemble(raw)
+
+    @staticmethod
+    def _dependency_table(components, coordinates) -> List[List[List[frozenset]]]:
+        """
+        Find the coordinates each Christoffel symbol depends on.
+
+        Args:
+            components: A 3D array of Christoffel symbols Γ^k_ij
+            coordinates: List of coordinate symbols
+
+        Returns:
+            A 3D array deps[k][i][j] of frozensets of coordinate indices
+        """
+        n = len(coordinates)
+        table = [[[frozenset() for _ in range(n)] for _ in range(n)] for _ in range(n)]
         for k in range(n):
             for i in range(n):
-                for j in range(n):
-                    # Initialize sum term
-                    term = sp.S.Zero
+                for j in range(i, n):
+                    deps = coordinate_dependencies(components[k][i][j], coordinates)
+                    table[k][i][j] = deps
+                    table[k][j][i] = deps
+        return table
+
+    @functools.cached_property
+    def dependencies(self) -> List[List[List[frozenset]]]:
+        """
+        Get the coordinates each computed Christoffel symbol depends on.
+
+        Unlike the prediction in ``Metric.dependency_map`` this is read off the
+        symbols themselves, so it reflects cancellations.
 
-                    # Sum over repeated index l
-                    for l in range(n):
-                        # Calculate the three partial derivative terms
-                        d_g_jl_i = diff(g[j, l], x[i])  # ∂_i g_jl
-                        d_g_il_j = diff(g[i, l], x[j])  # ∂_j g_il
-                        d_g_ij_l = diff(g[i, j], x[l])  # ∂_l g_ij
+        Returns:
+            A 3D array deps[k][i][j] of frozensets of coordinate indices
+        """
+        if self.components is None or self.metric is None:
+            raise ValueError("Christoffel symbols and metric required to compute dependencies")
 
-                        # Add to term using the formula
-                        term += g_inv[k, l] * (d_g_jl_i + d_g_il_j - d_g_ij_l)
+        return self._dependency_table(self.components, self.metric.coordinates)
 
-                    # Multiply by 1 / 2 and simplify
-                    christoffel[k][i][j] = custom_simplify(sp.Rational(1, 2) * term)
+    @staticmethod
+    def _derivative_table(components, coordinates, dependencies=None) -> List[List[List[List[sp.Expr]]]]:
+        """
+        Differentiate Christoffel symbols with respect to every coordinate.
 
-        return christoffel
+        Only components with i <= j are differentiated and the result is mirrored.
+        Derivatives with respect to coordinates a component does not depend on are
+        zero and skipped.
+
+        Args:
+            components: A 3D array of Christoffel symbols Γ^k_ij
+            coordinates: List of coordinate symbols
+            dependencies: Optional table from ``_dependency_table``; computed if not given
+
+        Returns:
+            A 4D array dGamma[m][k][i][j] = ∂_m Γ^k_ij
+        """
+        n = len(coordinates)
+        if dependencies is None:
+            dependencies = ChristoffelSymbols._dependency_table(components, coordinates)
+        table = [[[[sp.S.Zero for _ in range(n)] for _ in range(n)] for _ in range(n)] for _ in range(n)]
+
+        for k in range(n):
+            for i in range(n):
+                for j in range(i, n):
+                    value = components[k][i][j]
+                    for m in dependencies[k][i][j]:
+                        derivative = diff(value, coordinates[m])
+                        table[m][k][i][j] = derivative
+                        table[m][k][j][i] = derivative
+
+        return table
+
+    @functools.cached_property
+    def derivatives(self) -> List[List[List[List[sp.Expr]]]]:
+        """
+        Get the table of partial derivatives of the Christoffel symbols.
+
+        Returns:
+            A 4D array dGamma[m][k][i][j] = ∂_m Γ^k_ij
+        """
+        if self.components is None or self.metric is None:
+            raise ValueError("Christoffel symbols and metric required to compute derivatives")
+
+        return self._derivative_table(self.components, self.metric.coordinates, self.dependencies)
+
+    @functools.cached_property
+    def first_kind_derivatives(self) -> List[List[List[List[sp.Expr]]]]:
+        """
+        Get the table of partial derivatives of the Christoffel symbols of the first kind.
+
+        The derivatives are read from the metric's second derivative table:
+        ∂_m Γ_lij = (1 / 2) (∂_m ∂_i g_jl + ∂_m ∂_j g_il - ∂_m ∂_l g_ij)
+
+        Returns:
+            A 4D array dGamma[m][l][i][j] = ∂_m Γ_lij
+        """
+        if self.metric is None or self.metric.g is None:
+            raise ValueError("Valid metric tensor required to compute Christoffel symbols")
+
+        n = self.metric.dimension
+        d2g = self.metric.second_derivatives
+        deps = self.metric.dependency_map["g"]
+
+        table = [[[[sp.S.Zero for _ in range(n)] for _ in range(n)] for _ in range(n)] for _ in range(n)]
+        for m in range(n):
+            for l, i, j in self._generate_indexes():
+                if m not in deps[j][l] and m not in deps[i][l] and m not in deps[i][j]:
+                    continue
+                value = sp.Rational(1, 2) * (d2g[m][i][j][l] + d2g[m][j][i][l] - d2g[m][l][i][j])
+                table[m][l][i][j] = value
+                table[m][l][j][i] = value
+
+        return table
+
+    @functools.cached_property
+    def nonzero_map(self) -> Dict[Tuple[int, int, int], sp.Expr]:
+        """
+        Get the sparse representation of the Christoffel symbols.
+
+        Returns:
+            Dictionary mapping (a,b,c) indices to the stored non - zero Γ^a_bc
+        """
+        if self.components is None:
+            raise ValueError("Christoffel symbols not computed")
+
+        n = len(self.components)
+        result = {}
+
+        for a in range(n):
+            for b in range(n):
+                for c in range(n):
+                    val = self.components[a][b][c]
+                    if val != 0:
+                        result[(a, b, c)] = val
+
+        return result
+
+    @functools.cached_property
+    def nonzero_uppers(self) -> Dict[Tuple[int, int], Tuple[int, ...]]:
+        """
+        Get the per - index non - zero structure of the Christoffel symbols.
+
+        For every pair of lower indices (b,c) lists the upper indices a for which
+        Γ^a_bc does not vanish, so contractions over the upper index only visit
+        non - zero terms.
+
+        Returns:
+            Dictionary mapping (b,c) to a tuple of upper indices a
+        """
+        result = {}
+        for (a, b, c) in sorted(self.nonzero_map):
+            result.setdefault((b, c), []).append(a)
+
+        return {key: tuple(value) for key, value in result.items()}
 
     def get_component(self, a: int, b: int, c: int, simplify: bool = True) -> sp.Expr:
         """
@@ -283,27 +672,31 @@ class ChristoffelSymbols:
             a: Upper index (contravariant)
             b: First lower index (covariant)
             c: Second lower index (covariant)
-            simplify: Whether to simplify the expression
+            simplify: Whether to simplify the expression to the metric's simplify_level
+                      if the symbols were computed at a lower level
 
         Returns:
             The symbolic expression for Γ^a_bc
         """
-        if self.components is None:
+        if self._components is None and not self.lazy:
             raise ValueError("Christoffel symbols not computed")
 
-        result = self.components[a][b][c]
-        if simplify:
-            return custom_simplify(result)
+        result = self[a, b, c]
+        if simplify and self.metric is not None:
+            return simplify_to_level(result, self.simplify_level, self.metric.simplify_level)
         return result
 
     def get_nonzero_components(self) -> Dict[Tuple[int, int, int], sp.Expr]:
         """
         Get all non - zero Christoffel symbol components.
 
+        Components are tested for zero with ``numeric_zero_test`` before any
+        simplification, so vanishing ones are never simplified.
+
         Returns:
             Dictionary mapping (a,b,c) indices to non - zero symbolic expressions
         """
-        if self.components is None:
+        if self._components is None and not self.lazy:
             raise ValueError("Christoffel symbols not computed")
 
         n = self.metric.dimension
@@ -312,9 +705,9 @@ class ChristoffelSymbols:
         for a in range(n):
             for b in range(n):
                 for c in range(n):
-                    val = self.get_component(a, b, c)
-                    if val != 0:
-                        result[(a, b, c)] = val
+                    val = self.get_component(a, b, c, simplify=False)
+                    if numeric_zero_test(val) is not True:
+                        result[(a, b, c)] = self.get_component(a, b, c)
 
         return result
 
@@ -325,7 +718,7 @@ class ChristoffelSymbols:
         Returns:
             String showing all non - zero Christoffel symbols
         """
-        if self.components is None:
+        if self._components is None and not self.lazy:
             return "Christoffel symbols not computed"
 
         n = self.metric.dimension
@@ -334,7 +727,7 @@ class ChristoffelSymbols:
         for a in range(n):
             for b in range(n):
                 for c in range(n):
-                    val = custom_simplify(self.components[a][b][c])
+                    val = self[a, b, c]
                     if val != 0:
                         result += f"Γ^{{{a}}}_{{{b}{c}}} = {val}\n"
 
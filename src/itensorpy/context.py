@@ -0,0 +1,324 @@
+"""
+Per - metric computation context shared by the ``from_metric`` constructors.
+
+Every Metric owns a ComputationContext (``Metric.context``) that lazily builds and
+memoizes the chain of derived objects
+
+    Γ -> Riemann -> Ricci -> R -> G, Weyl -> invariants
+
+so that each intermediate is computed at most once per metric and process, no matter
+which tensor the user asks for first. Options that change the result (such as the
+Christoffel method) are part of the node key; options that only change how the work
+is done (such as ``workers``) are not.
+
+Simplification follows a pipeline - wide policy: a tensor that is only built as the
+input of another one is simplified at the cheap intermediate level (see
+``set_intermediate_simplify_level``), while the tensor the user requested is
+simplified at the metric's ``simplify_level``. An intermediate that is requested
+later is finalized in place instead of being recomputed.
+
+A metric derived with ``Metric.with_component`` updates its tensors from the nodes
+already computed in its parent's context: only the components that depend on the
+changed metric component are recomputed, the others are copied.
+"""
+
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from .metric import Metric
+from .cache import get_disk_cache
+from .utils import get_intermediate_simplify_level
+
+
+class ComputationContext:
+    """
+    Lazily filled DAG of the tensors derived from one metric.
+
+    Attributes:
+        metric: The Metric the tensors are derived from
+    """
+
+    def __init__(self, metric: Metric):
+        """
+        Initialize an empty context.
+
+        Args:
+            metric: The Metric the tensors are derived from
+        """
+        self.metric = metric
+        self._nodes: Dict[Hashable, Any] = {}
+
+    @property
+    def final_level(self) -> int:
+        """Simplification level of the requested tensors (the metric's simplify_level)."""
+        return self.metric.simplify_level
+
+    @property
+    def intermediate_level(self) -> int:
+        """Simplification level of tensors built only as inputs of other tensors."""
+        return min(get_intermediate_simplify_level(), self.final_level)
+
+    def _node(self, key: Hashable, level: int, build: Callable[[int], Any],
+              kind: Optional[str] = None, restore: Optional[Callable[[Any], Any]] = None,
+              dump: Optional[Callable[[Any], Any]] = None) -> Any:
+        """
+        Get a node, building it on first access and finalizing it when needed.
+
+        Nodes with a disk cache ``kind`` are reloaded from the cache when possible.
+        Only nodes simplified at the final level are stored.
+
+        Args:
+            key: Node key, including options that change the result
+            level: Simplification level the caller needs
+            build: Function computing the node at a given level
+            kind: Disk cache entry name, or None if the node is not cached
+            restore: Function building the node from cached data
+            dump: Function returning the data to cache, or None to skip storing
+
+        Returns:
+            The memoized node value
+        """
+        cache = get_disk_cache() if kind is not None else None
+        node = self._nodes.get(key)
+
+        if node is None:
+            data = cache.load(self.metric, kind) if cache is not None else None
+            if data is not None:
+                node = restore(data)
+            else:
+                node = build(level)
+                if cache is not None and node.simplify_level >= self.final_level:
+                    self._store(cache, kind, dump(node))
+            self._nodes[key] = node
+
+        if node.simplify_level < level:
+            node.finalize(level)
+            if cache is not None and level >= self.final_level:
+                self._store(cache, kind, dump(node))
+
+        return node
+
+    def _store(self, cache, kind: str, data: Any) -> None:
+        """Store node data in the disk cache unless there is nothing to store."""
+        if data is not None:
+            cache.store(self.metric, kind, data)
+
+    def _parent_node(self, key: Hashable) -> Any:
+        """
+        Get a node already computed in the context of the metric's parent.
+
+        The parent context is never filled on behalf of this one.
+
+        Args:
+            key: Node key
+
+        Returns:
+            The parent's node, or None if the metric has no parent or the node was not computed
+        """
+        parent = self.metric.parent
+        if parent is None or "context" not in parent.__dict__:
+            return None
+        return parent.context._nodes.get(key)
+
+    def computed(self) -> list:
+        """
+        Get the keys of the nodes computed so far.
+
+        Returns:
+            List of node keys
+        """
+        return list(self._nodes)
+
+    def clear(self) -> None:
+        """Drop all memoized nodes, e.g. to release memory."""
+        self._nodes.clear()
+
+    def christoffel(self, workers: Optional[int] = None, lazy: bool = False,
+                    simplify_level: Optional[int] = None, method: str = "auto"):
+        """
+        Get the Christoffel symbols of the metric.
+
+        Args:
+            workers: Number of processes used to simplify components
+            lazy: Compute components on first access if they are not memoized yet; a lazy
+                  node requested without ``lazy`` computes its remaining components
+            simplify_level: Level the symbols are needed at; defaults to the final level
+            method: Algorithm for the symbols (see ChristoffelSymbols); it is part of the
+                    node key after "auto" is resolved with ``ChristoffelSymbols.choose_method``
+
+        Returns:
+            ChristoffelSymbols instance
+        """
+        from .christoffel import ChristoffelSymbols
+
+        level = self.final_level if simplify_level is None else simplify_level
+        method = ChristoffelSymbols.choose_method(self.metric, method)
+        key = ("christoffel", method)
+        kind = f"christoffel:{method}"
+        # The update from the parent's symbols does not depend on how they were computed
+        parent = self._parent_node(key) or self._parent_node(
+            ("christoffel", "formula" if method == "lagrangian" else "lagrangian"))
+        node = self._node(
+            key, level,
+            lambda level: ChristoffelSymbols(metric=self.metric, workers=workers, lazy=lazy,
+                                             simplify_level=level, method=method, parent=parent),
+            kind=kind,
+            restore=lambda components: ChristoffelSymbols(components=components, metric=self.metric,
+                                                          workers=workers, method=method),
+            dump=lambda christoffel: None if christoffel.lazy else christoffel.components,
+        )
+
+        if node.lazy and not lazy:
+            # Compute the components the lazy node has not computed yet
+            node.components
+            node.lazy = False
+            cache = get_disk_cache()
+            if cache is not None and node.simplify_level >= self.final_level:
+                self._store(cache, kind, node.components)
+        return node
+
+    def riemann(self, simplify_level: Optional[int] = None, workers: Optional[int] = None):
+        """
+        Get the Riemann tensor of the metric.
+
+        Args:
+            simplify_level: Level the tensor is needed at; defaults to the final level
+            workers: Number of processes used to simplify components
+
+        Returns:
+            RiemannTensor instance
+        """
+        from .riemann import RiemannTensor
+
+        level = self.final_level if simplify_level is None else simplify_level
+
+        def build(level):
+            christoffel = self.christoffel(workers=workers, simplify_level=self.intermediate_level)
+            return RiemannTensor.from_christoffel(christoffel, simplify_level=level, workers=workers,
+                                                  parent=self._parent_node("riemann"))
+
+        def restore(data):
+            components_up, components_down = data
+            return RiemannTensor(components_up=components_up, components_down=components_down,
+                                 christoffel=self.christoffel(workers=workers, simplify_level=self.intermediate_level),
+                                 simplify_level=self.final_level, workers=workers)
+
+        return self._node("riemann", level, build, kind="riemann", restore=restore,
+                          dump=lambda riemann: (riemann.components_up, riemann.components_down))
+
+    def ricci_tensor(self, workers: Optional[int] = None, simplify_level: Optional[int] = None):
+        """
+        Get the Ricci tensor of the metric, computed directly from the Christoffel symbols.
+
+        Args:
+            workers: Number of processes used to simplify components
+            simplify_level: Level the tensor is needed at; defaults to the final level
+
+        Returns:
+            RicciTensor instance
+        """
+        from .ricci import RicciTensor
+
+        level = self.final_level if simplify_level is None else simplify_level
+
+        def build(level):
+            christoffel = self.christoffel(workers=workers, simplify_level=self.intermediate_level)
+            return RicciTensor.from_christoffel(christoffel, workers=workers, simplify_level=level,
+                                                parent=self._parent_node("ricci"))
+
+        return self._node(
+            "ricci", level, build, kind="ricci",
+            restore=lambda components: RicciTensor(components=components, metric=self.metric, workers=workers),
+            dump=lambda ricci: ricci.components,
+        )
+
+    def ricci_scalar(self, workers: Optional[int] = None, simplify_level: Optional[int] = None):
+        """
+        Get the Ricci scalar of the metric.
+
+        Args:
+            workers: Number of processes used to simplify components of the Ricci tensor
+            simplify_level: Level the scalar is needed at; defaults to the final level
+
+        Returns:
+            RicciScalar instance
+        """
+        from .ricci import RicciScalar
+
+        level = self.final_level if simplify_level is None else simplify_level
+
+        def build(level):
+            ricci = self.ricci_tensor(workers=workers, simplify_level=self.intermediate_level)
+            return RicciScalar.from_ricci(ricci, simplify_level=level)
+
+        return self._node("ricci_scalar", level, build)
+
+    def einstein(self, workers: Optional[int] = None, simplify_level: Optional[int] = None):
+        """
+        Get the Einstein tensor of the metric.
+
+        Args:
+            workers: Number of processes used to simplify components
+            simplify_level: Level the tensor is needed at; defaults to the final level
+
+        Returns:
+            EinsteinTensor instance
+        """
+        from .einstein import EinsteinTensor
+
+        level = self.final_level if simplify_level is None else simplify_level
+
+        def build(level):
+            intermediate = self.intermediate_level
+            return EinsteinTensor.from_ricci(self.ricci_tensor(workers=workers, simplify_level=intermediate),
+                                             self.ricci_scalar(workers=workers, simplify_level=intermediate),
+                                             workers=workers, simplify_level=level,
+                                             parent=self._parent_node("einstein"))
+
+        def restore(data):
+            components_lower, components_upper = data
+            return EinsteinTensor(components_lower=components_lower, components_upper=components_upper,
+                                  metric=self.metric, workers=workers)
+
+        return self._node("einstein", level, build, kind="einstein", restore=restore,
+                          dump=lambda einstein: (einstein.components_lower, einstein.components_upper))
+
+    def weyl(self, simplify_level: Optional[int] = None, workers: Optional[int] = None):
+        """
+        Get the Weyl tensor of the metric, built from the Riemann and Ricci tensors.
+
+        Args:
+            simplify_level: Level of simplification to apply (0 - 3); defaults to the final level
+            workers: Number of processes used to simplify components
+
+        Returns:
+            WeylTensor instance
+        """
+        from .weyl import WeylTensor
+
+        level = self.final_level if simplify_level is None else simplify_level
+
+        def build(level):
+            intermediate = self.intermediate_level
+            return WeylTensor.from_riemann(self.riemann(simplify_level=intermediate, workers=workers),
+                                           self.ricci_tensor(workers=workers, simplify_level=intermediate),
+                                           self.ricci_scalar(workers=workers, simplify_level=intermediate),
+                                           simplify_level=level, workers=workers)
+
+        # The level is part of the key, so a Weyl node is never finalized in place
+        return self._node(("weyl", level), level, build)
+
+    def invariants(self, simplify_level: Optional[int] = None):
+        """
+        Get the curvature invariants calculator of the metric.
+
+        Args:
+            simplify_level: Level of simplification to apply (0 - 3); defaults to the final level
+
+        Returns:
+            CurvatureInvariants instance
+        """
+        from .curvature import CurvatureInvariants
+
+        level = self.final_level if simplify_level is None else simplify_level
+        return self._node(("invariants", level), level,
+                          lambda level: CurvatureInvariants(metric=self.metric, simplify_level=level))
@@ -2,15 +2,21 @@
 Curvature invariants for spacetimes in general relativity.
 
 This module provides functionality to compute various scalar curvature invariants
-of a spacetime, such as the Kretschmann scalar, Chern - Pontryagin scalar, and Euler scalar.
+of a spacetime, such as the Kretschmann scalar, Weyl scalar, Chern - Pontryagin scalar,
+and Euler scalar.
 These invariants are useful for characterizing spacetime geometries and singularities.
 """
 
 import sympy as sp
+import functools
+import time
+import warnings
 from .riemann import RiemannTensor
+from .ricci import RicciTensor, RicciScalar
+from .weyl import WeylTensor
+from .registry import lookup_invariant
 from .utils import custom_simplify
-from sympy import sin, cos, sqrt
-from typing import Optional
+from typing import Dict, List, Optional
 from .metric import Metric
 
 class CurvatureInvariants:
@@ -22,101 +28,129 @@ class CurvatureInvariants:
         riemann: RiemannTensor instance for the metric
         ricci: RicciTensor instance for the metric
         ricci_scalar: RicciScalar instance for the metric
+        weyl: WeylTensor instance for the metric
         dim: Dimension of the spacetime
+        timings: Seconds spent on each step of the last ``compute_all`` call
     """
 
+    # Invariants evaluated by compute_all, in order, and the dimension they need (None for any)
+    INVARIANTS = {
+        "kretschmann": None,
+        "ricci_squared": None,
+        "ricci_scalar_squared": None,
+        "weyl_squared": None,
+        "euler": 4,
+        "chern_pontryagin": 4,
+    }
+
     def __init__(self,
                  metric: Optional[Metric] = None,
                  riemann: Optional[RiemannTensor] = None,
-                 simplify_level: int = 2):
+                 simplify_level: Optional[int] = None):
         """
         Initialize curvature invariants calculator.
 
         Args:
             metric: A Metric object representing the spacetime
             riemann: Optional pre - computed Riemann tensor
-            simplify_level: Level of simplification to apply (0 - 3)
+            simplify_level: Level of simplification to apply (0 - 3); defaults to the
+                            metric's simplify_level
         """
         # Initialize cache attributes
         self._kretschmann = None
         self._euler = None
         self._chern_pontryagin = None
+        self._ricci_squared = None
+        self._ricci_scalar_squared = None
+        self._weyl_squared = None
+        self.timings: Dict[str, float] = {}
 
         # Set basic attributes
-        self.simplify_level = simplify_level
         self.metric = metric or (riemann.metric if riemann else None)
 
         if self.metric is None:
             raise ValueError("Either metric or Riemann tensor must be provided")
 
+        self.simplify_level = simplify_level if simplify_level is not None else self.metric.simplify_level
+
         # Get metric components and dimension
         self.g = self.metric.g
         self.g_inv = self.metric.inverse
         self.dim = self.metric.dimension
 
-        # Set up riemann tensor
-        self.riemann = riemann
-        if self.riemann is None and self.metric is not None:
-            from .riemann import RiemannTensor
-            self.riemann = RiemannTensor.from_metric(self.metric, simplify_level=self.simplify_level)
-
-    def _is_schwarzschild(self):
-        """Check if this is a Schwarzschild metric."""
-        if self.metric is None or self.metric.dimension != 4:
-            return False
-
-        # Check basic properties of Schwarzschild
-        if len(self.metric.coordinates) != 4 or len(self.metric.params) != 1:
-            return False
-
-        # Check coordinate names
-        coord_names = [str(c) for c in self.metric.coordinates]
-        if not ('t' in coord_names[0] and 'r' in coord_names[1] and
-                'theta' in coord_names[2] and 'phi' in coord_names[3]):
-            return False
-
-        # Check metric form
-        t, r, theta, phi = self.metric.coordinates
-        M = self.metric.params[0]
-
-        expected_g00 = -(1 - 2 * M/r)
-
-        return sp.simplify(self.metric.g[0, 0] - expected_g00) == 0
-
-    def _is_kerr(self):
-        """Check if this is a Kerr metric."""
-        if self.metric is None or self.metric.dimension != 4:
-            return False
-
-        # Check if we have the typical parameters M and a
-        if len(self.metric.coordinates) != 4:
-            return False
-
-        # Check coordinate names
-        coord_names = [str(c) for c in self.metric.coordinates]
-        
-        # If any t, r, theta, phi coordinates are in the metric and there's a t-phi cross-term,
-        # it's likely a Kerr-type metric
-        if ('t' in coord_names[0] and 'r' in coord_names[1] and 
-            'theta' in coord_names[2] and 'phi' in coord_names[3]):
-            
-            # Check for off-diagonal t-phi component characteristic of Kerr
-            if abs(self.metric.g[0,3]) > 0:
-                return True
-        
-        return False
-
-    def _is_flat(self):
-        """Check if this is a flat metric."""
-        if self.metric is None:
-            return False
+        self._riemann = riemann
+
+    @functools.cached_property
+    def riemann(self) -> RiemannTensor:
+        """
+        Get the Riemann tensor, computing it on first access.
+
+        Unless one was passed in, the tensor comes from the metric's computation
+        context. Invariants of registered spacetimes are looked up without it.
 
-        # For Minkowski space
-        if self.metric.dimension == 4:
-            diag_vals = [self.metric.g[i, i] for i in range(4)]
-            return diag_vals == [-1, 1, 1, 1] and all(self.metric.g[i, j] == 0 for i in range(4) for j in range(4) if i != j)
+        Returns:
+            RiemannTensor instance for the metric
+        """
+        if self._riemann is not None:
+            return self._riemann
+        return RiemannTensor.from_metric(self.metric, simplify_level=self.simplify_level)
 
-        return False
+    @functools.cached_property
+    def ricci(self) -> 'RicciTensor':
+        """
+        Get the Ricci tensor, computing it on first access.
+
+        It is contracted from the Riemann tensor if one was passed in, and taken from
+        the metric's computation context otherwise.
+
+        Returns:
+            RicciTensor instance for the metric
+        """
+        if self._riemann is not None:
+            return RicciTensor.from_riemann(self._riemann)
+        context = self.metric.context
+        return context.ricci_tensor(simplify_level=context.intermediate_level)
+
+    @functools.cached_property
+    def ricci_scalar(self) -> 'RicciScalar':
+        """
+        Get the Ricci scalar, computing it on first access.
+
+        Returns:
+            RicciScalar instance for the metric
+        """
+        if self._riemann is not None:
+            return RicciScalar.from_ricci(self.ricci)
+        context = self.metric.context
+        return context.ricci_scalar(simplify_level=context.intermediate_level)
+
+    @functools.cached_property
+    def weyl(self) -> 'WeylTensor':
+        """
+        Get the Weyl tensor, built on first access from the shared Riemann and Ricci tensors.
+
+        Returns:
+            WeylTensor instance for the metric
+        """
+        return WeylTensor.from_riemann(self.riemann, self.ricci, self.ricci_scalar, simplify_level=self.simplify_level)
+
+    @functools.cached_property
+    def ricci_mixed(self) -> sp.Matrix:
+        """
+        Get the Ricci tensor with the first index raised: R^a_b = g^ai R_ib.
+
+        Returns:
+            SymPy Matrix of the mixed Ricci tensor
+        """
+        n = self.dim
+        R_ab = self.ricci.components
+        rows = [[i for i in range(n) if self.g_inv[a, i] != 0] for a in range(n)]
+
+        mixed = sp.zeros(n, n)
+        for a in range(n):
+            for b in range(n):
+                mixed[a, b] = sum((self.g_inv[a, i] * R_ab[i, b] for i in rows[a] if R_ab[i, b] != 0), sp.S.Zero)
+        return mixed
 
     def kretschmann_scalar(self, simplify_level=None):
         """
@@ -135,72 +169,165 @@ class CurvatureInvariants:
         if self._kretschmann is not None:
             return self._kretschmann
 
-        # Use optimization for known metrics
-        if self._is_flat():
-            self._kretschmann = sp.S.Zero
+        # Exact precomputed value for the spacetimes in itensorpy.spacetimes
+        registered = lookup_invariant(self.metric, "kretschmann")
+        if registered is not None:
+            self._kretschmann = registered
             return self._kretschmann
 
-        if self._is_schwarzschild():
-            # Use the known formula for Schwarzschild
-            r = self.metric.coordinates[1]
-            M = self.metric.params[0]
-            self._kretschmann = 48 * M**2 / r**6
-            return self._kretschmann
+        # General case for arbitrary metrics
+        result = self._riemann_square()
 
-        if self._is_kerr():
-            # Use optimization for Kerr metric calculation
-            r, theta = self.metric.coordinates[1], self.metric.coordinates[2]
-            M, a = self.metric.params[0], self.metric.params[1]
+        level = simplify_level if simplify_level is not None else self.simplify_level
+        if level > 0:
+            result = custom_simplify(result, level)
 
-            # Simplified Kretschmann scalar for Kerr (this is a complex expression)
-            # Value varies with theta, so we compute for equatorial plane (theta=pi / 2) if requested
-            rho2 = r**2 + (a * cos(theta))**2
+        self._kretschmann = result
+        return result
 
-            self._kretschmann = 48 * M**2 * (r**6 - 15 * a**2 * r**4 * cos(theta)**2 +
-                                      15 * a**4 * r**2 * cos(theta)**4 - a**6 * cos(theta)**6) / rho2**6
+    def _riemann_square(self) -> sp.Expr:
+        """
+        Contract the Riemann tensor with itself: R_abcd R^abcd = R^ab_cd R^cd_ab.
 
-            level = simplify_level if simplify_level is not None else self.simplify_level
-            if level > 0:
-                self._kretschmann = custom_simplify(self._kretschmann, level)
+        The mixed tensor R^ab_cd is raised once (``RiemannTensor.components_mixed``).
+        Only index pairs P = (a, b) and Q = (c, d) with a < b and c < d are visited,
+        each with its multiplicity: 4 for P = Q and 8 for P < Q, whose term
+        R^P_Q R^Q_P also stands for R^Q_P R^P_Q.
 
-            return self._kretschmann
+        Returns:
+            sympy.Expr: The unsimplified contraction
+        """
+        n = self.dim
+        R_mixed = self.riemann.components_mixed
+        pairs = [(a, b) for a in range(n) for b in range(a + 1, n)]
+
+        result = sp.S.Zero
+        for p, (a, b) in enumerate(pairs):
+            for q in range(p, len(pairs)):
+                c, d = pairs[q]
+                if R_mixed[a][b][c][d] == 0 or R_mixed[c][d][a][b] == 0:
+                    continue
+                multiplicity = 4 if p == q else 8
+                result += multiplicity * R_mixed[a][b][c][d] * R_mixed[c][d][a][b]
 
-        # General case for arbitrary metrics
+        return result
+
+    def _ricci_square(self) -> sp.Expr:
+        """
+        Contract the Ricci tensor with itself: R_ab R^ab = R^a_b R^b_a.
+
+        Returns:
+            sympy.Expr: The unsimplified contraction
+        """
         n = self.dim
-        R_abcd = self.riemann.components_down
-        g_inv = self.g_inv
+        mixed = self.ricci_mixed
 
-        # Compute R_{abcd}R^{abcd}
-        result = 0
+        result = sp.S.Zero
         for a in range(n):
-            for b in range(n):
-                for c in range(n):
-                    for d in range(n):
-                        # Compute R^{abcd}
-                        R_up_abcd = 0
-                        for i in range(n):
-                            for j in range(n):
-                                for k in range(n):
-                                    for l in range(n):
-                                        R_up_abcd += g_inv[a, i] * g_inv[b, j] * g_inv[c, k] * g_inv[d, l] * R_abcd[i][j][k][l]
-
-                        # Add to contraction
-                        result += R_abcd[a][b][c][d] * R_up_abcd
+            if mixed[a, a] != 0:
+                result += mixed[a, a]**2
+            for b in range(a + 1, n):
+                if mixed[a, b] != 0 and mixed[b, a] != 0:
+                    result += 2 * mixed[a, b] * mixed[b, a]
+        return result
+
+    def ricci_squared(self, simplify_level=None):
+        """
+        Calculate the square of the Ricci tensor: R_{ab}R^{ab}
+
+        Args:
+            simplify_level: Override the default simplification level
+
+        Returns:
+            sympy.Expr: The contraction R_{ab}R^{ab}
+        """
+        if self._ricci_squared is not None:
+            return self._ricci_squared
+
+        result = self._ricci_square()
 
         level = simplify_level if simplify_level is not None else self.simplify_level
         if level > 0:
             result = custom_simplify(result, level)
 
-        self._kretschmann = result
+        self._ricci_squared = result
+        return result
+
+    def ricci_scalar_squared(self, simplify_level=None):
+        """
+        Calculate the square of the Ricci scalar: R^2
+
+        Args:
+            simplify_level: Override the default simplification level
+
+        Returns:
+            sympy.Expr: The squared Ricci scalar
+        """
+        if self._ricci_scalar_squared is not None:
+            return self._ricci_scalar_squared
+
+        result = self.ricci_scalar.value**2
+
+        level = simplify_level if simplify_level is not None else self.simplify_level
+        if level > 0:
+            result = custom_simplify(result, level)
+
+        self._ricci_scalar_squared = result
+        return result
+
+    def weyl_squared(self, simplify_level=None):
+        """
+        Calculate the square of the Weyl tensor: C_{abcd}C^{abcd}
+
+        Instead of contracting the Weyl tensor, the decomposition of the Riemann tensor gives
+
+            C_{abcd}C^{abcd} = R_{abcd}R^{abcd} - 4/(n-2) R_{ab}R^{ab} + 2/((n-1)(n-2)) R^2
+
+        from the contractions shared with the Kretschmann and Euler scalars. The Weyl
+        tensor vanishes identically for n <= 3.
+
+        Args:
+            simplify_level: Override the default simplification level
+
+        Returns:
+            sympy.Expr: The contraction C_{abcd}C^{abcd}
+        """
+        if self._weyl_squared is not None:
+            return self._weyl_squared
+
+        n = self.dim
+        if n <= 3:
+            self._weyl_squared = sp.S.Zero
+            return self._weyl_squared
+
+        result = (self._riemann_square() - sp.Rational(4, n - 2) * self._ricci_square()
+                  + sp.Rational(2, (n - 1) * (n - 2)) * self.ricci_scalar.value**2)
+
+        level = simplify_level if simplify_level is not None else self.simplify_level
+        if level > 0:
+            result = custom_simplify(result, level)
+
+        self._weyl_squared = result
         return result
 
     def chern_pontryagin_scalar(self, simplify_level=None):
         """
         Compute the Chern-Pontryagin scalar (also called the Hirzebruch signature).
 
-        The Chern-Pontryagin scalar is defined as R_{abcd}*R^{abcd} where * is the Hodge dual.
+        The Chern-Pontryagin scalar is defined as *R_{abcd}R^{abcd} where * is the Hodge dual.
         It's a measure of gravitational parity violation.
 
+        It is evaluated as (1/2) ε^{abmn} R_{mncd} R_{ab}^{cd} with the Levi-Civita tensor
+        ε^{abmn} = [abmn] / √|g|, where [abmn] is the permutation symbol with [0123] = 1 and
+        √|g| is the metric's ``volume_element``. Of the 24 non - zero permutations
+        (a, b, m, n), the four that only reorder {a, b} and {m, n} give the same term, so
+        six pairs are visited.
+
+        This convention leaves out the factor sign(g): raising the indices of
+        ε_{abmn} = √|g| [abmn] gives ε^{abmn} = sign(g) [abmn] / √|g|. For a Lorentzian
+        metric the scalar returned here is therefore minus the one built with the raised
+        tensor, e.g. +96 a M² r cos θ (3r² - a² cos² θ)(r² - 3a² cos² θ) / Σ⁶ for Kerr.
+
         Args:
             simplify_level: Override the default simplification level
 
@@ -215,61 +342,34 @@ class CurvatureInvariants:
         if self.dim != 4:
             raise ValueError("Chern-Pontryagin scalar is only defined for 4-dimensional spacetimes")
 
-        # Use optimization for known metrics
-        if self._is_flat():
-            self._chern_pontryagin = sp.S.Zero
+        # Exact precomputed value for the spacetimes in itensorpy.spacetimes
+        registered = lookup_invariant(self.metric, "chern_pontryagin")
+        if registered is not None:
+            self._chern_pontryagin = registered
             return self._chern_pontryagin
 
-        if self._is_schwarzschild():
-            # Schwarzschild has zero Chern-Pontryagin scalar due to symmetry
+        # R_mncd and R^cd_ab = R_ab^cd, the latter raised once and shared with the Kretschmann scalar
+        R_down = self.riemann.components_down
+        R_mixed = self.riemann.components_mixed
+        pairs = [(a, b) for a in range(4) for b in range(a + 1, 4)]
+
+        result = sp.S.Zero
+        for a, b in pairs:
+            m, n = [index for index in range(4) if index not in (a, b)]
+            term = sp.S.Zero
+            for c, d in pairs:
+                if R_down[m][n][c][d] != 0 and R_mixed[c][d][a][b] != 0:
+                    term += R_down[m][n][c][d] * R_mixed[c][d][a][b]
+            result += sp.LeviCivita(a, b, m, n) * term
+
+        if result == 0:
+            # No Levi-Civita term survives (e.g. Schwarzschild), so the volume element and
+            # with it the signature are not needed
             self._chern_pontryagin = sp.S.Zero
             return self._chern_pontryagin
 
-        # For general metrics, compute explicitly but more efficiently
-        # Get the Riemann tensor
-        R_abcd = self.riemann.components_down
-        g = self.g
-        g_inv = self.g_inv
-
-        # Get the determinant of the metric
-        g_det = g.det()
-
-        # Use dual Riemann tensor formula more efficiently
-        # Pre-compute the Levi-Civita tensor with metric determinant factor
-        def levi_civita_tensor(a, b, c, d):
-            return (1/(2 * sp.sqrt(abs(g_det)))) * sp.LeviCivita(a, b, c, d)
-        
-        # Compute the result with better algorithm structure
-        result = 0
-        
-        # Pre-compute the dual Riemann tensor (this reduces nested loops)
-        dual_riemann = [[[[0 for _ in range(4)] for _ in range(4)] for _ in range(4)] for _ in range(4)]
-        
-        # Calculate the dual Riemann tensor components needed
-        for a in range(4):
-            for b in range(4):
-                for c in range(4):
-                    for d in range(4):
-                        dual_riemann[a][b][c][d] = 0
-                        for m in range(4):
-                            for n in range(4):
-                                dual_riemann[a][b][c][d] += levi_civita_tensor(a, b, m, n) * R_abcd[m][n][c][d]
-        
-        # Now compute the contraction more efficiently
-        for a in range(4):
-            for b in range(4):
-                for c in range(4):
-                    for d in range(4):
-                        # Get the raised indices version directly
-                        R_raised = 0
-                        for i in range(4):
-                            for j in range(4):
-                                for k in range(4):
-                                    for l in range(4):
-                                        R_raised += g_inv[a, i] * g_inv[b, j] * g_inv[c, k] * g_inv[d, l] * R_abcd[i][j][k][l]
-                                        
-                        # Add to result
-                        result += dual_riemann[a][b][c][d] * R_raised
+        # (1/2) from the dual, 4 orderings of (a, b, m, n) and 2 of (c, d)
+        result = 4 * result / self.metric.volume_element
 
         # Apply simplification if needed
         level = simplify_level if simplify_level is not None else self.simplify_level
@@ -300,62 +400,21 @@ class CurvatureInvariants:
         if self.dim != 4:
             raise ValueError("Euler scalar is only defined for 4-dimensional spacetimes")
 
-        # Use optimization for known metrics
-        if self._is_flat():
-            self._euler = sp.S.Zero
-            return self._euler
-
-        if self._is_schwarzschild():
-            # For Schwarzschild, calculate the actual value rather than assuming 0
-            r = self.metric.coordinates[1]
-            M = self.metric.params[0]
-            # Real formula for Schwarzschild's Euler scalar (Gauss - Bonnet term)
-            # Note: The actual value is not zero
-            self._euler = -24 * M**2 / r**6
+        # Exact precomputed value for the spacetimes in itensorpy.spacetimes
+        registered = lookup_invariant(self.metric, "euler")
+        if registered is not None:
+            self._euler = registered
             return self._euler
 
-        # For general metrics, compute each term
-        from .ricci import RicciTensor, RicciScalar
-        R_abcd = self.riemann.components_down
-        ricci = RicciTensor.from_riemann(self.riemann)
-        scalar = RicciScalar.from_ricci(ricci)
-        R = scalar.scalar
-        R_ab = ricci.components
-        g_inv = self.g_inv
-
-        # Term 1: R_{abcd}R^{cdab}
-        term1 = 0
-        for a in range(self.dim):
-            for b in range(self.dim):
-                for c in range(self.dim):
-                    for d in range(self.dim):
-                        # Compute R^{cdab}
-                        R_up_cdab = 0
-                        for i in range(self.dim):
-                            for j in range(self.dim):
-                                for k in range(self.dim):
-                                    for m in range(self.dim):
-                                        R_up_cdab += g_inv[c, i] * g_inv[d, j] * g_inv[a, k] * g_inv[b, m] * R_abcd[i][j][k][m]
-
-                        # Add to contraction
-                        term1 += R_abcd[a][b][c][d] * R_up_cdab
+        # For general metrics, compute each term from the shared Riemann and Ricci tensors
+        # Term 1: R_{abcd}R^{cdab} = R_{abcd}R^{abcd}
+        term1 = self._riemann_square()
 
         # Term 2: -4R_{ab}R^{ab}
-        term2 = 0
-        for a in range(self.dim):
-            for b in range(self.dim):
-                # Compute R^{ab}
-                R_up_ab = 0
-                for i in range(self.dim):
-                    for j in range(self.dim):
-                        R_up_ab += g_inv[a, i] * g_inv[b, j] * R_ab[i, j]
-
-                # Add to contraction
-                term2 += R_ab[a, b] * R_up_ab
-        term2 *= -4
+        term2 = -4 * self._ricci_square()
 
         # Term 3: R^2
-        term3 = R**2
+        term3 = self.ricci_scalar.value**2
 
         # Combine terms
         result = term1 + term2 + term3
@@ -367,6 +426,78 @@ class CurvatureInvariants:
         self._euler = result
         return result
 
+    def compute_all(self, invariants: Optional[List[str]] = None, simplify_level=None) -> Dict[str, sp.Expr]:
+        """
+        Evaluate several invariants in one sweep over shared tensors.
+
+        The Riemann tensor, its mixed form R^ab_cd, the Ricci tensor, its mixed form
+        R^a_b and the Ricci scalar are built once up front; every invariant is then a
+        contraction of them. The volume element is only built by the Chern-Pontryagin
+        scalar, and only if one of its terms survives. The seconds spent on each step are
+        stored in ``timings``, under "tensors" for the shared tensors and under the name
+        of each invariant.
+
+        When the default set is evaluated, an invariant that raises ValueError is left
+        out of the result with a warning instead of aborting the others.
+
+        Args:
+            invariants: Names from ``INVARIANTS``; defaults to every invariant defined
+                        in the metric's dimension
+            simplify_level: Override the default simplification level
+
+        Returns:
+            Dictionary mapping invariant names to their values
+
+        Raises:
+            ValueError: If an invariant is unknown or not defined in the metric's dimension
+        """
+        default = invariants is None
+        if default:
+            invariants = [name for name, dim in self.INVARIANTS.items() if dim in (None, self.dim)]
+
+        for name in invariants:
+            if name not in self.INVARIANTS:
+                raise ValueError(f"Unknown curvature invariant: {name}")
+            if self.INVARIANTS[name] not in (None, self.dim):
+                raise ValueError(f"The {name} invariant is only defined for "
+                                 f"{self.INVARIANTS[name]}-dimensional spacetimes")
+
+        methods = {
+            "kretschmann": self.kretschmann_scalar,
+            "ricci_squared": self.ricci_squared,
+            "ricci_scalar_squared": self.ricci_scalar_squared,
+            "weyl_squared": self.weyl_squared,
+            "euler": self.euler_scalar,
+            "chern_pontryagin": self.chern_pontryagin_scalar,
+        }
+
+        self.timings = {}
+        start_time = time.time()
+        # Invariants registered for the spacetime are looked up without the tensors
+        pending = {name for name in invariants if lookup_invariant(self.metric, name) is None}
+        if pending & {"kretschmann", "weyl_squared", "euler", "chern_pontryagin"}:
+            self.riemann.components_mixed
+        if "chern_pontryagin" in pending:
+            self.riemann.components_down
+        if pending & {"ricci_squared", "ricci_scalar_squared", "weyl_squared", "euler"}:
+            self.ricci_mixed
+            self.ricci_scalar
+        self.timings["tensors"] = time.time() - start_time
+
+        results = {}
+        for name in invariants:
+            start_time = time.time()
+            try:
+                results[name] = methods[name](simplify_level=simplify_level)
+            except ValueError as error:
+                if not default:
+                    raise
+                warnings.warn(f"Skipping the {name} invariant: {error}", stacklevel=2)
+                continue
+            self.timings[name] = time.time() - start_time
+
+        return results
+
     def kretschmann(self):
         """Alias for kretschmann_scalar method."""
         return self.kretschmann_scalar()
@@ -3,12 +3,13 @@ Module for computing and manipulating the Einstein tensor.
 """
 
 import sympy as sp
+import functools
 from sympy import Matrix, Symbol, Expr, Rational
 from typing import List, Dict, Tuple, Union, Optional
 
 from .metric import Metric
 from .ricci import RicciTensor, RicciScalar
-from .utils import custom_simplify, generate_index_ricci
+from .utils import generate_index_ricci, numeric_zero_test, simplify_components, simplify_to_level
 
 
 class EinsteinTensor:
@@ -24,7 +25,10 @@ class EinsteinTensor:
                  components_upper=None,
                  ricci_tensor: Optional[RicciTensor] = None,
                  ricci_scalar: Optional[RicciScalar] = None,
-                 metric: Optional[Metric] = None):
+                 metric: Optional[Metric] = None,
+                 workers: Optional[int] = None,
+                 simplify_level: Optional[int] = None,
+                 parent: Optional['EinsteinTensor'] = None):
         """
         Initialize the Einstein tensor.
 
@@ -34,28 +38,54 @@ class EinsteinTensor:
             ricci_tensor: Ricci tensor used to compute the Einstein tensor
             ricci_scalar: Ricci scalar used to compute the Einstein tensor
             metric: Metric tensor, needed for computing and raising / lowering indices
+            workers: Number of processes used to simplify components (None uses the global default)
+            simplify_level: Level of simplification to apply (0 - 3); defaults to the
+                            metric's simplify_level
+            parent: Optional Einstein tensor of ``metric.parent`` (see ``Metric.with_component``);
+                    if the Ricci tensor was updated from the parent's, the components
+                    that do not depend on changed quantities are copied from it
         """
         self.components_lower = components_lower
         self.components_upper = components_upper
+        self._components_mixed = None
         self.ricci_tensor = ricci_tensor
         self.ricci_scalar = ricci_scalar
         self.metric = metric or (ricci_tensor.metric if ricci_tensor else None)
+        self.workers = workers
+        if simplify_level is None:
+            simplify_level = self.metric.simplify_level if self.metric is not None else 2
+        self.simplify_level = simplify_level
+
+        # Components G_μν recomputed from a parent and the subset whose value differs
+        # from the parent's; None without a parent
+        self.recomputed = None
+        self.changed = None
 
         # Compute Einstein tensor if necessary components are available
         if components_lower is None and ricci_tensor is not None and ricci_scalar is not None:
-            self.components_lower = self._compute_einstein_tensor_lower()
+            if not self._can_update(parent):
+                parent = None
+            self.components_lower = self._compute_einstein_tensor_lower(parent)
+            if components_upper is None and self.metric is not None:
+                self.components_upper = self._compute_einstein_tensor_upper(parent)
 
-        if components_upper is None and self.components_lower is not None and self.metric is not None:
+        if self.components_upper is None and self.components_lower is not None and self.metric is not None:
             self.components_upper = self._compute_einstein_tensor_upper()
 
     @classmethod
-    def from_ricci(cls, ricci_tensor: RicciTensor, ricci_scalar: RicciScalar) -> 'EinsteinTensor':
+    def from_ricci(cls, ricci_tensor: RicciTensor, ricci_scalar: RicciScalar,
+                   workers: Optional[int] = None, simplify_level: Optional[int] = None,
+                   parent: Optional['EinsteinTensor'] = None) -> 'EinsteinTensor':
         """
         Create an Einstein tensor from Ricci tensor and scalar.
 
         Args:
             ricci_tensor: Ricci tensor instance
             ricci_scalar: Ricci scalar instance
+            workers: Number of processes used to simplify components (None uses the global default)
+            simplify_level: Level of simplification to apply (0 - 3); defaults to the
+                            metric's simplify_level
+            parent: Optional Einstein tensor of the parent metric (see EinsteinTensor)
 
         Returns:
             EinsteinTensor instance
@@ -64,27 +94,49 @@ class EinsteinTensor:
         if ricci_tensor.metric != ricci_scalar.metric:
             raise ValueError("Ricci tensor and scalar must share the same metric")
 
-        return cls(ricci_tensor=ricci_tensor, ricci_scalar=ricci_scalar, metric=ricci_tensor.metric)
+        return cls(ricci_tensor=ricci_tensor, ricci_scalar=ricci_scalar, metric=ricci_tensor.metric,
+                   workers=workers, simplify_level=simplify_level, parent=parent)
 
     @classmethod
-    def from_metric(cls, metric: Metric) -> 'EinsteinTensor':
+    def from_metric(cls, metric: Metric, workers: Optional[int] = None) -> 'EinsteinTensor':
         """
         Create an Einstein tensor directly from a metric tensor.
 
+        The tensor, and the Ricci tensor and scalar it is built from, are shared
+        through the metric's computation context.
+
         Args:
             metric: Metric tensor instance
+            workers: Number of processes used to simplify components (None uses the global default)
 
         Returns:
             EinsteinTensor instance
         """
-        ricci_tensor = RicciTensor.from_metric(metric)
-        ricci_scalar = RicciScalar.from_ricci(ricci_tensor)
-        return cls.from_ricci(ricci_tensor, ricci_scalar)
+        return metric.context.einstein(workers=workers)
+
+    def _can_update(self, parent: Optional['EinsteinTensor']) -> bool:
+        """
+        Check whether the tensor can be updated from the Einstein tensor of the parent metric.
+
+        Args:
+            parent: Einstein tensor of the parent metric, or None
+
+        Returns:
+            True if the Ricci tensor was updated from the parent's and parent holds both
+            index forms simplified at least as far as this instance
+        """
+        return (parent is not None and self.ricci_tensor.changed is not None
+                and parent.metric is self.metric.parent and parent.components_lower is not None
+                and parent.components_upper is not None and parent.simplify_level >= self.simplify_level)
 
-    def _compute_einstein_tensor_lower(self) -> Matrix:
+    def _compute_einstein_tensor_lower(self, parent: Optional['EinsteinTensor'] = None) -> Matrix:
         """
         Compute the Einstein tensor with lower indices.
 
+        Args:
+            parent: Optional Einstein tensor of the parent metric; G_μν is copied from it
+                    unless R_μν or g_μν changed, or R changed and g_μν is non - zero
+
         Returns:
             SymPy Matrix representing the Einstein tensor with lower indices
         """
@@ -106,19 +158,43 @@ class EinsteinTensor:
         G_lower = sp.zeros(n, n)
 
         # G_μν = R_μν - (1 / 2)Rg_μν
-        for mu in range(n):
-            for nu in range(n):
-                G_lower[mu, nu] = Ricci[mu, nu] - Rational(1, 2) * g[mu, nu] * R
-                G_lower[mu, nu] = custom_simplify(G_lower[mu, nu])
+        indices = [(mu, nu) for mu in range(n) for nu in range(n)]
+        if parent is not None:
+            scalar_changed = parent.ricci_scalar is None or parent.ricci_scalar.value != R
+            changed = self.ricci_tensor.changed | self.metric.changed_components
+
+            def affected(mu, nu):
+                return (min(mu, nu), max(mu, nu)) in changed or (scalar_changed and g[mu, nu] != 0)
+
+            for mu, nu in indices:
+                if not affected(mu, nu):
+                    G_lower[mu, nu] = parent.components_lower[mu, nu]
+            indices = [(mu, nu) for mu, nu in indices if affected(mu, nu)]
+
+        raw = [Ricci[mu, nu] - Rational(1, 2) * g[mu, nu] * R for mu, nu in indices]
+        values = simplify_components(raw, self.simplify_level, self.workers)
+        for (mu, nu), value in zip(indices, values):
+            G_lower[mu, nu] = value
+
+        if parent is not None:
+            self.recomputed = frozenset(indices)
+            self.changed = frozenset(index for index, value in zip(indices, values)
+                                     if value != parent.components_lower[index])
 
         return G_lower
 
-    def _compute_einstein_tensor_upper(self) -> Matrix:
+    def _compute_einstein_tensor_mixed(self, parent: Optional['EinsteinTensor'] = None) -> Matrix:
         """
-        Compute the Einstein tensor with upper indices.
+        Compute the Einstein tensor with the first index raised: G^μ_ν = g^μα G_αν.
+
+        The product only visits non - zero entries of the inverse metric and of G_αν.
+
+        Args:
+            parent: Optional Einstein tensor of the parent metric; G^μ_ν is copied from it
+                    unless g^μα changed or a G_αν with non - zero g^μα changed
 
         Returns:
-            SymPy Matrix representing the Einstein tensor with upper indices
+            SymPy Matrix representing the Einstein tensor with mixed indices
         """
         if self.components_lower is None:
             raise ValueError("Einstein tensor with lower indices required")
@@ -129,21 +205,144 @@ class EinsteinTensor:
         n = self.metric.dimension
         g_inv = self.metric.inverse
         G_lower = self.components_lower
+        rows = [[alpha for alpha in range(n) if g_inv[mu, alpha] != 0] for mu in range(n)]
+
+        G_mixed = sp.zeros(n, n)
+
+        indices = [(mu, nu) for mu in range(n) for nu in range(n)]
+        if parent is not None:
+            changed_rows = {index for index, _ in self.metric.changed_inverse}
+
+            def affected(mu, nu):
+                return mu in changed_rows or any((alpha, nu) in self.changed for alpha in rows[mu])
+
+            previous = parent.components_mixed
+            for mu, nu in indices:
+                if not affected(mu, nu):
+                    G_mixed[mu, nu] = previous[mu, nu]
+            indices = [(mu, nu) for mu, nu in indices if affected(mu, nu)]
+
+        raw = {}
+        for mu, nu in indices:
+            value = sum((g_inv[mu, alpha] * G_lower[alpha, nu] for alpha in rows[mu] if G_lower[alpha, nu] != 0),
+                        sp.S.Zero)
+            if value != 0:
+                raw[(mu, nu)] = value
+
+        keys = list(raw)
+        for (mu, nu), value in zip(keys, simplify_components((raw[key] for key in keys), self.simplify_level,
+                                                             self.workers)):
+            G_mixed[mu, nu] = value
+
+        return G_mixed
+
+    @functools.cached_property
+    def components_mixed(self) -> Matrix:
+        """
+        Get the Einstein tensor with the first index raised, G^μ_ν.
+
+        This is the form compared with a stress - energy tensor T^μ_ν. It is computed
+        along with the upper - index form, or on first access otherwise.
+
+        Returns:
+            SymPy Matrix representing the Einstein tensor with mixed indices
+        """
+        if self._components_mixed is None:
+            self._components_mixed = self._compute_einstein_tensor_mixed()
+        return self._components_mixed
+
+    def _compute_einstein_tensor_upper(self, parent: Optional['EinsteinTensor'] = None) -> Matrix:
+        """
+        Compute the Einstein tensor with upper indices.
+
+        G^μν = G^μ_β g^βν is a second sparse product with the mixed form, so each
+        component costs O(n) instead of O(n²). Since G^μν is symmetric, only μ <= ν
+        is computed.
+
+        Args:
+            parent: Optional Einstein tensor of the parent metric; the mixed form and
+                    G^μν are copied from it unless one of their factors changed
+
+        Returns:
+            SymPy Matrix representing the Einstein tensor with upper indices
+        """
+        if self._components_mixed is None:
+            self._components_mixed = self._compute_einstein_tensor_mixed(parent)
+
+        n = self.metric.dimension
+        g_inv = self.metric.inverse
+        G_mixed = self._components_mixed
+        columns = [[beta for beta in range(n) if g_inv[beta, nu] != 0] for nu in range(n)]
 
         # Create a matrix to store Einstein tensor components with upper indices
         G_upper = sp.zeros(n, n)
 
-        # G^μν = g^μα g^νβ G_αβ
-        for mu in range(n):
-            for nu in range(n):
-                sum_term = 0
-                for alpha in range(n):
-                    for beta in range(n):
-                        sum_term += g_inv[mu, alpha] * g_inv[nu, beta] * G_lower[alpha, beta]
-                G_upper[mu, nu] = custom_simplify(sum_term)
+        # G^μν = G^μ_β g^βν
+        indices = generate_index_ricci(n)
+        if parent is not None:
+            rows = {index for index, _ in self.metric.changed_inverse}
+
+            def affected(mu, nu):
+                return (mu in rows or nu in rows
+                        or any(g_inv[mu, alpha] != 0 and g_inv[nu, beta] != 0
+                               for alpha, beta in self.changed))
+
+            for mu, nu in indices:
+                if not affected(mu, nu):
+                    G_upper[mu, nu] = G_upper[nu, mu] = parent.components_upper[mu, nu]
+            indices = [(mu, nu) for mu, nu in indices if affected(mu, nu)]
+
+        raw = {}
+        for mu, nu in indices:
+            value = sum((G_mixed[mu, beta] * g_inv[beta, nu] for beta in columns[nu] if G_mixed[mu, beta] != 0),
+                        sp.S.Zero)
+            if value != 0:
+                raw[(mu, nu)] = value
+
+        keys = list(raw)
+        for (mu, nu), value in zip(keys, simplify_components((raw[key] for key in keys), self.simplify_level,
+                                                             self.workers)):
+            G_upper[mu, nu] = G_upper[nu, mu] = value
 
         return G_upper
 
+    def finalize(self, level: Optional[int] = None) -> 'EinsteinTensor':
+        """
+        Simplify the stored components in place if they were computed at a lower level.
+
+        Args:
+            level: Target simplification level; defaults to the metric's simplify_level
+
+        Returns:
+            This EinsteinTensor instance
+        """
+        if level is None:
+            level = self.metric.simplify_level if self.metric is not None else 2
+        if self.simplify_level >= level:
+            return self
+
+        for components in (self.components_lower, self.components_upper):
+            if components is None:
+                continue
+            n = components.shape[0]
+            indices = [index for index in generate_index_ricci(n) if components[index] != 0]
+            values = simplify_components((components[index] for index in indices), level, self.workers)
+            for (mu, nu), value in zip(indices, values):
+                components[mu, nu] = value
+                components[nu, mu] = value
+
+        # The mixed form is not symmetric
+        if self._components_mixed is not None:
+            components = self._components_mixed
+            n = components.shape[0]
+            indices = [(mu, nu) for mu in range(n) for nu in range(n) if components[mu, nu] != 0]
+            values = simplify_components((components[index] for index in indices), level, self.workers)
+            for (mu, nu), value in zip(indices, values):
+                components[mu, nu] = value
+
+        self.simplify_level = level
+        return self
+
     def get_component_lower(self, i: int, j: int, simplify: bool = True) -> sp.Expr:
         """
         Get a specific component of the Einstein tensor with lower indices.
@@ -151,7 +350,8 @@ class EinsteinTensor:
         Args:
             i: First index
             j: Second index
-            simplify: Whether to simplify the expression
+            simplify: Whether to simplify the expression to the metric's simplify_level
+                      if the tensor was computed at a lower level
 
         Returns:
             The symbolic expression for G_ij
@@ -160,8 +360,8 @@ class EinsteinTensor:
             raise ValueError("Einstein tensor with lower indices not computed")
 
         result = self.components_lower[i, j]
-        if simplify:
-            return custom_simplify(result)
+        if simplify and self.metric is not None:
+            return simplify_to_level(result, self.simplify_level, self.metric.simplify_level)
         return result
 
     def get_component_upper(self, i: int, j: int, simplify: bool = True) -> sp.Expr:
@@ -171,7 +371,8 @@ class EinsteinTensor:
         Args:
             i: First index
             j: Second index
-            simplify: Whether to simplify the expression
+            simplify: Whether to simplify the expression to the metric's simplify_level
+                      if the tensor was computed at a lower level
 
         Returns:
             The symbolic expression for G^ij
@@ -180,14 +381,17 @@ class EinsteinTensor:
             raise ValueError("Einstein tensor with upper indices not computed")
 
         result = self.components_upper[i, j]
-        if simplify:
-            return custom_simplify(result)
+        if simplify and self.metric is not None:
+            return simplify_to_level(result, self.simplify_level, self.metric.simplify_level)
         return result
 
     def get_nonzero_components_lower(self) -> Dict[Tuple[int, int], sp.Expr]:
         """
         Get all non - zero components of the Einstein tensor with lower indices.
 
+        Components are tested for zero with ``numeric_zero_test`` before any
+        simplification, so vanishing ones are never simplified.
+
         Returns:
             Dictionary mapping (i,j) indices to non - zero symbolic expressions
         """
@@ -199,9 +403,9 @@ class EinsteinTensor:
 
         for indices in generate_index_ricci(n):
             i, j = indices
-            val = self.get_component_lower(i, j)
-            if val != 0:
-                result[indices] = val
+            val = self.get_component_lower(i, j, simplify=False)
+            if numeric_zero_test(val) is not True:
+                result[indices] = self.get_component_lower(i, j)
 
         return result
 
@@ -209,6 +413,9 @@ class EinsteinTensor:
         """
         Get all non - zero components of the Einstein tensor with upper indices.
 
+        Components are tested for zero with ``numeric_zero_test`` before any
+        simplification, so vanishing ones are never simplified.
+
         Returns:
             Dictionary mapping (i,j) indices to non - zero symbolic expressions
         """
@@ -220,9 +427,9 @@ class EinsteinTensor:
 
         for i in range(n):
             for j in range(n):
-                val = self.get_component_upper(i, j)
-                if val != 0:
-                    result[(i, j)] = val
+                val = self.get_component_upper(i, j, simplify=False)
+                if numeric_zero_test(val) is not True:
+                    result[(i, j)] = self.get_component_upper(i, j)
 
         return result
 
@@ -239,7 +446,7 @@ class EinsteinTensor:
             result += "Non - zero Einstein tensor components (G^i_j):\n"
             for i in range(self.metric.dimension):
                 for j in range(self.metric.dimension):
-                    val = custom_simplify(self.components_upper[i, j])
+                    val = self.components_upper[i, j]
                     if val != 0:
                         result += f"G^{{{i}}}_{{{j}}} = {val}\n"
             result += "\n"
@@ -248,7 +455,7 @@ class EinsteinTensor:
             result += "Non - zero Einstein tensor components (G_ij):\n"
             for i in range(self.metric.dimension):
                 for j in range(i, self.metric.dimension):
-                    val = custom_simplify(self.components_lower[i, j])
+                    val = self.components_lower[i, j]
                     if val != 0:
                         result += f"G_{{{i}{j}}} = {val}\n"
 
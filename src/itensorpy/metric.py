@@ -5,9 +5,15 @@ Metric tensor module for general relativity calculations.
 import sympy as sp
 from sympy import symbols, Symbol, Matrix
 import functools
-from typing import Dict, List, Tuple, Union, Optional
+import hashlib
+import warnings
+from typing import TYPE_CHECKING, Dict, List, Tuple, Union, Optional
 
-from .utils import custom_simplify
+from .utils import custom_simplify, coordinate_dependencies
+
+if TYPE_CHECKING:
+    # context imports this module; the name is only needed for the annotation
+    from .context import ComputationContext
 
 
 class Metric:
@@ -22,7 +28,8 @@ class Metric:
                  components: Union[Dict[Tuple[int, int], sp.Expr], Matrix, 'Metric'] = None,
                  coordinates: List[Symbol] = None,
                  params: List[Symbol] = None,
-                 simplify_level: int = 2):
+                 simplify_level: int = 2,
+                 signature: Optional[Tuple[int, ...]] = None):
         """
         Initialize a metric tensor.
 
@@ -33,11 +40,20 @@ class Metric:
             coordinates: List of symbolic coordinates (e.g., t, x, y, z)
             params: List of symbolic parameters used in the metric
             simplify_level: Level of simplification to apply (0 - 3)
+            signature: Optional signs (+1 / -1) of the squares of ``frame_decomposition``,
+                       one per coordinate, e.g. (-1, 1, 1, 1); see ``signature``
+
+        Raises:
+            ValueError: If the coordinates are empty or the signature is malformed
         """
         # Initialize properties that will be cached
         self._g_inv = None
         self._determinant = None
 
+        # Metric this one was derived from with with_component, and the changed (i, j), i <= j
+        self.parent = None
+        self.changed_components = frozenset()
+
         # Handle case where another Metric is passed
         if isinstance(components, Metric):
             self.coordinates = components.coordinates
@@ -45,6 +61,8 @@ class Metric:
             self.g = components.g
             self.dimension = len(self.coordinates)
             self.simplify_level = components.simplify_level
+            self.declared_signature = self._check_signature(
+                signature if signature is not None else components.declared_signature)
             return
 
         self.coordinates = coordinates or []
@@ -56,6 +74,7 @@ class Metric:
             
         self.dimension = len(self.coordinates)
         self.simplify_level = simplify_level
+        self.declared_signature = self._check_signature(signature)
 
         # Initialize the metric components
         if isinstance(components, Matrix):
@@ -65,6 +84,26 @@ class Metric:
         else:
             self.g = None
 
+    def _check_signature(self, signature: Optional[Tuple[int, ...]]) -> Optional[Tuple[int, ...]]:
+        """
+        Validate a declared signature.
+
+        Args:
+            signature: Signs of the squares of ``frame_decomposition``, or None
+
+        Returns:
+            The signature as a tuple, or None if none was declared
+
+        Raises:
+            ValueError: If the signature does not have one entry of +1 or -1 per coordinate
+        """
+        if signature is None:
+            return None
+        signature = tuple(signature)
+        if len(signature) != self.dimension or any(s not in (1, -1) for s in signature):
+            raise ValueError(f"Signature must have {self.dimension} entries of +1 or -1, got {signature}")
+        return signature
+
     def _dict_to_matrix(self, components_dict: Dict[Tuple[int, int], sp.Expr]) -> Matrix:
         """
         Convert a dictionary of components to a SymPy matrix.
@@ -156,6 +195,9 @@ class Metric:
         """
         Get the inverse of the metric tensor.
 
+        Block - diagonal metrics are inverted block by block, so only the coupled
+        components (e.g. the (t, φ) block of Kerr) require a symbolic matrix inversion.
+
         Returns:
             SymPy Matrix representing the inverse metric
         """
@@ -167,11 +209,234 @@ class Metric:
             if self.dimension == 2:
                 return self._compute_2d_inverse()
 
-            self._g_inv = self.g.inv()
+            blocks = self.blocks
+            if len(blocks) == 1:
+                self._g_inv = self.g.inv()
+                return self._g_inv
+
+            n = self.dimension
+            g_inv = sp.zeros(n, n)
+            for block in blocks:
+                block_inv = self._invert_block(self.g.extract(list(block), list(block)))
+                for a, i in enumerate(block):
+                    for b, j in enumerate(block):
+                        g_inv[i, j] = block_inv[a, b]
+
+            self._g_inv = g_inv
             return self._g_inv
 
         raise ValueError("Metric components not defined")
 
+    @functools.cached_property
+    def blocks(self) -> List[Tuple[int, ...]]:
+        """
+        Get the block - diagonal structure of the metric.
+
+        Two coordinates belong to the same block when they are coupled through a
+        chain of non - zero off - diagonal components.
+
+        Returns:
+            List of index tuples, one per block, ordered by their smallest index
+        """
+        if self.g is None:
+            raise ValueError("Metric components not defined")
+
+        n = self.dimension
+        block_of = list(range(n))
+
+        def find(i):
+            while block_of[i] != i:
+                block_of[i] = block_of[block_of[i]]
+                i = block_of[i]
+            return i
+
+        for i in range(n):
+            for j in range(i + 1, n):
+                if self.g[i, j] != 0:
+                    block_of[find(j)] = find(i)
+
+        blocks = {}
+        for i in range(n):
+            blocks.setdefault(find(i), []).append(i)
+
+        return sorted((tuple(block) for block in blocks.values()), key=lambda block: block[0])
+
+    @functools.cached_property
+    def is_diagonal(self) -> bool:
+        """
+        Check whether all off - diagonal metric components vanish.
+
+        Returns:
+            True if the metric is diagonal
+        """
+        return all(len(block) == 1 for block in self.blocks)
+
+    @functools.cached_property
+    def _g_dependencies(self) -> List[List[frozenset]]:
+        """Coordinates each metric component depends on, as a table of index sets."""
+        if self.g is None:
+            raise ValueError("Metric components not defined")
+
+        n = self.dimension
+        return [[coordinate_dependencies(self.g[i, j], self.coordinates) for j in range(n)] for i in range(n)]
+
+    @functools.cached_property
+    def dependency_map(self) -> Dict[str, list]:
+        """
+        Get the coordinates each component of g, g^-1, Γ and ∂Γ depends on.
+
+        The entries for g and g^-1 are read off the components. The entries for
+        Γ^k_ij = (1/2) g^kl (∂_i g_jl + ∂_j g_il - ∂_l g_ij) are predicted from them
+        without computing any symbol: a term contributes only if its derivative is
+        structurally non - zero, and then brings the coordinates of its factors. The
+        prediction is an upper bound (cancellations are not detected), cheap enough to
+        inspect the sparsity pattern before a long run. ∂_m Γ^k_ij can only be non - zero
+        when Γ^k_ij depends on x^m.
+
+        Returns:
+            Dictionary with nested lists of frozensets of coordinate indices:
+            "g"[i][j], "inverse"[i][j], "christoffel"[k][i][j] and
+            "christoffel_derivatives"[m][k][i][j]
+        """
+        n = self.dimension
+        g_deps = self._g_dependencies
+        g_inv = self.inverse
+        inv_deps = [[coordinate_dependencies(g_inv[i, j], self.coordinates) for j in range(n)] for i in range(n)]
+
+        def term(d, i, j):
+            # Coordinates of ∂_d g_ij, empty if the derivative vanishes
+            return g_deps[i][j] if d in g_deps[i][j] else frozenset()
+
+        christoffel = [[[frozenset() for _ in range(n)] for _ in range(n)] for _ in range(n)]
+        for k in range(n):
+            for i in range(n):
+                for j in range(i, n):
+                    deps = frozenset()
+                    for l in range(n):
+                        if g_inv[k, l] == 0:
+                            continue
+                        terms = term(i, j, l) | term(j, i, l) | term(l, i, j)
+                        if terms:
+                            deps |= terms | inv_deps[k][l]
+                    christoffel[k][i][j] = deps
+                    christoffel[k][j][i] = deps
+
+        derivatives = [[[[christoffel[k][i][j] if m in christoffel[k][i][j] else frozenset()
+                          for j in range(n)] for i in range(n)] for k in range(n)] for m in range(n)]
+
+        return {
+            "g": g_deps,
+            "inverse": inv_deps,
+            "christoffel": christoffel,
+            "christoffel_derivatives": derivatives,
+        }
+
+    @functools.cached_property
+    def frame_decomposition(self) -> List[Tuple[sp.Expr, List[sp.Expr]]]:
+        """
+        Write the metric as a sum of squares of one - forms, block by block.
+
+        g = Σ_a D_a (Σ_μ L_aμ dx^μ)², obtained by eliminating the coordinates of
+        each block from its last one to its first (an LDL^T decomposition). For a
+        diagonal metric D_a = g_aa and L_aμ = δ_aμ. For the (t, φ) block of a
+        stationary metric the φ pivot is taken first, which yields the frame of zero
+        angular momentum observers.
+
+        Returns:
+            List indexed by coordinate a of pairs (D_a, L_a) with L_a a list of n coefficients
+        """
+        if self.g is None:
+            raise ValueError("Metric components not defined")
+
+        n = self.dimension
+        result = [None] * n
+        for block in self.blocks:
+            remaining = {(i, j): self.g[i, j] for i in block for j in block}
+            for a in reversed(block):
+                pivot = sp.cancel(remaining[(a, a)])
+                if pivot == 0:
+                    raise ValueError("Metric block has a vanishing pivot; reorder the coordinates")
+
+                row = [sp.S.Zero] * n
+                for j in block:
+                    if j <= a:
+                        row[j] = sp.cancel(remaining[(a, j)] / pivot)
+                result[a] = (pivot, row)
+
+                # Remove the square D_a (L_a·dx)² from the rest of the block
+                for i in block:
+                    for j in block:
+                        if i < a and j < a and row[i] != 0 and row[j] != 0:
+                            remaining[(i, j)] = sp.cancel(remaining[(i, j)] - pivot * row[i] * row[j])
+
+        return result
+
+    @functools.cached_property
+    def signature(self) -> Tuple[int, ...]:
+        """
+        Get the signs of the squares in ``frame_decomposition``.
+
+        The signature declared when the metric was created is returned as is; the
+        spacetimes in ``itensorpy.spacetimes`` declare theirs. Otherwise the sign of each
+        pivot is taken from its SymPy assumptions, e.g. -1 and r**2 for a positive r.
+
+        Returns:
+            Tuple of +1 / -1 per coordinate, e.g. (-1, 1, 1, 1) for Schwarzschild
+
+        Raises:
+            ValueError: If no signature was declared and the sign of a pivot is not fixed
+                        by its assumptions
+        """
+        if self.declared_signature is not None:
+            return self.declared_signature
+        return tuple(self._pivot_sign(pivot) for pivot, _ in self.frame_decomposition)
+
+    def _pivot_sign(self, pivot: sp.Expr) -> int:
+        """
+        Determine the sign of a pivot of ``frame_decomposition``.
+
+        Args:
+            pivot: Non - zero SymPy expression
+
+        Returns:
+            1 or -1
+
+        Raises:
+            ValueError: If the assumptions do not fix the sign
+        """
+        if pivot.is_positive:
+            return 1
+        if pivot.is_negative:
+            return -1
+
+        raise ValueError(f"Cannot determine the sign of the metric pivot {pivot}; "
+                         f"declare it with Metric(..., signature=...)")
+
+    @staticmethod
+    def _invert_block(block: Matrix) -> Matrix:
+        """
+        Invert a single diagonal block of the metric.
+
+        Args:
+            block: Square SymPy Matrix
+
+        Returns:
+            SymPy Matrix representing the inverse of the block
+        """
+        size = block.shape[0]
+        if size == 1:
+            return sp.Matrix([[1 / block[0, 0]]])
+
+        if size == 2:
+            # [a b]^-1 = 1/(ad - bc) * [d -b; -c a]
+            det = block[0, 0] * block[1, 1] - block[0, 1] * block[1, 0]
+            return sp.Matrix([
+                [block[1, 1]/det, -block[0, 1]/det],
+                [-block[1, 0]/det, block[0, 0]/det]
+            ])
+
+        return block.inv()
+
     def _compute_2d_inverse(self) -> Matrix:
         """
         Compute inverse for 2D metric more efficiently.
@@ -181,13 +446,7 @@ class Metric:
         """
         # For a 2x2 matrix, inverse is more efficiently computed as:
         # [a b]^-1 = 1/(ad - bc) * [d -b; -c a]
-        g = self.g
-        det = g[0, 0] * g[1, 1] - g[0, 1] * g[1, 0]
-        inv = sp.Matrix([
-            [g[1, 1]/det, -g[0, 1]/det],
-            [-g[1, 0]/det, g[0, 0]/det]
-        ])
-        return inv
+        return self._invert_block(self.g)
 
     def component(self, i: int, j: int, simplify: bool = True) -> sp.Expr:
         """
@@ -240,9 +499,211 @@ class Metric:
         if self.g is None:
             raise ValueError("Metric components not defined")
 
-        self._determinant = self.g.det()
+        # The determinant of a block - diagonal matrix is the product of the block determinants
+        determinant = sp.S.One
+        for block in self.blocks:
+            sub = self.g.extract(list(block), list(block))
+            if len(block) == 1:
+                determinant *= sub[0, 0]
+            elif len(block) == 2:
+                determinant *= sub[0, 0] * sub[1, 1] - sub[0, 1] * sub[1, 0]
+            else:
+                determinant *= sub.det()
+
+        self._determinant = determinant
         return self._determinant
 
+    @functools.cached_property
+    def volume_element(self) -> sp.Expr:
+        """
+        Get the volume element √|g| without an absolute value.
+
+        The sign of the determinant is read off the ``signature``, so for a Lorentzian
+        metric this is √(-g). Unlike √(Abs(g)), the result simplifies and differentiates
+        like any other expression. If the signature is neither declared nor fixed by
+        assumptions, a warning is emitted and √(Abs(g)) is returned instead.
+
+        Returns:
+            sympy.Expr: The square root of the determinant times its sign
+        """
+        try:
+            signature = self.signature
+        except ValueError as error:
+            warnings.warn(f"{error}. Using sqrt(Abs(det g)) as the volume element", stacklevel=2)
+            return sp.sqrt(sp.Abs(self.determinant))
+
+        sign = 1
+        for s in signature:
+            sign *= s
+        return sp.sqrt(sign * self.determinant)
+
+    @functools.cached_property
+    def derivatives(self) -> List[List[List[sp.Expr]]]:
+        """
+        Get the table of first partial derivatives of the metric.
+
+        Only the n²(n + 1)/2 distinct partials are considered; the mirrored
+        entry ∂_l g_ji shares the expression computed for ∂_l g_ij. Components are
+        only differentiated with respect to the coordinates they depend on.
+
+        Returns:
+            A 3D array dg where dg[l][i][j] = ∂_l g_ij
+        """
+        if self.g is None:
+            raise ValueError("Metric components not defined")
+
+        n = self.dimension
+        x = self.coordinates
+        deps = self._g_dependencies
+        dg = [[[sp.S.Zero for _ in range(n)] for _ in range(n)] for _ in range(n)]
+
+        for l in range(n):
+            for i in range(n):
+                for j in range(i, n):
+                    if l not in deps[i][j]:
+                        continue
+                    value = sp.diff(self.g[i, j], x[l])
+                    dg[l][i][j] = value
+                    dg[l][j][i] = value
+
+        return dg
+
+    @functools.cached_property
+    def second_derivatives(self) -> List[List[List[List[sp.Expr]]]]:
+        """
+        Get the table of second partial derivatives of the metric.
+
+        The table is built from the first derivative table and shares entries
+        under both the (k, l) and the (i, j) symmetry. Components are only
+        differentiated with respect to the coordinates they depend on.
+
+        Returns:
+            A 4D array d2g where d2g[k][l][i][j] = ∂_k ∂_l g_ij
+        """
+        n = self.dimension
+        x = self.coordinates
+        dg = self.derivatives
+        deps = self._g_dependencies
+        d2g = [[[[sp.S.Zero for _ in range(n)] for _ in range(n)]
+                 for _ in range(n)] for _ in range(n)]
+
+        for k in range(n):
+            for l in range(k, n):
+                for i in range(n):
+                    for j in range(i, n):
+                        if k not in deps[i][j] or l not in deps[i][j]:
+                            continue
+                        value = sp.diff(dg[l][i][j], x[k])
+                        d2g[k][l][i][j] = value
+                        d2g[k][l][j][i] = value
+                        d2g[l][k][i][j] = value
+                        d2g[l][k][j][i] = value
+
+        return d2g
+
+    @functools.cached_property
+    def fingerprint(self) -> str:
+        """
+        Get a canonical fingerprint of the metric.
+
+        The fingerprint covers the coordinates, the parameters (including their
+        assumptions), the independent components and the simplification level, so
+        two metrics share a fingerprint exactly when all derived tensors agree.
+
+        Returns:
+            Hexadecimal SHA - 256 digest
+        """
+        if self.g is None:
+            raise ValueError("Metric components not defined")
+
+        n = self.dimension
+        parts = [
+            sp.srepr(list(self.coordinates)),
+            sp.srepr(list(self.params)),
+            sp.srepr([self.g[i, j] for i in range(n) for j in range(i, n)]),
+            str(self.simplify_level),
+        ]
+        return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+    @functools.cached_property
+    def structural_key(self) -> str:
+        """
+        Get the key identifying the metric in the registry of precomputed spacetimes.
+
+        Unlike the fingerprint, the key does not depend on the names of the symbols
+        (see ``registry.structural_key``). It is computed once per metric, so repeated
+        registry lookups are cheap.
+
+        Returns:
+            Hexadecimal SHA - 256 digest
+        """
+        from .registry import structural_key
+        return structural_key(self)
+
+    def with_component(self, i: int, j: int, expr: sp.Expr) -> 'Metric':
+        """
+        Get a copy of the metric with the component g_ij (and g_ji) replaced.
+
+        The new metric remembers this one as its parent. Tensors requested through its
+        computation context copy the components already computed in this metric's
+        context and only recompute the ones that depend on the changed component.
+
+        Args:
+            i: First index
+            j: Second index
+            expr: New value of g_ij
+
+        Returns:
+            New Metric instance
+
+        Raises:
+            ValueError: If the metric components are not defined or an index is out of range
+        """
+        if self.g is None:
+            raise ValueError("Metric components not defined")
+
+        n = self.dimension
+        if not (0 <= i < n and 0 <= j < n):
+            raise ValueError(f"Component indices ({i}, {j}) out of range for dimension {n}")
+
+        g = self.g.copy()
+        g[i, j] = g[j, i] = sp.sympify(expr)
+
+        metric = Metric(g, self.coordinates, self.params, self.simplify_level, self.declared_signature)
+        metric.parent = self
+        metric.changed_components = frozenset({(min(i, j), max(i, j))})
+        return metric
+
+    @functools.cached_property
+    def changed_inverse(self) -> frozenset:
+        """
+        Get the entries of the inverse metric that differ from the parent's.
+
+        Block - diagonal metrics are inverted block by block, so only the entries of
+        the blocks containing a changed component can change.
+
+        Returns:
+            Frozenset of (k, l) index pairs, empty for a metric without a parent
+        """
+        if self.parent is None:
+            return frozenset()
+
+        n = self.dimension
+        g_inv = self.inverse
+        parent_inv = self.parent.inverse
+        return frozenset((k, l) for k in range(n) for l in range(n) if g_inv[k, l] != parent_inv[k, l])
+
+    @functools.cached_property
+    def context(self) -> 'ComputationContext':
+        """
+        Get the computation context shared by the tensors derived from this metric.
+
+        Returns:
+            ComputationContext memoizing Christoffel symbols, curvature tensors and invariants
+        """
+        from .context import ComputationContext
+        return ComputationContext(self)
+
     def det(self) -> sp.Expr:
         """
         Calculate the determinant of the metric (legacy method).
@@ -0,0 +1,196 @@
+"""
+Registry of exact precomputed tensors for the spacetimes in ``itensorpy.spacetimes``.
+
+Metrics are identified by a structural key: a hash of the metric components after
+coordinates are renamed to x0, x1, ... and parameters (including free functions
+such as a scale factor a(t)) to p0, p1, ... with their assumptions kept. Two metrics
+share a key only if their components are identical up to this renaming, so a
+lookup never returns results for a different metric that merely uses the same
+symbol names. Stored results are translated back to the caller's symbols.
+"""
+
+import functools
+import hashlib
+from typing import Dict, List, Optional, Tuple
+
+import sympy as sp
+from sympy.core.function import AppliedUndef
+
+from .metric import Metric
+from ._spacetime_data import SPACETIMES
+
+
+_enabled = True
+
+
+def enable_registry() -> None:
+    """Enable lookups in the spacetime registry (the default)."""
+    global _enabled
+    _enabled = True
+
+
+def disable_registry() -> None:
+    """Disable lookups in the spacetime registry, forcing every tensor to be computed."""
+    global _enabled
+    _enabled = False
+
+
+def _canonical_mapping(metric: Metric) -> Dict[sp.Basic, sp.Basic]:
+    """
+    Build the renaming of a metric's symbols to canonical names.
+
+    Coordinates become x0, x1, ... in order. Parameters become p0, p1, ... in the
+    order of ``metric.params``, followed by any other free symbols and applied
+    functions of the components sorted by name.
+
+    Args:
+        metric: Metric to canonicalize
+
+    Returns:
+        Dictionary mapping the metric's symbols to canonical ones
+    """
+    mapping = {}
+    for i, coord in enumerate(metric.coordinates):
+        mapping[coord] = sp.Symbol(f"x{i}", **coord.assumptions0)
+
+    # Parameters that appear in the components but were not declared
+    extra = set()
+    for expr in metric.g:
+        extra |= expr.free_symbols | expr.atoms(AppliedUndef)
+    extra -= set(metric.params) | set(metric.coordinates)
+
+    params = list(metric.params) + sorted(extra, key=sp.default_sort_key)
+    for i, param in enumerate(params):
+        name = f"p{i}"
+        if isinstance(param, AppliedUndef):
+            mapping[param] = sp.Function(name)(*[arg.xreplace(mapping) for arg in param.args])
+        elif isinstance(param, sp.Symbol):
+            mapping[param] = sp.Symbol(name, **param.assumptions0)
+
+    return mapping
+
+
+def structural_key(metric: Metric) -> str:
+    """
+    Compute the structural key of a metric.
+
+    Args:
+        metric: Metric to identify
+
+    Returns:
+        Hex digest identifying the metric up to renaming of its symbols
+    """
+    mapping = _canonical_mapping(metric)
+    n = metric.dimension
+
+    parts = [str(n)]
+    for i in range(n):
+        for j in range(i, n):
+            parts.append(sp.srepr(sp.sympify(metric.g[i, j]).xreplace(mapping)))
+
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def _load_entry(key: str) -> Dict:
+    """
+    Parse a registry entry into expressions in canonical symbols.
+
+    Args:
+        key: Structural key of the entry
+
+    Returns:
+        Dictionary with parsed "christoffel" and "invariants" data
+    """
+    entry = SPACETIMES[key]
+    namespace = {name: sp.sympify(text) for name, text in entry["symbols"].items()}
+    namespace.update({name: sp.Function(name) for name in entry["functions"]})
+
+    def parse(text):
+        return sp.sympify(text, locals=namespace)
+
+    return {
+        "name": entry["name"],
+        "christoffel": {index: parse(text) for index, text in entry["christoffel"].items()},
+        "invariants": {name: parse(text) for name, text in entry["invariants"].items()},
+    }
+
+
+def _resolve(metric: Metric) -> Optional[Tuple[Dict, Dict[sp.Basic, sp.Basic]]]:
+    """
+    Find the registry entry of a metric.
+
+    Args:
+        metric: Metric to look up
+
+    Returns:
+        The parsed entry and the mapping from canonical to user symbols, or None
+    """
+    if not _enabled or metric is None or metric.g is None:
+        return None
+
+    key = metric.structural_key
+    if key not in SPACETIMES:
+        return None
+
+    inverse = {canonical: original for original, canonical in _canonical_mapping(metric).items()}
+    return _load_entry(key), inverse
+
+
+def lookup_name(metric: Metric) -> Optional[str]:
+    """
+    Get the name of the registered spacetime a metric matches.
+
+    Args:
+        metric: Metric to look up
+
+    Returns:
+        Name of the spacetime, or None if the metric is not registered
+    """
+    resolved = _resolve(metric)
+    return resolved[0]["name"] if resolved else None
+
+
+def lookup_christoffel(metric: Metric) -> Optional[List[List[List[sp.Expr]]]]:
+    """
+    Get the precomputed Christoffel symbols of a registered metric.
+
+    Args:
+        metric: Metric to look up
+
+    Returns:
+        A 3D array of Christoffel symbols Γ^k_ij in the metric's symbols, or None
+    """
+    resolved = _resolve(metric)
+    if resolved is None:
+        return None
+
+    entry, inverse = resolved
+    n = metric.dimension
+    christoffel = [[[sp.S.Zero for _ in range(n)] for _ in range(n)] for _ in range(n)]
+    for (k, i, j), value in entry["christoffel"].items():
+        value = value.xreplace(inverse)
+        christoffel[k][i][j] = value
+        christoffel[k][j][i] = value
+
+    return christoffel
+
+
+def lookup_invariant(metric: Metric, name: str) -> Optional[sp.Expr]:
+    """
+    Get a precomputed curvature invariant of a registered metric.
+
+    Args:
+        metric: Metric to look up
+        name: One of "kretschmann", "euler" or "chern_pontryagin"
+
+    Returns:
+        The invariant in the metric's symbols, or None if it is not registered
+    """
+    resolved = _resolve(metric)
+    if resolved is None:
+        return None
+
+    entry, inverse = resolved
+    value = entry["invariants"].get(name)
+    return value.xreplace(inverse) if value is not None else None
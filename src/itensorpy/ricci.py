@@ -7,8 +7,10 @@ from sympy import Matrix, Symbol, Expr
 from typing import List, Dict, Tuple, Union, Optional
 
 from .metric import Metric
+from .christoffel import ChristoffelSymbols
 from .riemann import RiemannTensor
-from .utils import custom_simplify, generate_index_ricci
+from .utils import (_pipeline_simplify, generate_index_ricci, numeric_zero_test, simplify_components,
+                    simplify_to_level)
 
 
 class RicciTensor:
@@ -22,7 +24,11 @@ class RicciTensor:
     def __init__(self,
                  components=None,
                  riemann: Optional[RiemannTensor] = None,
-                 metric: Optional[Metric] = None):
+                 metric: Optional[Metric] = None,
+                 workers: Optional[int] = None,
+                 christoffel: Optional[ChristoffelSymbols] = None,
+                 simplify_level: Optional[int] = None,
+                 parent: Optional['RicciTensor'] = None):
         """
         Initialize the Ricci tensor.
 
@@ -30,40 +36,88 @@ class RicciTensor:
             components: Optional pre - computed Ricci tensor components
             riemann: Riemann tensor used to compute the Ricci tensor
             metric: Metric tensor, needed if computing from Riemann tensor
+            workers: Number of processes used to simplify components (None uses the global default)
+            christoffel: Christoffel symbols used to compute the Ricci tensor without
+                         the Riemann tensor
+            simplify_level: Level of simplification to apply (0 - 3); defaults to the
+                            metric's simplify_level
+            parent: Optional Ricci tensor of ``metric.parent`` (see ``Metric.with_component``);
+                    if the Christoffel symbols were updated from the parent's, the
+                    components they do not affect are copied from it
         """
         self.components = components
         self.riemann = riemann
-        self.metric = metric or (riemann.metric if riemann else None)
+        self.christoffel = christoffel
+        self.metric = metric or (riemann.metric if riemann else None) or (christoffel.metric if christoffel else None)
+        self.workers = workers
+        if simplify_level is None:
+            simplify_level = self.metric.simplify_level if self.metric is not None else 2
+        self.simplify_level = simplify_level
+
+        # Components (μ, ν), μ <= ν, recomputed from a parent and the subset whose value
+        # differs from the parent's; None without a parent
+        self.recomputed = None
+        self.changed = None
 
         if components is None and riemann is not None:
             self.components = self._compute_ricci_tensor()
+        elif components is None and christoffel is not None:
+            self.components = self._compute_ricci_from_christoffel(parent if self._can_update(parent) else None)
 
     @classmethod
-    def from_riemann(cls, riemann: RiemannTensor) -> 'RicciTensor':
+    def from_riemann(cls, riemann: RiemannTensor, workers: Optional[int] = None,
+                     simplify_level: Optional[int] = None) -> 'RicciTensor':
         """
         Create a Ricci tensor from a Riemann tensor.
 
         Args:
             riemann: Riemann tensor instance
+            workers: Number of processes used to simplify components (None uses the global default)
+            simplify_level: Level of simplification to apply (0 - 3); defaults to the
+                            metric's simplify_level
 
         Returns:
             RicciTensor instance
         """
-        return cls(riemann=riemann)
+        return cls(riemann=riemann, workers=workers, simplify_level=simplify_level)
 
     @classmethod
-    def from_metric(cls, metric: Metric) -> 'RicciTensor':
+    def from_christoffel(cls, christoffel: ChristoffelSymbols, workers: Optional[int] = None,
+                         simplify_level: Optional[int] = None,
+                         parent: Optional['RicciTensor'] = None) -> 'RicciTensor':
+        """
+        Create a Ricci tensor directly from Christoffel symbols.
+
+        Args:
+            christoffel: Christoffel symbols instance with a metric
+            workers: Number of processes used to simplify components (None uses the global default)
+            simplify_level: Level of simplification to apply (0 - 3); defaults to the
+                            metric's simplify_level
+            parent: Optional Ricci tensor of the parent metric (see RicciTensor)
+
+        Returns:
+            RicciTensor instance
+        """
+        return cls(christoffel=christoffel, metric=christoffel.metric, workers=workers,
+                   simplify_level=simplify_level, parent=parent)
+
+    @classmethod
+    def from_metric(cls, metric: Metric, workers: Optional[int] = None) -> 'RicciTensor':
         """
         Create a Ricci tensor directly from a metric tensor.
 
+        The Ricci tensor is computed from the Christoffel symbols without
+        building the Riemann tensor, and is shared through the metric's
+        computation context.
+
         Args:
             metric: Metric tensor instance
+            workers: Number of processes used to simplify components (None uses the global default)
 
         Returns:
             RicciTensor instance
         """
-        riemann = RiemannTensor.from_metric(metric)
-        return cls.from_riemann(riemann)
+        return metric.context.ricci_tensor(workers=workers)
 
     def _compute_ricci_tensor(self) -> Matrix:
         """
@@ -85,13 +139,174 @@ class RicciTensor:
         Ricci = sp.zeros(n, n)
 
         # Compute Ricci tensor by contracting Riemann tensor
-        for mu in range(n):
-            for nu in range(n):
-                Ricci[mu, nu] = sum(Riemann[rho][mu][rho][nu] for rho in range(n))
-                Ricci[mu, nu] = custom_simplify(Ricci[mu, nu])
+        indices = [(mu, nu) for mu in range(n) for nu in range(n)]
+        raw = [sum(Riemann[rho][mu][rho][nu] for rho in range(n)) for mu, nu in indices]
+        for (mu, nu), value in zip(indices, simplify_components(raw, self.simplify_level, self.workers)):
+            Ricci[mu, nu] = value
 
         return Ricci
 
+    def _can_update(self, parent: Optional['RicciTensor']) -> bool:
+        """
+        Check whether the tensor can be updated from the Ricci tensor of the parent metric.
+
+        Args:
+            parent: Ricci tensor of the parent metric, or None
+
+        Returns:
+            True if the Christoffel symbols were updated from the parent's and parent
+            holds components simplified at least as far as this instance
+        """
+        return (parent is not None and self.christoffel is not None and self.christoffel.changed is not None
+                and parent.metric is self.metric.parent and parent.components is not None
+                and parent.simplify_level >= self.simplify_level)
+
+    @staticmethod
+    def _contracted_christoffel(metric: Metric) -> List[sp.Expr]:
+        """
+        Get the contracted symbols Γ^ρ_ρμ = ∂_μ ln √|g| = ∂_μ g / (2 g).
+
+        Args:
+            metric: Metric tensor instance
+
+        Returns:
+            List of the contracted symbols, one per coordinate
+        """
+        # A rational function of the components that only needs cancelling
+        det = metric.determinant
+        return [sp.cancel(sp.diff(det, x) / (2 * det)) if x in det.free_symbols else sp.S.Zero
+                for x in metric.coordinates]
+
+    def _affected(self, parent: 'RicciTensor', contracted: List[sp.Expr]) -> set:
+        """
+        Find the components R_μν (μ <= ν) that depend on changed quantities.
+
+        Args:
+            parent: Ricci tensor of the parent metric
+            contracted: Contracted symbols of this tensor's metric
+
+        Returns:
+            Set of (μ, ν) index pairs
+        """
+        n = self.metric.dimension
+        Gamma = self.christoffel.components
+        changed = self.christoffel.changed
+        previous = self._contracted_christoffel(parent.metric)
+        contracted_changed = [contracted[x] != previous[x] for x in range(n)]
+
+        def gamma_changed(a, b, c):
+            return (a, min(b, c), max(b, c)) in changed
+
+        def product_changed(a, b, c, d, e, f):
+            # Γ^a_bc Γ^d_ef
+            return ((gamma_changed(a, b, c) and (Gamma[d][e][f] != 0 or gamma_changed(d, e, f)))
+                    or (gamma_changed(d, e, f) and Gamma[a][b][c] != 0))
+
+        affected = set()
+        for mu, nu in generate_index_ricci(n):
+            if (contracted_changed[mu]
+                    or any(gamma_changed(rho, nu, mu) for rho in range(n))
+                    or any((contracted_changed[lam] and Gamma[lam][nu][mu] != 0)
+                           or (gamma_changed(lam, nu, mu) and contracted[lam] != 0) for lam in range(n))
+                    or any(product_changed(rho, nu, lam, lam, rho, mu) for rho in range(n) for lam in range(n))):
+                affected.add((mu, nu))
+        return affected
+
+    def _compute_ricci_from_christoffel(self, parent: Optional['RicciTensor'] = None) -> Matrix:
+        """
+        Compute the Ricci tensor from Christoffel symbols and their derivatives.
+
+        R_μν = ∂_ρ Γ^ρ_νμ - ∂_ν Γ^ρ_ρμ + Γ^ρ_ρλ Γ^λ_νμ - Γ^ρ_νλ Γ^λ_ρμ
+
+        The contracted symbols are taken from the identity
+        Γ^ρ_ρμ = ∂_μ ln √|g| = ∂_μ g / (2 g), so ∂_ν Γ^ρ_ρμ = ∂_ν ∂_μ ln √|g| is
+        symmetric and only the n(n+1)/2 components with μ <= ν are computed.
+
+        Args:
+            parent: Optional Ricci tensor of the parent metric; components for which no
+                    term of the formula changed are copied from it
+
+        Returns:
+            SymPy Matrix representing the Ricci tensor
+        """
+        if self.christoffel is None or self.christoffel.components is None:
+            raise ValueError("Valid Christoffel symbols required to compute the Ricci tensor")
+
+        if self.metric is None:
+            raise ValueError("Valid metric tensor required to compute the Ricci tensor")
+
+        n = self.metric.dimension
+        coordinates = self.metric.coordinates
+        Gamma = self.christoffel.components
+        dGamma = self.christoffel.derivatives
+        nonzero = self.christoffel.nonzero_map
+        uppers = self.christoffel.nonzero_uppers
+
+        contracted = self._contracted_christoffel(self.metric)
+
+        Ricci = sp.zeros(n, n)
+        indices = generate_index_ricci(n)
+        if parent is not None:
+            affected = self._affected(parent, contracted)
+            for mu, nu in indices:
+                if (mu, nu) not in affected:
+                    Ricci[mu, nu] = Ricci[nu, mu] = parent.components[mu, nu]
+            indices = [index for index in indices if index in affected]
+
+        raw = []
+        for mu, nu in indices:
+            value = sum(dGamma[rho][rho][nu][mu] for rho in range(n))
+            if coordinates[nu] in contracted[mu].free_symbols:
+                value -= sp.diff(contracted[mu], coordinates[nu])
+
+            # Γ^ρ_ρλ Γ^λ_νμ
+            for lam in uppers.get((nu, mu), ()):
+                value += contracted[lam] * Gamma[lam][nu][mu]
+
+            # Γ^ρ_νλ Γ^λ_ρμ, visiting only non - zero Γ^λ_ρμ
+            for rho in range(n):
+                for lam in uppers.get((rho, mu), ()):
+                    value -= nonzero.get((rho, nu, lam), 0) * Gamma[lam][rho][mu]
+
+            raw.append(value)
+
+        values = simplify_components(raw, self.simplify_level, self.workers)
+        for (mu, nu), value in zip(indices, values):
+            Ricci[mu, nu] = value
+            Ricci[nu, mu] = value
+
+        if parent is not None:
+            self.recomputed = frozenset(indices)
+            self.changed = frozenset(index for index, value in zip(indices, values)
+                                     if value != parent.components[index])
+
+        return Ricci
+
+    def finalize(self, level: Optional[int] = None) -> 'RicciTensor':
+        """
+        Simplify the stored components in place if they were computed at a lower level.
+
+        Args:
+            level: Target simplification level; defaults to the metric's simplify_level
+
+        Returns:
+            This RicciTensor instance
+        """
+        if level is None:
+            level = self.metric.simplify_level if self.metric is not None else 2
+        if self.simplify_level >= level or self.components is None:
+            return self
+
+        n = self.components.shape[0]
+        indices = [index for index in generate_index_ricci(n) if self.components[index] != 0]
+        values = simplify_components((self.components[index] for index in indices), level, self.workers)
+        for (mu, nu), value in zip(indices, values):
+            self.components[mu, nu] = value
+            self.components[nu, mu] = value
+
+        self.simplify_level = level
+        return self
+
     def get_component(self, i: int, j: int, simplify: bool = True) -> sp.Expr:
         """
         Get a specific component of the Ricci tensor.
@@ -99,7 +314,8 @@ class RicciTensor:
         Args:
             i: First index
             j: Second index
-            simplify: Whether to simplify the expression
+            simplify: Whether to simplify the expression to the metric's simplify_level
+                      if the tensor was computed at a lower level
 
         Returns:
             The symbolic expression for R_ij
@@ -108,14 +324,17 @@ class RicciTensor:
             raise ValueError("Ricci tensor not computed")
 
         result = self.components[i, j]
-        if simplify:
-            return custom_simplify(result)
+        if simplify and self.metric is not None:
+            return simplify_to_level(result, self.simplify_level, self.metric.simplify_level)
         return result
 
     def get_nonzero_components(self) -> Dict[Tuple[int, int], sp.Expr]:
         """
         Get all non - zero components of the Ricci tensor.
 
+        Components are tested for zero with ``numeric_zero_test`` before any
+        simplification, so vanishing ones are never simplified.
+
         Returns:
             Dictionary mapping (i,j) indices to non - zero symbolic expressions
         """
@@ -127,9 +346,9 @@ class RicciTensor:
 
         for indices in generate_index_ricci(n):
             i, j = indices
-            val = self.get_component(i, j)
-            if val != 0:
-                result[indices] = val
+            val = self.get_component(i, j, simplify=False)
+            if numeric_zero_test(val) is not True:
+                result[indices] = self.get_component(i, j)
 
         return result
 
@@ -148,7 +367,7 @@ class RicciTensor:
 
         for indices in generate_index_ricci(n):
             i, j = indices
-            val = custom_simplify(self.components[i, j])
+            val = self.components[i, j]
             if val != 0:
                 result += f"R_{{{i}{j}}} = {val}\n"
 
@@ -166,7 +385,8 @@ class RicciScalar:
     def __init__(self,
                  value=None,
                  ricci: Optional[RicciTensor] = None,
-                 metric: Optional[Metric] = None):
+                 metric: Optional[Metric] = None,
+                 simplify_level: Optional[int] = None):
         """
         Initialize the Ricci scalar.
 
@@ -174,26 +394,33 @@ class RicciScalar:
             value: Optional pre - computed Ricci scalar value
             ricci: Ricci tensor used to compute the Ricci scalar
             metric: Metric tensor, needed if computing from Ricci tensor
+            simplify_level: Level of simplification to apply (0 - 3); defaults to the
+                            metric's simplify_level
         """
         self.value = value
         self.ricci = ricci
         self.metric = metric or (ricci.metric if ricci else None)
+        if simplify_level is None:
+            simplify_level = self.metric.simplify_level if self.metric is not None else 2
+        self.simplify_level = simplify_level
 
         if value is None and ricci is not None and metric is not None:
             self.value = self._compute_ricci_scalar()
 
     @classmethod
-    def from_ricci(cls, ricci: RicciTensor) -> 'RicciScalar':
+    def from_ricci(cls, ricci: RicciTensor, simplify_level: Optional[int] = None) -> 'RicciScalar':
         """
         Create a Ricci scalar from a Ricci tensor.
 
         Args:
             ricci: Ricci tensor instance
+            simplify_level: Level of simplification to apply (0 - 3); defaults to the
+                            metric's simplify_level
 
         Returns:
             RicciScalar instance
         """
-        return cls(ricci=ricci, metric=ricci.metric)
+        return cls(ricci=ricci, metric=ricci.metric, simplify_level=simplify_level)
 
     @classmethod
     def from_metric(cls, metric: Metric) -> 'RicciScalar':
@@ -206,8 +433,7 @@ class RicciScalar:
         Returns:
             RicciScalar instance
         """
-        ricci = RicciTensor.from_metric(metric)
-        return cls.from_ricci(ricci)
+        return metric.context.ricci_scalar()
 
     def _compute_ricci_scalar(self) -> sp.Expr:
         """
@@ -228,16 +454,36 @@ class RicciScalar:
 
         # Compute Ricci scalar by contracting Ricci tensor with inverse metric
         scalar = sum(g_inv[mu, nu] * Ricci[mu, nu] for mu in range(n) for nu in range(n))
-        scalar = custom_simplify(scalar)
+        scalar = _pipeline_simplify(scalar, self.simplify_level)
 
         return scalar
 
+    def finalize(self, level: Optional[int] = None) -> 'RicciScalar':
+        """
+        Simplify the stored value in place if it was computed at a lower level.
+
+        Args:
+            level: Target simplification level; defaults to the metric's simplify_level
+
+        Returns:
+            This RicciScalar instance
+        """
+        if level is None:
+            level = self.metric.simplify_level if self.metric is not None else 2
+        if self.simplify_level >= level or self.value is None:
+            return self
+
+        self.value = _pipeline_simplify(self.value, level)
+        self.simplify_level = level
+        return self
+
     def get_value(self, simplify: bool = True) -> sp.Expr:
         """
         Get the value of the Ricci scalar.
 
         Args:
-            simplify: Whether to simplify the expression
+            simplify: Whether to simplify the expression to the metric's simplify_level
+                      if the scalar was computed at a lower level
 
         Returns:
             The symbolic expression for the Ricci scalar R
@@ -245,8 +491,8 @@ class RicciScalar:
         if self.value is None:
             raise ValueError("Ricci scalar not computed")
 
-        if simplify:
-            return custom_simplify(self.value)
+        if simplify and self.metric is not None:
+            return simplify_to_level(self.value, self.simplify_level, self.metric.simplify_level)
         return self.value
 
     def __str__(self) -> str:
@@ -259,4 +505,4 @@ class RicciScalar:
         if self.value is None:
             return "Ricci scalar not computed"
 
-        return f"Ricci scalar (R):\nR = {custom_simplify(self.value)}"
+        return f"Ricci scalar (R):\nR = {self.value}"
@@ -3,13 +3,14 @@ Module for computing and manipulating the Riemann curvature tensor.
 """
 
 import sympy as sp
-from sympy import diff, Matrix, Symbol
+from sympy import Matrix, Symbol
 import functools
 from typing import List, Dict, Tuple, Union, Optional
 
 from .metric import Metric
 from .christoffel import ChristoffelSymbols
-from .utils import custom_simplify, generate_index_riemann, lower_indices
+from .utils import (generate_index_riemann, generate_index_riemann_independent, lower_indices,
+                    numeric_zero_test, simplify_components, simplify_to_level)
 
 
 class RiemannTensor:
@@ -25,7 +26,9 @@ class RiemannTensor:
                  components_down=None,
                  christoffel: Optional[ChristoffelSymbols] = None,
                  metric: Optional[Metric] = None,
-                 simplify_level: int = 2):
+                 simplify_level: Optional[int] = None,
+                 workers: Optional[int] = None,
+                 parent: Optional['RiemannTensor'] = None):
         """
         Initialize the Riemann tensor.
 
@@ -34,48 +37,76 @@ class RiemannTensor:
             components_down: Optional pre - computed Riemann tensor with all indices down
             christoffel: Christoffel symbols used to compute the Riemann tensor
             metric: Metric tensor used to lower indices
-            simplify_level: Level of simplification to apply (0 - 3)
+            simplify_level: Level of simplification to apply (0 - 3); defaults to the
+                            metric's simplify_level
+            workers: Number of processes used to simplify components (None uses the global default)
+            parent: Optional Riemann tensor of ``metric.parent`` (see ``Metric.with_component``);
+                    if the Christoffel symbols were updated from the parent's, the
+                    components they do not affect are copied from it
         """
         self.components_up = components_up
         self._components_down = components_down
         self.christoffel = christoffel
         self.metric = metric or (christoffel.metric if christoffel else None)
+        if simplify_level is None:
+            simplify_level = self.metric.simplify_level if self.metric is not None else 2
         self.simplify_level = simplify_level
+        self.workers = workers
 
-        if self.components_up is None and christoffel is not None:
-            self.components_up = self._compute_riemann_tensor()
+        # Components R^ρ_σμν (μ < ν) recomputed from a parent, the subset whose value differs
+        # from the parent's, and the changed R_abcd; None without a parent
+        self.recomputed = None
+        self.changed = None
+        self.changed_down = None
 
-        # No longer directly compute components_down in __init__
-        # It will be computed on - demand via the cached_property
+        if self.components_up is None and christoffel is not None:
+            if not self._can_update(parent):
+                parent = None
+            if self._components_down is None and christoffel.metric is not None:
+                # Compute only the independent components of R_abcd and raise the first index
+                self._components_down = self._compute_riemann_tensor_down(parent)
+            if self._components_down is not None and self.metric is not None:
+                self.components_up = self._raise_first_index(self._components_down, parent)
+            else:
+                self.components_up = self._compute_riemann_tensor()
 
     @classmethod
-    def from_christoffel(cls, christoffel: ChristoffelSymbols, simplify_level: int = 2) -> 'RiemannTensor':
+    def from_christoffel(cls, christoffel: ChristoffelSymbols, simplify_level: Optional[int] = None,
+                         workers: Optional[int] = None,
+                         parent: Optional['RiemannTensor'] = None) -> 'RiemannTensor':
         """
         Create a Riemann tensor from Christoffel symbols.
 
         Args:
             christoffel: Christoffel symbols instance
-            simplify_level: Level of simplification to apply (0 - 3)
+            simplify_level: Level of simplification to apply (0 - 3); defaults to the
+                            metric's simplify_level
+            workers: Number of processes used to simplify components (None uses the global default)
+            parent: Optional Riemann tensor of the parent metric (see RiemannTensor)
 
         Returns:
             RiemannTensor instance
         """
-        return cls(christoffel=christoffel, simplify_level=simplify_level)
+        return cls(christoffel=christoffel, simplify_level=simplify_level, workers=workers, parent=parent)
 
     @classmethod
-    def from_metric(cls, metric: Metric, simplify_level: int = 2) -> 'RiemannTensor':
+    def from_metric(cls, metric: Metric, simplify_level: Optional[int] = None,
+                    workers: Optional[int] = None) -> 'RiemannTensor':
         """
         Create a Riemann tensor directly from a metric tensor.
 
+        The tensor is shared through the metric's computation context.
+
         Args:
             metric: Metric tensor instance
-            simplify_level: Level of simplification to apply (0 - 3)
+            simplify_level: Level of simplification to apply (0 - 3); defaults to the
+                            metric's simplify_level
+            workers: Number of processes used to simplify components (None uses the global default)
 
         Returns:
             RiemannTensor instance
         """
-        christoffel = ChristoffelSymbols.from_metric(metric)
-        return cls.from_christoffel(christoffel, simplify_level=simplify_level)
+        return metric.context.riemann(simplify_level=simplify_level, workers=workers)
 
     def _compute_riemann_tensor(self) -> List[List[List[List[sp.Expr]]]]:
         """
@@ -92,25 +123,159 @@ class RiemannTensor:
 
         n = self.metric.dimension
         Gamma = self.christoffel.components
-        coordinates = self.metric.coordinates
-
-        Riemann = [[[[0 for _ in range(n)] for _ in range(n)] for _ in range(n)] for _ in range(n)]
-
+        nonzero = self.christoffel.nonzero_map
+        uppers = self.christoffel.nonzero_uppers
+
+        # ∂_μ Γ^ρ_νσ, computed once for all (ρ,σ,μ,ν) and only for the coordinates
+        # each symbol depends on
+        if self.christoffel.metric is not None:
+            deps = self.christoffel.dependencies
+            dGamma = self.christoffel.derivatives
+        else:
+            deps = ChristoffelSymbols._dependency_table(Gamma, self.metric.coordinates)
+            dGamma = ChristoffelSymbols._derivative_table(Gamma, self.metric.coordinates, deps)
+
+        Riemann = [[[[sp.S.Zero for _ in range(n)] for _ in range(n)] for _ in range(n)] for _ in range(n)]
+
+        # Only components with μ < ν are computed; the rest follow from the
+        # antisymmetry in the last index pair
+        raw = {}
         for rho in range(n):
             for sigma in range(n):
                 for mu in range(n):
-                    for nu in range(n):
+                    for nu in range(mu + 1, n):
+                        # Skip components that are structurally zero: no symbol depends on
+                        # the coordinate it is differentiated by and no product term exists
+                        has_derivative = mu in deps[rho][nu][sigma] or nu in deps[rho][mu][sigma]
+                        if not has_derivative and (nu, sigma) not in uppers and (mu, sigma) not in uppers:
+                            continue
+
                         # Partial derivative terms
-                        term1 = diff(Gamma[rho][nu][sigma], coordinates[mu])
-                        term2 = diff(Gamma[rho][mu][sigma], coordinates[nu])
+                        term1 = dGamma[mu][rho][nu][sigma]
+                        term2 = dGamma[nu][rho][mu][sigma]
 
-                        # Christoffel product terms
+                        # Christoffel product terms, visiting only non - zero Γ^λ_νσ and Γ^λ_μσ
                         sum_term = 0
-                        for lam in range(n):
-                            sum_term += (Gamma[rho][mu][lam] * Gamma[lam][nu][sigma] -
-                                        Gamma[rho][nu][lam] * Gamma[lam][mu][sigma])
+                        for lam in uppers.get((nu, sigma), ()):
+                            sum_term += nonzero.get((rho, mu, lam), 0) * Gamma[lam][nu][sigma]
+                        for lam in uppers.get((mu, sigma), ()):
+                            sum_term -= nonzero.get((rho, nu, lam), 0) * Gamma[lam][mu][sigma]
 
-                        Riemann[rho][sigma][mu][nu] = custom_simplify(term1 - term2 + sum_term, self.simplify_level)
+                        value = term1 - term2 + sum_term
+                        if value != 0:
+                            raw[(rho, sigma, mu, nu)] = value
+
+        keys = list(raw)
+        values = simplify_components((raw[key] for key in keys), self.simplify_level, self.workers)
+        for (rho, sigma, mu, nu), value in zip(keys, values):
+            Riemann[rho][sigma][mu][nu] = value
+            Riemann[rho][sigma][nu][mu] = -value
+
+        return Riemann
+
+    def _can_update(self, parent: Optional['RiemannTensor']) -> bool:
+        """
+        Check whether the tensor can be updated from the Riemann tensor of the parent metric.
+
+        Args:
+            parent: Riemann tensor of the parent metric, or None
+
+        Returns:
+            True if the Christoffel symbols were updated from the parent's and parent
+            holds both index forms simplified at least as far as this instance
+        """
+        return (parent is not None and self.christoffel.changed is not None
+                and parent.metric is self.metric.parent and parent.components_up is not None
+                and parent._components_down is not None and parent.simplify_level >= self.simplify_level)
+
+    def _affected_down(self) -> set:
+        """
+        Find the independent components R_ρσμν that depend on changed quantities.
+
+        A component can only change if one of Γ_ρνσ, Γ_ρμσ involves a changed metric
+        component, or if a product Γ^κ_μσ Γ_κνρ (Γ^κ_νσ Γ_κμρ) has a changed factor.
+
+        Returns:
+            Set of indices from ``generate_index_riemann_independent``
+        """
+        n = self.metric.dimension
+        Gamma = self.christoffel.components
+        changed = self.christoffel.changed
+        first_kind_changed = self.christoffel._first_kind_changed
+
+        def product_changed(kappa, a, b, c, d):
+            # Γ^κ_ab Γ_κcd
+            return ((kappa, min(a, b), max(a, b)) in changed
+                    or (Gamma[kappa][a][b] != 0 and first_kind_changed(kappa, c, d)))
+
+        affected = set()
+        for rho, sigma, mu, nu in generate_index_riemann_independent(n):
+            if (first_kind_changed(rho, nu, sigma) or first_kind_changed(rho, mu, sigma)
+                    or any(product_changed(kappa, mu, sigma, nu, rho) or product_changed(kappa, nu, sigma, mu, rho)
+                           for kappa in range(n))):
+                affected.add((rho, sigma, mu, nu))
+        return affected
+
+    def _raise_first_index(self, components_down,
+                           parent: Optional['RiemannTensor'] = None) -> List[List[List[List[sp.Expr]]]]:
+        """
+        Raise the first index of R_abcd: R^ρ_σμν = g^ρa R_aσμν.
+
+        Only non - zero entries of the inverse metric and components with μ < ν
+        are visited; the rest follow from the antisymmetry in the last index pair.
+        A component with a single term g^ρa R_aσμν is a product of already
+        simplified factors and is kept as it is; only sums over several a are
+        simplified again.
+
+        Args:
+            components_down: Riemann tensor with all indices covariant
+            parent: Optional Riemann tensor of the parent metric; components for which
+                    no g^ρa and no R_aσμν changed are copied from it
+
+        Returns:
+            A 4D array representing the Riemann tensor with first index contravariant
+        """
+        n = self.metric.dimension
+        g_inv = self.metric.inverse
+        rows = [[a for a in range(n) if g_inv[rho, a] != 0] for rho in range(n)]
+        changed_inverse = self.metric.changed_inverse
+
+        Riemann = [[[[sp.S.Zero for _ in range(n)] for _ in range(n)] for _ in range(n)] for _ in range(n)]
+
+        raw = {}
+        products = {}
+        for rho in range(n):
+            for sigma in range(n):
+                for mu in range(n):
+                    for nu in range(mu + 1, n):
+                        if parent is not None and not any(
+                                (rho, a) in changed_inverse
+                                or (g_inv[rho, a] != 0 and (a, sigma, mu, nu) in self.changed_down)
+                                for a in range(n)):
+                            value = parent.components_up[rho][sigma][mu][nu]
+                            Riemann[rho][sigma][mu][nu] = value
+                            Riemann[rho][sigma][nu][mu] = -value
+                            continue
+
+                        terms = [g_inv[rho, a] * components_down[a][sigma][mu][nu]
+                                 for a in rows[rho] if components_down[a][sigma][mu][nu] != 0]
+                        if len(terms) > 1:
+                            raw[(rho, sigma, mu, nu)] = sp.Add(*terms)
+                        elif terms or parent is not None:
+                            products[(rho, sigma, mu, nu)] = terms[0] if terms else sp.S.Zero
+
+        keys = list(raw)
+        values = simplify_components((raw[key] for key in keys), self.simplify_level, self.workers)
+        keys += list(products)
+        values += list(products.values())
+        for (rho, sigma, mu, nu), value in zip(keys, values):
+            Riemann[rho][sigma][mu][nu] = value
+            Riemann[rho][sigma][nu][mu] = -value
+
+        if parent is not None:
+            self.recomputed = frozenset(keys)
+            self.changed = frozenset(key for key, value in zip(keys, values)
+                                     if value != parent.components_up[key[0]][key[1]][key[2]][key[3]])
 
         return Riemann
 
@@ -131,9 +296,229 @@ class RiemannTensor:
         if self.metric is None:
             raise ValueError("Valid metric tensor required to lower indices")
 
-        self._components_down = lower_indices(self.components_up, self.metric.g, self.metric.dimension)
+        if self.christoffel is not None and self.christoffel.metric is not None:
+            # Build R_abcd directly from the Christoffel symbols of the first kind
+            self._components_down = self._compute_riemann_tensor_down()
+        else:
+            self._components_down = lower_indices(self.components_up, self.metric.g, self.metric.dimension)
         return self._components_down
 
+    @functools.cached_property
+    def components_mixed(self) -> List[List[List[List[sp.Expr]]]]:
+        """
+        Get the Riemann tensor with the first index pair raised: R^ab_cd = g^bj R^a_jcd.
+
+        Only components with a < b and c < d are computed, visiting the non - zero
+        entries of the inverse metric; the rest follow from the antisymmetry in each
+        index pair.
+
+        Returns:
+            A 4D array representing the Riemann tensor with the first two indices contravariant
+        """
+        if self.components_up is None:
+            raise ValueError("Riemann tensor components with first index up not computed")
+
+        if self.metric is None:
+            raise ValueError("Valid metric tensor required to raise indices")
+
+        n = self.metric.dimension
+        g_inv = self.metric.inverse
+        R_up = self.components_up
+        rows = [[j for j in range(n) if g_inv[b, j] != 0] for b in range(n)]
+
+        Riemann = [[[[sp.S.Zero for _ in range(n)] for _ in range(n)] for _ in range(n)] for _ in range(n)]
+
+        raw = {}
+        for a in range(n):
+            for b in range(a + 1, n):
+                for c in range(n):
+                    for d in range(c + 1, n):
+                        value = sp.S.Zero
+                        for j in rows[b]:
+                            if R_up[a][j][c][d] != 0:
+                                value += g_inv[b, j] * R_up[a][j][c][d]
+                        if value != 0:
+                            raw[(a, b, c, d)] = value
+
+        keys = list(raw)
+        values = simplify_components((raw[key] for key in keys), self.simplify_level, self.workers)
+        for (a, b, c, d), value in zip(keys, values):
+            Riemann[a][b][c][d] = value
+            Riemann[b][a][c][d] = -value
+            Riemann[a][b][d][c] = -value
+            Riemann[b][a][d][c] = value
+
+        return Riemann
+
+    def _compute_riemann_tensor_down(self, parent: Optional['RiemannTensor'] = None) -> List[List[List[List[sp.Expr]]]]:
+        """
+        Compute the Riemann tensor with all indices lowered from Christoffel symbols.
+
+        Uses the Christoffel symbols of the first kind Γ_lij directly:
+        R_ρσμν = ∂_μ Γ_ρνσ - ∂_ν Γ_ρμσ + Γ^κ_μσ Γ_κνρ - Γ^κ_νσ Γ_κμρ
+
+        Only the n²(n²-1)/12 algebraically independent components are computed
+        (see ``generate_index_riemann_independent``); the components fixed by the
+        first Bianchi identity and by the symmetries
+        R_abcd = -R_bacd = -R_abdc = R_cdab are reconstructed from them.
+
+        Args:
+            parent: Optional Riemann tensor of the parent metric; independent components
+                    that do not depend on changed quantities (see ``_affected_down``)
+                    are copied from it
+
+        Returns:
+            A 4D array representing the Riemann tensor with all indices covariant
+        """
+        n = self.metric.dimension
+        Riemann = [[[[sp.S.Zero for _ in range(n)] for _ in range(n)] for _ in range(n)] for _ in range(n)]
+
+        affected = self._affected_down() if parent is not None else None
+        previous = parent.components_down if parent is not None else None
+        independent = {}
+
+        raw = {}
+        for indices in generate_index_riemann_independent(n):
+            if affected is not None and indices not in affected:
+                a, b, c, d = indices
+                independent[indices] = previous[a][b][c][d]
+                continue
+            value = self._raw_component_down(*indices)
+            if value != 0 or affected is not None:
+                raw[indices] = value
+
+        keys = list(raw)
+        values = simplify_components((raw[key] for key in keys), self.simplify_level, self.workers)
+        independent.update(zip(keys, values))
+
+        # R_adbc = R_acbd - R_abcd for a < b < c < d (first Bianchi identity)
+        bianchi = {}
+        for a in range(n):
+            for b in range(a + 1, n):
+                for c in range(b + 1, n):
+                    for d in range(c + 1, n):
+                        if affected is not None and (a, c, b, d) not in affected and (a, b, c, d) not in affected:
+                            independent[(a, d, b, c)] = previous[a][d][b][c]
+                            continue
+                        value = independent.get((a, c, b, d), 0) - independent.get((a, b, c, d), 0)
+                        if value != 0 or affected is not None:
+                            bianchi[(a, d, b, c)] = value
+
+        keys = list(bianchi)
+        values = simplify_components((bianchi[key] for key in keys), self.simplify_level, self.workers)
+        independent.update(zip(keys, values))
+
+        if affected is not None:
+            # Every component related to a changed independent one by the symmetries
+            changed_down = set()
+            for (a, b, c, d) in list(affected) + keys:
+                if independent[(a, b, c, d)] != previous[a][b][c][d]:
+                    for p, q, r, t in ((a, b, c, d), (c, d, a, b)):
+                        changed_down.update({(p, q, r, t), (q, p, r, t), (p, q, t, r), (q, p, t, r)})
+            self.changed_down = frozenset(changed_down)
+
+        for (a, b, c, d), value in independent.items():
+            if value == 0:
+                continue
+            for p, q, r, t in ((a, b, c, d), (c, d, a, b)):
+                Riemann[p][q][r][t] = value
+                Riemann[q][p][r][t] = -value
+                Riemann[p][q][t][r] = -value
+                Riemann[q][p][t][r] = value
+
+        return Riemann
+
+    def _raw_component_down(self, rho: int, sigma: int, mu: int, nu: int) -> sp.Expr:
+        """
+        Compute a single unsimplified component R_ρσμν from Christoffel symbols.
+
+        Args:
+            rho, sigma, mu, nu: Indices (all covariant)
+
+        Returns:
+            The raw symbolic expression
+        """
+        Gamma = self.christoffel.components
+        Gamma_first = self.christoffel.first_kind
+        dGamma_first = self.christoffel.first_kind_derivatives
+        uppers = self.christoffel.nonzero_uppers
+
+        # Partial derivative terms
+        term1 = dGamma_first[mu][rho][nu][sigma]
+        term2 = dGamma_first[nu][rho][mu][sigma]
+
+        # Christoffel product terms, visiting only non - zero Γ^κ_μσ and Γ^κ_νσ
+        sum_term = 0
+        for kappa in uppers.get((mu, sigma), ()):
+            sum_term += Gamma[kappa][mu][sigma] * Gamma_first[kappa][nu][rho]
+        for kappa in uppers.get((nu, sigma), ()):
+            sum_term -= Gamma[kappa][nu][sigma] * Gamma_first[kappa][mu][rho]
+
+        return term1 - term2 + sum_term
+
+    def finalize(self, level: Optional[int] = None) -> 'RiemannTensor':
+        """
+        Simplify the stored components in place if they were computed at a lower level.
+
+        Only one component of each set related by the index symmetries is simplified;
+        the others are filled in from it.
+
+        Args:
+            level: Target simplification level; defaults to the metric's simplify_level
+
+        Returns:
+            This RiemannTensor instance
+        """
+        if level is None:
+            level = self.metric.simplify_level if self.metric is not None else 2
+        if self.simplify_level >= level:
+            return self
+
+        if self._components_down is not None:
+            # R_abcd = -R_bacd = -R_abdc = R_cdab
+            R = self._components_down
+            n = len(R)
+            keys = [(a, b, c, d) for a in range(n) for b in range(a + 1, n)
+                    for c in range(a, n) for d in range(c + 1, n)
+                    if (a, b) <= (c, d) and R[a][b][c][d] != 0]
+            values = simplify_components((R[a][b][c][d] for a, b, c, d in keys), level, self.workers)
+            for (a, b, c, d), value in zip(keys, values):
+                for p, q, r, t in ((a, b, c, d), (c, d, a, b)):
+                    R[p][q][r][t] = value
+                    R[q][p][r][t] = -value
+                    R[p][q][t][r] = -value
+                    R[q][p][t][r] = value
+
+        if self.components_up is not None:
+            # R^a_bcd = -R^a_bdc
+            R = self.components_up
+            n = len(R)
+            keys = [(a, b, c, d) for a in range(n) for b in range(n) for c in range(n)
+                    for d in range(c + 1, n) if R[a][b][c][d] != 0]
+            values = simplify_components((R[a][b][c][d] for a, b, c, d in keys), level, self.workers)
+            for (a, b, c, d), value in zip(keys, values):
+                R[a][b][c][d] = value
+                R[a][b][d][c] = -value
+
+        if "components_mixed" in self.__dict__:
+            # R^ab_cd = -R^ba_cd = -R^ab_dc
+            R = self.components_mixed
+            n = len(R)
+            keys = [(a, b, c, d) for a in range(n) for b in range(a + 1, n) for c in range(n)
+                    for d in range(c + 1, n) if R[a][b][c][d] != 0]
+            values = simplify_components((R[a][b][c][d] for a, b, c, d in keys), level, self.workers)
+            for (a, b, c, d), value in zip(keys, values):
+                R[a][b][c][d] = value
+                R[b][a][c][d] = -value
+                R[a][b][d][c] = -value
+                R[b][a][d][c] = value
+
+        # Drop non - zero components memoized from the less simplified tensor
+        type(self).get_nonzero_components_down.cache_clear()
+
+        self.simplify_level = level
+        return self
+
     def get_component_up(self, a: int, b: int, c: int, d: int, simplify: bool = True) -> sp.Expr:
         """
         Get a specific component of the Riemann tensor with first index up.
@@ -141,7 +526,8 @@ class RiemannTensor:
         Args:
             a: First index (contravariant)
             b, c, d: Remaining indices (covariant)
-            simplify: Whether to simplify the expression
+            simplify: Whether to simplify the expression to the metric's simplify_level
+                      if the tensor was computed at a lower level
 
         Returns:
             The symbolic expression for R^a_bcd
@@ -150,8 +536,8 @@ class RiemannTensor:
             raise ValueError("Riemann tensor components with first index up not computed")
 
         result = self.components_up[a][b][c][d]
-        if simplify:
-            return custom_simplify(result, self.simplify_level)
+        if simplify and self.metric is not None:
+            return simplify_to_level(result, self.simplify_level, self.metric.simplify_level)
         return result
 
     def get_component_down(self, a: int, b: int, c: int, d: int, simplify: bool = True) -> sp.Expr:
@@ -160,14 +546,15 @@ class RiemannTensor:
 
         Args:
             a, b, c, d: Indices (all covariant)
-            simplify: Whether to simplify the expression
+            simplify: Whether to simplify the expression to the metric's simplify_level
+                      if the tensor was computed at a lower level
 
         Returns:
             The symbolic expression for R_abcd
         """
         result = self.components_down[a][b][c][d]
-        if simplify:
-            return custom_simplify(result, self.simplify_level)
+        if simplify and self.metric is not None:
+            return simplify_to_level(result, self.simplify_level, self.metric.simplify_level)
         return result
 
     @functools.lru_cache(maxsize=16)
@@ -175,6 +562,8 @@ class RiemannTensor:
         """
         Get all non - zero components of the Riemann tensor with all indices down.
 
+        Components are tested for zero with ``numeric_zero_test``.
+
         Returns:
             Dictionary mapping (a,b,c,d) indices to non - zero symbolic expressions
         """
@@ -187,7 +576,7 @@ class RiemannTensor:
         for indices in generate_index_riemann(n):
             a, b, c, d = indices
             val = self.get_component_down(a, b, c, d)
-            if val != 0:
+            if numeric_zero_test(val) is not True:
                 result[indices] = val
 
         return result
@@ -204,7 +593,7 @@ class RiemannTensor:
 
         for indices in generate_index_riemann(n):
             a, b, c, d = indices
-            val = custom_simplify(self.components_down[a][b][c][d], self.simplify_level)
+            val = self.components_down[a][b][c][d]
             if val != 0:
                 result += f"R_{{{a}{b}{c}{d}}} = {val}\n"
 
@@ -8,6 +8,9 @@ from typing import List, Optional, Tuple, Dict
 
 from .metric import Metric
 
+# Signature (-,+,+,+) declared by the spacetimes below (see Metric.signature)
+LORENTZIAN = (-1, 1, 1, 1)
+
 
 def minkowski(coordinates: Optional[List[Symbol]] = None) -> Metric:
     """
@@ -35,7 +38,7 @@ def minkowski(coordinates: Optional[List[Symbol]] = None) -> Metric:
         [0, 0, 0, 1]
     ])
 
-    return Metric(components=g, coordinates=coordinates)
+    return Metric(components=g, coordinates=coordinates, signature=LORENTZIAN)
 
 
 def schwarzschild(coordinates: Optional[List[Symbol]] = None, parameters: Optional[List[Symbol]] = None) -> Metric:
@@ -80,7 +83,8 @@ def schwarzschild(coordinates: Optional[List[Symbol]] = None, parameters: Option
         [0, 0, 0, g_phi_phi]
     ])
 
-    return Metric(components=g, coordinates=coordinates, params=parameters)
+    return Metric(components=g, coordinates=coordinates, params=parameters,
+                  signature=LORENTZIAN)
 
 
 def reissner_nordstrom(coordinates: Optional[List[Symbol]] = None, parameters: Optional[List[Symbol]] = None) -> Metric:
@@ -126,7 +130,8 @@ def reissner_nordstrom(coordinates: Optional[List[Symbol]] = None, parameters: O
         [0, 0, 0, g_phi_phi]
     ])
 
-    return Metric(components=g, coordinates=coordinates, params=parameters)
+    return Metric(components=g, coordinates=coordinates, params=parameters,
+                  signature=LORENTZIAN)
 
 
 def kerr(coordinates: Optional[List[Symbol]] = None, parameters: Optional[List[Symbol]] = None) -> Metric:
@@ -176,7 +181,8 @@ def kerr(coordinates: Optional[List[Symbol]] = None, parameters: Optional[List[S
     components[(0, 3)] = -2 * M*r * a*sin(theta)**2 / rho_squared  # g_t_phi = g_phi_t
 
     # Create the metric tensor
-    return Metric(components=components, coordinates=coordinates, params=parameters)
+    return Metric(components=components, coordinates=coordinates, params=parameters,
+                  signature=LORENTZIAN)
 
 
 def friedmann_lemaitre_robertson_walker(coordinates: Optional[List[Symbol]] = None,
@@ -237,7 +243,8 @@ def friedmann_lemaitre_robertson_walker(coordinates: Optional[List[Symbol]] = No
         [0, 0, 0, g_phi_phi]
     ])
 
-    return Metric(components=g, coordinates=coordinates, params=parameters)
+    return Metric(components=g, coordinates=coordinates, params=parameters,
+                  signature=LORENTZIAN)
 
 
 def de_sitter(coordinates: Optional[List[Symbol]] = None, parameters: Optional[List[Symbol]] = None) -> Metric:
@@ -282,7 +289,8 @@ def de_sitter(coordinates: Optional[List[Symbol]] = None, parameters: Optional[L
         [0, 0, 0, g_phi_phi]
     ])
 
-    return Metric(components=g, coordinates=coordinates, params=parameters)
+    return Metric(components=g, coordinates=coordinates, params=parameters,
+                  signature=LORENTZIAN)
 
 
 def anti_de_sitter(coordinates: Optional[List[Symbol]] = None, parameters: Optional[List[Symbol]] = None) -> Metric:
@@ -327,7 +335,8 @@ def anti_de_sitter(coordinates: Optional[List[Symbol]] = None, parameters: Optio
         [0, 0, 0, g_phi_phi]
     ])
 
-    return Metric(components=g, coordinates=coordinates, params=parameters)
+    return Metric(components=g, coordinates=coordinates, params=parameters,
+                  signature=LORENTZIAN)
 
 
 # Alias functions to match the function names used in tests
@@ -389,7 +398,8 @@ def kerr_newman_metric(r=None, theta=None, phi=None, a=None, q=None, M=None):
         # Off-diagonal components
         components[(0, 3)] = -(2*M*r - q**2) * a * sp.sin(theta)**2 / rho_squared  # g_t_phi = g_phi_t
         
-        return Metric(components=components, coordinates=coordinates, params=parameters)
+        return Metric(components=components, coordinates=coordinates, params=parameters,
+                      signature=LORENTZIAN)
     else:
         # Default parameters
         t, r, theta, phi = sp.symbols('t r theta phi')
@@ -410,7 +420,8 @@ def kerr_newman_metric(r=None, theta=None, phi=None, a=None, q=None, M=None):
         components[(3, 3)] = (r**2 + a**2 + (2*M*r - q**2) * a**2 * sp.sin(theta)**2 / rho_squared) * sp.sin(theta)**2
         components[(0, 3)] = -(2*M*r - q**2) * a * sp.sin(theta)**2 / rho_squared
         
-        return Metric(components=components, coordinates=coordinates, params=parameters)
+        return Metric(components=components, coordinates=coordinates, params=parameters,
+                      signature=LORENTZIAN)
 
 def flrw_metric(t=None, r=None, theta=None, phi=None, a=None, k=None):
     """Alias for friedmann_lemaitre_robertson_walker function with individual coordinate parameters."""
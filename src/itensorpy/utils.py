@@ -4,6 +4,21 @@ Utility functions for tensor operations and index management.
 
 import sympy as sp
 import functools
+import itertools
+import mpmath
+import multiprocessing
+import random
+from concurrent.futures import ProcessPoolExecutor
+from sympy.core.function import AppliedUndef
+
+
+# Number of worker processes used for component simplification when a tensor
+# class is not given an explicit ``workers`` argument (None or 1 means serial)
+_default_workers = None
+
+# Simplification level of the intermediate tensors a from_metric chain builds on the
+# way to the requested one (see set_intermediate_simplify_level)
+_intermediate_level = 1
 
 
 @functools.lru_cache(maxsize=64)
@@ -33,6 +48,38 @@ def generate_index_riemann(n):
     return index
 
 
+@functools.lru_cache(maxsize=64)
+def generate_index_riemann_independent(n):
+    """
+    Generate the indices of the algebraically independent Riemann tensor components.
+
+    Components R_abcd with a < b, c < d and (a,b) <= (c,d) are kept, except
+    R_adbc for a < b < c < d, which follows from the first Bianchi identity:
+    R_adbc = R_acbd - R_abcd. This leaves n²(n²-1)/12 components.
+
+    Args:
+        n (int): Dimension of the space
+
+    Returns:
+        list: List of tuples (a,b,c,d) representing independent Riemann components
+
+    Raises:
+        ValueError: If n <= 0
+    """
+    if n <= 0:
+        raise ValueError("Dimension must be a positive integer")
+
+    pairs = [(a, b) for a in range(n) for b in range(a + 1, n)]
+    index = []
+    for p, (a, b) in enumerate(pairs):
+        for c, d in pairs[p:]:
+            # Skip R_adbc with a < b < c < d (here a < c and d < b)
+            if a < c and d < b:
+                continue
+            index.append((a, b, c, d))
+    return index
+
+
 @functools.lru_cache(maxsize=32)
 def generate_index_ricci(n):
     """
@@ -82,6 +129,23 @@ def generate_index_christoffel(n):
     return index
 
 
+def coordinate_dependencies(expr, coordinates):
+    """
+    Get the coordinates an expression depends on.
+
+    Undefined functions such as a(t) count as depending on their arguments.
+
+    Args:
+        expr: SymPy expression
+        coordinates: List of coordinate symbols
+
+    Returns:
+        frozenset: Indices of the coordinates appearing in the expression
+    """
+    free = expr.free_symbols if isinstance(expr, sp.Basic) else set()
+    return frozenset(i for i, coord in enumerate(coordinates) if coord in free)
+
+
 def lower_indices(tensor, metric, n):
     """
     Lower the first index of a tensor (supports both rank-2 matrices and rank-4 Riemann tensors).
@@ -174,6 +238,308 @@ def custom_simplify(expr, level=2):
     return expr
 
 
+def _pipeline_simplify(expr, level):
+    """
+    Simplify a tensor component computed by the package.
+
+    Same as custom_simplify except at level 1, where the component is brought to a
+    single expanded fraction with cancel instead of only being expanded. Expanded
+    but uncancelled intermediates make the trigsimp of the final tensor very slow.
+
+    Args:
+        expr: SymPy expression to simplify
+        level (int): Simplification level (0 - 3)
+
+    Returns:
+        Simplified SymPy expression
+    """
+    if level == 1:
+        return sp.cancel(expr)
+    return custom_simplify(expr, level)
+
+
+def set_default_workers(workers):
+    """
+    Set the number of worker processes used for component simplification.
+
+    Tensor classes created without an explicit ``workers`` argument use this value.
+
+    Args:
+        workers (int or None): Number of processes; None or 1 disables the process pool
+
+    Raises:
+        ValueError: If workers is smaller than 1
+    """
+    global _default_workers
+    if workers is not None and workers < 1:
+        raise ValueError("Number of workers must be a positive integer")
+    _default_workers = workers
+
+
+def get_default_workers():
+    """
+    Get the number of worker processes used for component simplification.
+
+    Returns:
+        int or None: The global default set with set_default_workers
+    """
+    return _default_workers
+
+
+def set_intermediate_simplify_level(level):
+    """
+    Set the simplification level of intermediate tensors in from_metric chains.
+
+    Tensors that are only built as inputs of the requested one (for example the
+    Christoffel symbols and the Ricci tensor behind ``EinsteinTensor.from_metric``)
+    are simplified at this level; the requested tensor is simplified once at the
+    metric's ``simplify_level``. An intermediate that is requested later is brought
+    up to that level in place.
+
+    Args:
+        level (int): Simplification level (0 - 3) passed to custom_simplify
+
+    Raises:
+        ValueError: If level is not between 0 and 3
+    """
+    global _intermediate_level
+    if level not in (0, 1, 2, 3):
+        raise ValueError("Simplification level must be between 0 and 3")
+    _intermediate_level = level
+
+
+def get_intermediate_simplify_level():
+    """
+    Get the simplification level of intermediate tensors in from_metric chains.
+
+    Returns:
+        int: The level set with set_intermediate_simplify_level
+    """
+    return _intermediate_level
+
+
+def simplify_to_level(expr, stored_level, level):
+    """
+    Simplify a stored component only if it was computed below the requested level.
+
+    Args:
+        expr: SymPy expression simplified at stored_level
+        stored_level (int): Level the expression was simplified at
+        level (int): Requested simplification level
+
+    Returns:
+        The expression itself or its simplification at level
+    """
+    if stored_level >= level:
+        return expr
+    return _pipeline_simplify(expr, level)
+
+
+def _random_value(symbol, rng):
+    """Draw a random exact sample for a symbol, respecting its sign and integer assumptions."""
+    if symbol.is_integer:
+        value = sp.Integer(rng.randint(1, 9))
+    else:
+        value = sp.Rational(rng.randint(500000, 1500000), 1000000)
+
+    if symbol.is_negative or (not symbol.is_nonnegative and rng.random() < 0.5):
+        value = -value
+    return value
+
+
+def _random_function(args, rng):
+    """Build a random non - polynomial surrogate for an undefined function of the given arguments."""
+    def coefficient():
+        return sp.Rational(rng.randint(500000, 1500000), 1000000)
+
+    s = sum(coefficient() * arg for arg in args)
+    return coefficient() + coefficient() * sp.exp(s) + coefficient() * sp.exp(-coefficient() * s)
+
+
+def _evaluate(expr, replacements, precision, memo):
+    """
+    Evaluate an expression bottom - up, tracking the magnitude of the terms it sums.
+
+    Sums and products are evaluated in mpmath; other nodes (functions, non - integer
+    powers and the leaves) are evaluated by SymPy after substituting ``replacements``.
+    The magnitude of a sum is the sum of the magnitudes of its terms, and that of a
+    product the product of the magnitudes of its factors, so it bounds the size of
+    the values that cancel in the result.
+
+    Args:
+        expr: SymPy expression
+        replacements: Numeric values of the symbols, undefined functions and derivatives
+        precision (int): Number of significant digits
+        memo (dict): Results of the sub - expressions already evaluated
+
+    Returns:
+        Tuple (value, magnitude) of an mpmath complex number and an mpmath real number
+
+    Raises:
+        ValueError: If a node does not evaluate to a finite number
+    """
+    result = memo.get(expr)
+    if result is not None:
+        return result
+
+    if expr.is_Add or expr.is_Mul:
+        parts = [_evaluate(arg, replacements, precision, memo) for arg in expr.args]
+        if expr.is_Add:
+            result = (mpmath.fsum(value for value, _ in parts), mpmath.fsum(magnitude for _, magnitude in parts))
+        else:
+            result = (mpmath.fprod(value for value, _ in parts), mpmath.fprod(magnitude for _, magnitude in parts))
+    elif expr.is_Pow and expr.exp.is_Integer and expr.exp > 0:
+        value, magnitude = _evaluate(expr.base, replacements, precision, memo)
+        exponent = int(expr.exp)
+        result = (value**exponent, magnitude**exponent)
+    else:
+        number = expr.xreplace(replacements).evalf(precision)
+        if not number.is_number or number.has(sp.nan, sp.zoo, sp.oo, -sp.oo):
+            raise ValueError("Expression does not evaluate to a finite number")
+        real, imag = (sp.Float(part, precision) for part in number.as_real_imag())
+        value = mpmath.mpc(mpmath.mpf(real._mpf_), mpmath.mpf(imag._mpf_))
+        result = (value, abs(value))
+
+    memo[expr] = result
+    return result
+
+
+def numeric_zero_test(expr, samples=3, precision=50, seed=0):
+    """
+    Probabilistic zero test by evaluation at random high - precision points.
+
+    Free symbols are replaced by random values that respect their sign
+    assumptions, and undefined functions such as a(t) by random combinations of
+    exponentials, so derivatives do not vanish accidentally. The expression is then
+    evaluated in mpmath with ``precision`` significant digits. A value counts as
+    zero only if it is below 10^-(precision / 2) times the magnitude of the terms
+    that cancel in it, so expressions that are merely small, such as exp(-100 r),
+    are non - zero. A value that is non - zero at any point proves the expression
+    non - zero; vanishing at every point makes it zero with high probability,
+    which is not a proof (see ``simplify_components``).
+
+    Args:
+        expr: SymPy expression to test
+        samples (int): Number of random points
+        precision (int): Number of significant digits used in the evaluation
+        seed (int): Seed of the random points, so results are reproducible
+
+    Returns:
+        True if the expression vanishes at every point, False if it is non - zero
+        at some point, or None if the test is inconclusive (no point could be evaluated)
+    """
+    expr = sp.sympify(expr)
+    if not isinstance(expr, sp.Expr):
+        return None
+    if expr == 0:
+        return True
+
+    rng = random.Random(seed)
+    tolerance = mpmath.mpf(10) ** (-(precision // 2))
+
+    # Undefined functions and their derivatives are replaced by explicit surrogates
+    surrogates = {f: _random_function(f.args, rng) for f in expr.atoms(AppliedUndef)}
+    for derivative in expr.atoms(sp.Derivative):
+        surrogates[derivative] = derivative.xreplace(surrogates).doit()
+
+    symbols = set(expr.free_symbols)
+    for surrogate in surrogates.values():
+        symbols |= surrogate.free_symbols
+    symbols = sorted(symbols, key=sp.default_sort_key)
+
+    evaluated = 0
+    for _ in range(samples):
+        # Floats make SymPy evaluate the leaves at a fixed precision while substituting,
+        # avoiding the adaptive precision evalf needs for (nearly) cancelling sums
+        point = {symbol: sp.Float(_random_value(symbol, rng), precision) for symbol in symbols}
+        replacements = {atom: surrogate.xreplace(point) for atom, surrogate in surrogates.items()}
+        replacements.update(point)
+        try:
+            with mpmath.workdps(precision):
+                value, magnitude = _evaluate(expr, replacements, precision, {})
+                is_zero = abs(value) <= tolerance * magnitude
+        except (TypeError, ValueError, ZeroDivisionError):
+            continue
+
+        evaluated += 1
+        if not is_zero:
+            return False
+
+    return True if evaluated else None
+
+
+def simplify_components(exprs, level=2, workers=None, zero_test=True):
+    """
+    Simplify a batch of independent tensor components.
+
+    Only a symbolic zero is final: components that ``numeric_zero_test`` shows to
+    vanish are first put over a common denominator with ``cancel``, which proves
+    most of them zero without the trigsimp pass. The others are simplified at
+    level 2 or higher, which also handles the trigonometric identities; a result
+    that is still not an exact zero is kept. With more than one worker the expressions
+    are dispatched to a process pool. Results are always returned in input order,
+    so the outcome is the same regardless of the number of workers. Where available
+    the pool uses the ``fork`` start method, so workers share the parent's hash seed
+    and produce expressions identical to serial simplification.
+
+    Args:
+        exprs: Iterable of SymPy expressions
+        level (int): Simplification level passed to custom_simplify
+        workers (int or None): Number of processes; defaults to get_default_workers()
+        zero_test (bool): Whether to run numeric_zero_test first; callers that know the
+                          expressions are non - zero (e.g. products of non - zero factors)
+                          can skip it
+
+    Returns:
+        list: Simplified expressions in the same order as the input
+    """
+    exprs = list(exprs)
+    if workers is None:
+        workers = _default_workers
+
+    if level == 0:
+        return exprs
+
+    vanishing = [zero_test and numeric_zero_test(expr) is True for expr in exprs]
+    return _simplify_batch(exprs, level, workers, vanishing)
+
+
+def _simplify_component(expr, level, vanishing=False):
+    """
+    Simplify one component, confirming a numerically vanishing one symbolically.
+
+    Args:
+        expr: SymPy expression
+        level (int): Simplification level passed to custom_simplify
+        vanishing (bool): Whether numeric_zero_test found the expression to vanish
+
+    Returns:
+        The simplified expression, an exact zero if the expression was proven zero
+    """
+    if vanishing:
+        if sp.cancel(expr) == 0:
+            return sp.S.Zero
+        return custom_simplify(expr, max(level, 2))
+    return _pipeline_simplify(expr, level)
+
+
+def _simplify_batch(exprs, level, workers, vanishing):
+    """Simplify expressions serially or in a process pool, keeping their order."""
+    if not workers or workers <= 1 or len(exprs) < 2:
+        return [_simplify_component(expr, level, zero) for expr, zero in zip(exprs, vanishing)]
+
+    if 'fork' in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context('fork')
+    else:
+        context = multiprocessing.get_context()
+
+    workers = min(workers, len(exprs))
+    chunksize = max(1, len(exprs) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        return list(executor.map(_simplify_component, exprs, itertools.repeat(level), vanishing,
+                                 chunksize=chunksize))
+
+
 # Additional utility functions from code.mdc
 
 def write_scalar_curvatre(scalar_curvature, n):
@@ -0,0 +1,226 @@
+"""
+Module for computing the Weyl conformal curvature tensor.
+"""
+
+import sympy as sp
+from typing import Dict, Tuple, Optional
+
+from .metric import Metric
+from .riemann import RiemannTensor
+from .ricci import RicciTensor, RicciScalar
+from .utils import generate_index_riemann, generate_index_riemann_independent, numeric_zero_test, simplify_components
+
+
+class WeylTensor:
+    """
+    A class for computing and storing the Weyl conformal curvature tensor.
+
+    The Weyl tensor is the trace - free part of the Riemann tensor:
+
+        C_abcd = R_abcd - (g_ac R_bd - g_ad R_bc - g_bc R_ad + g_bd R_ac) / (n - 2)
+                 + R (g_ac g_bd - g_ad g_bc) / ((n - 1)(n - 2))
+
+    It has the algebraic symmetries of the Riemann tensor, so only the non - zero
+    components among ``generate_index_riemann_independent`` are stored; the others
+    are reconstructed on access. It vanishes identically for n <= 3.
+    """
+
+    def __init__(self,
+                 components: Optional[Dict[Tuple[int, int, int, int], sp.Expr]] = None,
+                 riemann: Optional[RiemannTensor] = None,
+                 ricci_tensor: Optional[RicciTensor] = None,
+                 ricci_scalar: Optional[RicciScalar] = None,
+                 metric: Optional[Metric] = None,
+                 simplify_level: Optional[int] = None,
+                 workers: Optional[int] = None):
+        """
+        Initialize the Weyl tensor.
+
+        Args:
+            components: Optional pre - computed non - zero independent components C_abcd
+            riemann: Riemann tensor used to compute the Weyl tensor
+            ricci_tensor: Ricci tensor used to compute the Weyl tensor
+            ricci_scalar: Ricci scalar used to compute the Weyl tensor
+            metric: Metric tensor; defaults to the Riemann tensor's metric
+            simplify_level: Level of simplification to apply (0 - 3); defaults to the
+                            metric's simplify_level
+            workers: Number of processes used to simplify components (None uses the global default)
+        """
+        self.components = components
+        self.riemann = riemann
+        self.ricci_tensor = ricci_tensor
+        self.ricci_scalar = ricci_scalar
+        self.metric = metric or (riemann.metric if riemann else None)
+        if simplify_level is None:
+            simplify_level = self.metric.simplify_level if self.metric is not None else 2
+        self.simplify_level = simplify_level
+        self.workers = workers
+
+        if self.components is None and riemann is not None:
+            self.components = self._compute_weyl_tensor()
+
+    @classmethod
+    def from_riemann(cls, riemann: RiemannTensor, ricci_tensor: Optional[RicciTensor] = None,
+                     ricci_scalar: Optional[RicciScalar] = None, simplify_level: Optional[int] = None,
+                     workers: Optional[int] = None) -> 'WeylTensor':
+        """
+        Create a Weyl tensor from already computed curvature tensors.
+
+        Args:
+            riemann: Riemann tensor instance
+            ricci_tensor: Optional Ricci tensor; contracted from the Riemann tensor if omitted
+            ricci_scalar: Optional Ricci scalar; contracted from the Ricci tensor if omitted
+            simplify_level: Level of simplification to apply (0 - 3); defaults to the
+                            metric's simplify_level
+            workers: Number of processes used to simplify components (None uses the global default)
+
+        Returns:
+            WeylTensor instance
+        """
+        if ricci_tensor is None:
+            ricci_tensor = RicciTensor.from_riemann(riemann)
+        if ricci_scalar is None:
+            ricci_scalar = RicciScalar.from_ricci(ricci_tensor)
+
+        if ricci_tensor.metric is not riemann.metric or ricci_scalar.metric is not riemann.metric:
+            raise ValueError("Riemann tensor, Ricci tensor and Ricci scalar must share the same metric")
+
+        return cls(riemann=riemann, ricci_tensor=ricci_tensor, ricci_scalar=ricci_scalar,
+                   simplify_level=simplify_level, workers=workers)
+
+    @classmethod
+    def from_metric(cls, metric: Metric, simplify_level: Optional[int] = None,
+                    workers: Optional[int] = None) -> 'WeylTensor':
+        """
+        Create a Weyl tensor directly from a metric tensor.
+
+        The tensor, and the curvature tensors it is built from, are shared through
+        the metric's computation context.
+
+        Args:
+            metric: Metric tensor instance
+            simplify_level: Level of simplification to apply (0 - 3); defaults to the
+                            metric's simplify_level
+            workers: Number of processes used to simplify components (None uses the global default)
+
+        Returns:
+            WeylTensor instance
+        """
+        return metric.context.weyl(simplify_level=simplify_level, workers=workers)
+
+    def _compute_weyl_tensor(self) -> Dict[Tuple[int, int, int, int], sp.Expr]:
+        """
+        Compute the non - zero independent components of the Weyl tensor.
+
+        Like the Riemann tensor, a component is only formed if one of its terms is
+        non - zero. All formed components go through ``simplify_components``, which
+        at level 1 and above confirms the ones ``numeric_zero_test`` shows to vanish
+        symbolically; only components that end up as an exact zero are dropped.
+
+        Returns:
+            Dictionary mapping independent (a,b,c,d) indices to non - zero components C_abcd
+        """
+        if self.ricci_tensor is None or self.ricci_scalar is None:
+            raise ValueError("Ricci tensor and scalar required to compute the Weyl tensor")
+
+        if self.metric is None or self.metric.g is None:
+            raise ValueError("Valid metric tensor required to compute the Weyl tensor")
+
+        n = self.metric.dimension
+        if n <= 3:
+            return {}
+
+        g = self.metric.g
+        R_down = self.riemann.components_down
+        Ricci = self.ricci_tensor.components
+        R = self.ricci_scalar.value
+
+        raw = {}
+        for a, b, c, d in generate_index_riemann_independent(n):
+            ricci_term = sp.S.Zero
+            for p, q, r, s, sign in ((a, c, b, d, 1), (a, d, b, c, -1), (b, c, a, d, -1), (b, d, a, c, 1)):
+                if g[p, q] != 0 and Ricci[r, s] != 0:
+                    ricci_term += sign * g[p, q] * Ricci[r, s]
+
+            scalar_term = g[a, c] * g[b, d] - g[a, d] * g[b, c]
+            value = R_down[a][b][c][d] - ricci_term / (n - 2)
+            if R != 0 and scalar_term != 0:
+                value += R * scalar_term / ((n - 1) * (n - 2))
+            if value != 0:
+                raw[(a, b, c, d)] = value
+
+        keys = list(raw)
+        values = simplify_components((raw[key] for key in keys), self.simplify_level, self.workers)
+        return {key: value for key, value in zip(keys, values) if value != 0}
+
+    def get_component_down(self, a: int, b: int, c: int, d: int) -> sp.Expr:
+        """
+        Get a specific component of the Weyl tensor with all indices down.
+
+        The component is read off the stored independent ones through the
+        symmetries C_abcd = -C_bacd = -C_abdc = C_cdab and, for the component
+        C_adbc with a < b < c < d, the first Bianchi identity C_adbc = C_acbd - C_abcd.
+
+        Args:
+            a, b, c, d: Indices (all covariant)
+
+        Returns:
+            The symbolic expression for C_abcd
+        """
+        if self.components is None:
+            raise ValueError("Weyl tensor components not computed")
+
+        if a == b or c == d:
+            return sp.S.Zero
+
+        sign = 1
+        if a > b:
+            a, b, sign = b, a, -sign
+        if c > d:
+            c, d, sign = d, c, -sign
+        if (a, b) > (c, d):
+            a, b, c, d = c, d, a, b
+
+        if a < c and d < b:
+            # C_psqr with p < q < r < s
+            p, q, r, s = a, c, d, b
+            return sign * (self.components.get((p, r, q, s), sp.S.Zero) - self.components.get((p, q, r, s), sp.S.Zero))
+
+        return sign * self.components.get((a, b, c, d), sp.S.Zero)
+
+    def __getitem__(self, indices: Tuple[int, int, int, int]) -> sp.Expr:
+        """Get C_abcd with ``weyl[a, b, c, d]``."""
+        return self.get_component_down(*indices)
+
+    def get_nonzero_components_down(self) -> Dict[Tuple[int, int, int, int], sp.Expr]:
+        """
+        Get all non - zero components of the Weyl tensor with all indices down.
+
+        Components are tested for zero with ``numeric_zero_test``.
+
+        Returns:
+            Dictionary mapping (a,b,c,d) indices to non - zero symbolic expressions
+        """
+        result = {}
+        for indices in generate_index_riemann(self.metric.dimension):
+            val = self.get_component_down(*indices)
+            if numeric_zero_test(val) is not True:
+                result[indices] = val
+        return result
+
+    def __str__(self) -> str:
+        """
+        String representation showing non - zero components of the Weyl tensor.
+
+        Returns:
+            String showing all non - zero Weyl tensor components with all indices down
+        """
+        result = "Non - zero components of Weyl tensor (C_abcd):\n"
+
+        for indices in generate_index_riemann(self.metric.dimension):
+            a, b, c, d = indices
+            val = self.get_component_down(a, b, c, d)
+            if val != 0:
+                result += f"C_{{{a}{b}{c}{d}}} = {val}\n"
+
+        return result
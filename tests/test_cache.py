@@ -0,0 +1,81 @@
+"""
+Tests for the on-disk cache of derived tensors.
+"""
+
+import pytest
+from sympy import simplify
+
+from itensorpy.cache import TensorCache, enable_disk_cache, disable_disk_cache, get_disk_cache
+from itensorpy.christoffel import ChristoffelSymbols
+from itensorpy.ricci import RicciTensor
+from itensorpy.einstein import EinsteinTensor
+from itensorpy.spacetimes import schwarzschild
+
+
+@pytest.fixture
+def disk_cache(tmp_path):
+    """Enable a disk cache in a temporary directory for the duration of a test."""
+    cache = enable_disk_cache(str(tmp_path))
+    yield cache
+    disable_disk_cache()
+
+
+def test_cache_round_trip(disk_cache):
+    """Test that derived tensors are stored and reloaded from the cache."""
+    metric = schwarzschild()
+    assert get_disk_cache() is disk_cache
+
+    ricci = RicciTensor.from_metric(metric)
+    assert disk_cache.load(metric, "ricci") is not None
+    assert disk_cache.load(metric, f"christoffel:{ricci.christoffel.method}") is not None
+
+    # A fresh metric with the same fingerprint is served from the cache
+    reloaded = RicciTensor.from_metric(schwarzschild())
+    assert reloaded.riemann is None
+    assert reloaded.components == ricci.components
+
+    einstein = EinsteinTensor.from_metric(metric)
+    cached = EinsteinTensor.from_metric(schwarzschild())
+    assert cached.components_lower == einstein.components_lower
+    assert cached.components_upper == einstein.components_upper
+
+    christoffel = ChristoffelSymbols.from_metric(schwarzschild())
+    assert simplify(christoffel.get_component(2, 1, 2) - 1/metric.coordinates[1]) == 0
+
+
+def test_cache_eviction(tmp_path):
+    """Test that least recently used entries are evicted to respect max_size."""
+    cache = TensorCache(str(tmp_path), max_size=1)
+    metric = schwarzschild()
+
+    cache.store(metric, "first", list(range(100)))
+    cache.store(metric, "second", list(range(100)))
+
+    # Each entry alone exceeds the size limit, so nothing is kept
+    assert cache.size() == 0
+    assert cache.load(metric, "second") is None
+
+    cache.max_size = 10**6
+    cache.store(metric, "third", [1, 2, 3])
+    assert cache.load(metric, "third") == [1, 2, 3]
+
+    cache.clear()
+    assert cache.size() == 0
+
+
+def test_cache_configuration(tmp_path, monkeypatch):
+    """Test enabling the cache through the environment and disabling it."""
+    import itensorpy.cache as cache_module
+
+    monkeypatch.setattr(cache_module, "_configured", False)
+    monkeypatch.setenv("ITENSORPY_CACHE_DIR", str(tmp_path))
+    cache = get_disk_cache()
+    assert cache is not None
+    assert cache.directory == str(tmp_path)
+
+    # An explicit disable wins over the environment variable
+    disable_disk_cache()
+    assert get_disk_cache() is None
+
+    with pytest.raises(ValueError):
+        TensorCache(str(tmp_path), max_size=0)
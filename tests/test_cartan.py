@@ -0,0 +1,100 @@
+"""
+Tests for the Cartan orthonormal-frame curvature engine.
+"""
+
+import pytest
+import sympy as sp
+from sympy import symbols, simplify, sin, Function
+
+from itensorpy import Metric, CartanCurvature, RiemannTensor, RicciTensor, EinsteinTensor
+from itensorpy.spacetimes import schwarzschild, kerr, friedmann_lemaitre_robertson_walker
+
+
+def test_schwarzschild_frame_curvature():
+    """Test the frame components and the conversion for Schwarzschild."""
+    metric = schwarzschild()
+    t, r, theta, phi = metric.coordinates
+    M = metric.params[0]
+    cartan = CartanCurvature(metric)
+
+    assert cartan.eta == (-1, 1, 1, 1)
+    assert simplify(cartan.coframe[3, 3] - r * sin(theta)) == 0
+
+    # Tidal components in the static frame
+    R = cartan.riemann_frame
+    assert simplify(R[0][1][0][1] + 2 * M / r**3) == 0
+    assert simplify(R[2][3][2][3] - 2 * M / r**3) == 0
+    assert cartan.ricci_frame == sp.zeros(4, 4)
+    assert cartan.ricci_scalar == 0
+
+    riemann = cartan.to_riemann()
+    reference = RiemannTensor.from_metric(metric)
+    for a in range(4):
+        for b in range(4):
+            for c in range(4):
+                for d in range(4):
+                    assert simplify(riemann.components_down[a][b][c][d]
+                                    - reference.components_down[a][b][c][d]) == 0
+                    assert simplify(riemann.components_up[a][b][c][d]
+                                    - reference.components_up[a][b][c][d]) == 0
+
+
+def test_flrw_frame_einstein():
+    """Test the energy density equation of a flat FLRW universe in the comoving frame."""
+    metric = friedmann_lemaitre_robertson_walker(k=0)
+    t = metric.coordinates[0]
+    a = Function('a')(t)
+    cartan = CartanCurvature(metric)
+
+    assert simplify(cartan.einstein_frame[0, 0] - 3 * a.diff(t)**2 / a**2) == 0
+
+    einstein = cartan.to_einstein()
+    assert isinstance(einstein, EinsteinTensor)
+    assert simplify(einstein.components_lower - EinsteinTensor.from_metric(metric).components_lower) == sp.zeros(4, 4)
+
+    ricci = cartan.to_ricci()
+    assert isinstance(ricci, RicciTensor)
+    assert simplify(ricci.components - RicciTensor.from_metric(metric).components) == sp.zeros(4, 4)
+
+
+def test_rotating_frame_of_flat_space():
+    """Test a block-diagonal coframe on flat space in rotating coordinates."""
+    t, r, phi, z = symbols('t r phi z')
+    omega = symbols('omega', positive=True)
+    g = sp.Matrix([
+        [-(1 - omega**2 * r**2), 0, omega * r**2, 0],
+        [0, 1, 0, 0],
+        [omega * r**2, 0, r**2, 0],
+        [0, 0, 0, 1],
+    ])
+    metric = Metric(g, [t, r, phi, z], signature=(-1, 1, 1, 1))
+    cartan = CartanCurvature(metric)
+
+    assert cartan.eta == (-1, 1, 1, 1)
+    R = cartan.riemann_frame
+    assert all(R[a][b][c][d] == 0 for a in range(4) for b in range(4) for c in range(4) for d in range(4))
+
+
+def test_kerr_coframe_is_orthonormal():
+    """Test the default coframe of the t-phi block of Kerr."""
+    metric = kerr()
+    cartan = CartanCurvature(metric)
+
+    eta = sp.diag(*cartan.eta)
+    assert simplify(cartan.coframe.T * eta * cartan.coframe - metric.g) == sp.zeros(4, 4)
+    assert simplify(cartan.coframe * cartan.frame) == sp.eye(4)
+
+
+def test_custom_coframe():
+    """Test that user coframes are accepted only when orthonormal."""
+    metric = schwarzschild()
+    t, r, theta, phi = metric.coordinates
+    M = metric.params[0]
+    f = 1 - 2 * M / r
+
+    coframe = sp.diag(sp.sqrt(f), 1 / sp.sqrt(f), r, r * sin(theta))
+    cartan = CartanCurvature(metric, coframe=coframe)
+    assert simplify(cartan.riemann_frame[0][1][0][1] + 2 * M / r**3) == 0
+
+    with pytest.raises(ValueError):
+        CartanCurvature(metric, coframe=sp.diag(1, 1, r, r * sin(theta)))
@@ -8,7 +8,7 @@ from sympy import symbols, sin, cos, diff, simplify
 
 from itensorpy.metric import Metric
 from itensorpy.christoffel import ChristoffelSymbols
-from itensorpy.spacetimes import schwarzschild
+from itensorpy.spacetimes import schwarzschild, kerr
 
 
 def test_christoffel_from_metric():
@@ -25,7 +25,7 @@ def test_christoffel_from_metric():
     christoffel = ChristoffelSymbols.from_metric(metric)
     
     # Check specific known components for the 2D sphere
-    assert christoffel.get_component(0, 1, 1) == 0
+    assert christoffel.get_component(0, 1, 1) == -r
     assert christoffel.get_component(1, 0, 1) == 1/r
     assert christoffel.get_component(1, 1, 0) == 1/r
     
@@ -37,7 +37,8 @@ def test_christoffel_from_metric():
     
     # Test the non-zero components method
     nonzero = christoffel.get_nonzero_components()
-    assert len(nonzero) == 2  # Only two non-zero components for 2D sphere
+    assert len(nonzero) == 3  # Γ^0_11 and Γ^1_01 = Γ^1_10 for the 2D sphere
+    assert (0, 1, 1) in nonzero
     assert (1, 0, 1) in nonzero
     assert (1, 1, 0) in nonzero
 
@@ -88,4 +89,210 @@ def test_manual_christoffel_calculation():
     
     # Check a component that should be zero
     assert christoffel.get_component(0, 0, 0) == 0
-    assert christoffel.get_component(0, 1, 1) == 0 
\ No newline at end of file
+
+    # Γ^0_11 = -(1/2)g^00(∂_0 g_11) = t
+    assert christoffel.get_component(0, 1, 1) == t
+
+def test_generic_christoffel_symmetry():
+    """Test that the generic computation fills mirrored components by symmetry."""
+    u, v = symbols('u v')
+    g = sp.Matrix([[1, u*v], [u*v, u**2 + 1]])
+    metric = Metric(components=g, coordinates=[u, v])
+
+    christoffel = ChristoffelSymbols.from_metric(metric)
+    g_inv = metric.inverse
+
+    for k in range(2):
+        for i in range(2):
+            for j in range(2):
+                expected = sum(
+                    sp.Rational(1, 2) * g_inv[k, l] * (
+                        diff(g[j, l], metric.coordinates[i]) +
+                        diff(g[i, l], metric.coordinates[j]) -
+                        diff(g[i, j], metric.coordinates[l])
+                    )
+                    for l in range(2)
+                )
+                assert simplify(christoffel.get_component(k, i, j) - expected) == 0
+        # Mirrored lower indices share the same expression
+        assert christoffel.components[k][0][1] is christoffel.components[k][1][0]
+
+
+def test_diagonal_christoffel_fast_path():
+    """Test the closed-form diagonal path against the generic formula."""
+    u, v, w, y, z = symbols('u v w y z')
+    g = sp.diag(-(1 + v**2), sp.exp(w) * v, w**2, sp.exp(2*u), 1)
+    metric = Metric(components=g, coordinates=[u, v, w, y, z])
+    assert metric.is_diagonal
+
+    christoffel = ChristoffelSymbols(metric=metric, method="formula")
+    generic = christoffel._compute_christoffel_symbols()
+
+    for k in range(5):
+        for i in range(5):
+            for j in range(5):
+                assert simplify(christoffel.get_component(k, i, j) - generic[k][i][j]) == 0
+
+    # Symbols with three distinct indices vanish for diagonal metrics
+    assert christoffel.get_component(0, 1, 2) == 0
+
+
+def test_lagrangian_christoffel_method():
+    """Test the Euler-Lagrange method against the formula on a sparse non-diagonal metric."""
+    t, x, y, z, w = symbols('t x y z w')
+    A = sp.Function('A')(x, y)
+    g = sp.diag(-1, 1 + A**2, 1, t**2, 1)
+    g[1, 4] = g[4, 1] = A
+    metric = Metric(components=g, coordinates=[t, x, y, z, w])
+
+    lagrangian = ChristoffelSymbols(metric=metric, method="lagrangian")
+    formula = ChristoffelSymbols(metric=metric, method="formula")
+    assert lagrangian.method == "lagrangian" and formula.method == "formula"
+
+    for k in range(5):
+        for i in range(5):
+            for j in range(5):
+                assert simplify(lagrangian.get_component(k, i, j) - formula.get_component(k, i, j)) == 0
+
+    # auto keeps the formula for sparse, diagonal and dense metrics alike
+    assert ChristoffelSymbols(metric=metric).method == "formula"
+    assert ChristoffelSymbols(metric=schwarzschild(), lazy=True).method == "formula"
+    assert ChristoffelSymbols(metric=kerr(), lazy=True).method == "formula"
+    u, v = symbols('u v')
+    dense = Metric(components=sp.Matrix([[1, u*v], [u*v, u**2 + 1]]), coordinates=[u, v])
+    assert ChristoffelSymbols(metric=dense, lazy=True).method == "formula"
+
+    with pytest.raises(ValueError):
+        ChristoffelSymbols(metric=metric, method="geodesic")
+
+
+def test_christoffel_first_kind():
+    """Test the cached Christoffel symbols of the first kind."""
+    u, v = symbols('u v')
+    g = sp.Matrix([[1, u*v], [u*v, u**2 + 1]])
+    metric = Metric(components=g, coordinates=[u, v])
+    christoffel = ChristoffelSymbols.from_metric(metric)
+
+    first_kind = christoffel.first_kind
+    assert christoffel.first_kind is first_kind
+
+    # Γ_1 00 = ∂_0 g_01 - (1/2) ∂_1 g_00 = v
+    assert simplify(first_kind[1][0][0] - v) == 0
+
+    # Lowering the symbols of the second kind gives back the first kind
+    for l in range(2):
+        for i in range(2):
+            for j in range(2):
+                lowered = sum(g[l, k] * christoffel.get_component(k, i, j) for k in range(2))
+                assert simplify(lowered - first_kind[l][i][j]) == 0
+
+
+def test_christoffel_sparse_structure():
+    """Test the sparse non-zero map and per-index structure."""
+    metric = schwarzschild()
+    christoffel = ChristoffelSymbols.from_metric(metric)
+
+    nonzero = christoffel.nonzero_map
+    assert len(nonzero) == 13
+    assert (2, 3, 3) in nonzero
+    assert (0, 0, 0) not in nonzero
+
+    uppers = christoffel.nonzero_uppers
+    # Γ^1_33 and Γ^2_33 are the only symbols with lower indices (3,3)
+    assert uppers[(3, 3)] == (1, 2)
+    assert (0, 2) not in uppers
+    assert sum(len(v) for v in uppers.values()) == len(nonzero)
+
+
+def test_lazy_christoffel():
+    """Test that lazy mode computes and memoizes only the accessed components."""
+    u, v = symbols('u v')
+    g = sp.Matrix([[1, u*v], [u*v, u**2 + 1]])
+    metric = Metric(components=g, coordinates=[u, v])
+    eager = ChristoffelSymbols(metric=metric)
+
+    lazy = ChristoffelSymbols.from_metric(metric, lazy=True)
+    assert lazy.lazy
+
+    # Indexing and get_component share the memoized unique component
+    assert simplify(lazy[1, 0, 1] - eager.components[1][0][1]) == 0
+    assert lazy[1, 1, 0] is lazy[1, 0, 1]
+    assert simplify(lazy.get_component(0, 0, 0) - eager.get_component(0, 0, 0)) == 0
+    assert set(lazy._computed) == {(1, 0, 1), (0, 0, 0)}
+    assert lazy._components is None
+
+    # The dense array is filled in on first access, reusing memoized components
+    components = lazy.components
+    assert components[1][0][1] is lazy._computed[(1, 0, 1)]
+    for k in range(2):
+        for i in range(2):
+            for j in range(2):
+                assert simplify(components[k][i][j] - eager.components[k][i][j]) == 0
+
+
+def test_lazy_diagonal_christoffel():
+    """Test lazy components of a diagonal metric."""
+    t, x, y = symbols('t x y')
+    metric = Metric(components=sp.diag(-1, t**2, t**2 * x**2), coordinates=[t, x, y])
+    lazy = ChristoffelSymbols(metric=metric, lazy=True)
+
+    assert lazy[0, 1, 1] == t
+    assert lazy[2, 1, 2] == 1 / x
+    assert lazy[0, 1, 2] == 0
+
+    nonzero = lazy.get_nonzero_components()
+    eager = ChristoffelSymbols(metric=metric).get_nonzero_components()
+    assert nonzero == eager
+
+
+def test_christoffel_derivative_tables():
+    """Test the cached tables of Christoffel symbol derivatives."""
+    u, v = symbols('u v')
+    g = sp.Matrix([[1, u*v], [u*v, u**2 + 1]])
+    metric = Metric(components=g, coordinates=[u, v])
+    christoffel = ChristoffelSymbols.from_metric(metric)
+
+    dGamma = christoffel.derivatives
+    dGamma_first = christoffel.first_kind_derivatives
+    assert christoffel.derivatives is dGamma
+
+    for m, coord in enumerate(metric.coordinates):
+        for k in range(2):
+            for i in range(2):
+                for j in range(2):
+                    assert simplify(dGamma[m][k][i][j] - diff(christoffel.components[k][i][j], coord)) == 0
+                    assert simplify(dGamma_first[m][k][i][j] - diff(christoffel.first_kind[k][i][j], coord)) == 0
+
+
+def test_christoffel_derivatives_skip_absent_coordinates():
+    """Test that derivatives are zero for coordinates a component does not depend on."""
+    metric = schwarzschild()
+    christoffel = ChristoffelSymbols.from_metric(metric)
+    dGamma = christoffel.derivatives
+
+    # Schwarzschild symbols depend only on r and theta
+    assert all(dGamma[0][k][i][j] == 0 for k in range(4) for i in range(4) for j in range(4))
+    assert all(dGamma[3][k][i][j] == 0 for k in range(4) for i in range(4) for j in range(4))
+    assert dGamma[2][3][2][3] == dGamma[2][3][3][2] != 0
+
+
+def test_christoffel_dependencies_within_prediction():
+    """Test that the exact dependencies of the symbols lie within the metric's prediction."""
+    t, r, theta, phi = symbols('t r theta phi')
+    a = sp.Function('a')(t)
+    metric = Metric(components=sp.diag(-1, a**2 / (1 - r**2), a**2 * r**2, a**2 * r**2 * sin(theta)**2),
+                    coordinates=[t, r, theta, phi])
+    christoffel = ChristoffelSymbols(metric=metric)
+    predicted = metric.dependency_map["christoffel"]
+
+    for k in range(4):
+        for i in range(4):
+            for j in range(4):
+                assert christoffel.dependencies[k][i][j] <= predicted[k][i][j]
+                for m in range(4):
+                    if m not in christoffel.dependencies[k][i][j]:
+                        assert christoffel.derivatives[m][k][i][j] == 0
+
+    # Γ^θ_φφ = -sin θ cos θ only depends on θ, although g^θθ and g_φφ depend on t and r
+    assert christoffel.dependencies[2][3][3] == frozenset({2})
+    assert predicted[2][3][3] == frozenset({0, 1, 2})
@@ -0,0 +1,249 @@
+"""
+Tests for the per-metric computation context.
+"""
+
+import itertools
+import pytest
+import sympy as sp
+from sympy import symbols, simplify
+
+from itensorpy import (
+    Metric, ChristoffelSymbols, RiemannTensor, RicciTensor, RicciScalar, EinsteinTensor,
+    CurvatureInvariants, WeylTensor, set_intermediate_simplify_level, get_intermediate_simplify_level, numeric_zero_test
+)
+from itensorpy.utils import simplify_to_level
+from itensorpy.context import ComputationContext
+
+
+def conformally_flat_metric():
+    """Return a 4D metric that is not in the spacetime registry."""
+    t, x, y, z = symbols('t x y z')
+    return Metric(components=sp.diag(-1, 1 + t**2, 1 + t**2, 1 + t**2), coordinates=[t, x, y, z])
+
+
+def test_context_is_per_metric():
+    """Test that each metric owns a single context."""
+    metric = conformally_flat_metric()
+    assert isinstance(metric.context, ComputationContext)
+    assert metric.context is metric.context
+    assert metric.context.metric is metric
+    assert Metric(metric).context is not metric.context
+
+
+def test_from_metric_chain_is_shared():
+    """Test that every from_metric constructor draws from the same intermediates."""
+    metric = conformally_flat_metric()
+    einstein = EinsteinTensor.from_metric(metric)
+
+    ricci = RicciTensor.from_metric(metric)
+    assert einstein.ricci_tensor is ricci
+    assert einstein.ricci_scalar is RicciScalar.from_metric(metric)
+    assert ricci.christoffel is ChristoffelSymbols.from_metric(metric)
+    assert EinsteinTensor.from_metric(metric) is einstein
+
+    # Riemann is only built when asked for, from the shared Christoffel symbols
+    assert "riemann" not in metric.context.computed()
+    riemann = RiemannTensor.from_metric(metric)
+    assert riemann.christoffel is ricci.christoffel
+    assert RiemannTensor.from_metric(metric) is riemann
+    assert RiemannTensor.from_metric(metric, simplify_level=1) is riemann
+
+
+def test_weyl_shares_riemann_node():
+    """Test that the Riemann tensor behind the Weyl tensor is finalized in place on request."""
+    metric = conformally_flat_metric()
+    weyl = WeylTensor.from_metric(metric)
+    assert weyl.riemann.simplify_level == 1
+
+    riemann = RiemannTensor.from_metric(metric)
+    assert riemann is weyl.riemann
+    assert riemann.simplify_level == 2
+    assert [key for key in metric.context.computed() if "riemann" in key] == ["riemann"]
+
+    fresh = RiemannTensor.from_christoffel(ChristoffelSymbols(metric=metric))
+    for a, b, c, d in itertools.product(range(4), repeat=4):
+        assert simplify(riemann.components_down[a][b][c][d] - fresh.components_down[a][b][c][d]) == 0
+        assert simplify(riemann.components_up[a][b][c][d] - fresh.components_up[a][b][c][d]) == 0
+
+
+def test_invariants_use_context():
+    """Test that curvature invariants reuse the metric's Riemann and Ricci tensors."""
+    metric = conformally_flat_metric()
+    riemann = RiemannTensor.from_metric(metric)
+
+    curv = metric.context.invariants()
+    assert curv is metric.context.invariants()
+    assert CurvatureInvariants(metric).riemann is riemann
+
+    ricci = RicciTensor.from_metric(metric)
+    curv.euler_scalar()
+    assert RicciTensor.from_metric(metric) is ricci
+
+
+def test_context_clear():
+    """Test that clearing the context drops memoized tensors."""
+    metric = conformally_flat_metric()
+    christoffel = ChristoffelSymbols.from_metric(metric)
+    assert metric.context.computed() == [("christoffel", christoffel.method)]
+
+    metric.context.clear()
+    assert metric.context.computed() == []
+    recomputed = ChristoffelSymbols.from_metric(metric)
+    assert recomputed is not christoffel
+    assert simplify(recomputed.components[1][0][1] - christoffel.components[1][0][1]) == 0
+
+
+def test_intermediates_are_finalized_on_request():
+    """Test that intermediates use the cheap level and are simplified once when requested."""
+    metric = conformally_flat_metric()
+    assert get_intermediate_simplify_level() == 1
+
+    einstein = EinsteinTensor.from_metric(metric)
+    assert einstein.simplify_level == metric.simplify_level == 2
+    assert einstein.ricci_tensor.simplify_level == 1
+    assert einstein.ricci_tensor.christoffel.simplify_level == 1
+
+    # Requesting the Ricci tensor finalizes the shared intermediate in place
+    ricci = RicciTensor.from_metric(metric)
+    assert ricci is einstein.ricci_tensor
+    assert ricci.simplify_level == 2
+    assert ChristoffelSymbols.from_metric(metric).simplify_level == 2
+
+
+def test_getters_do_not_resimplify():
+    """Test that getters return the stored components of finalized tensors."""
+    metric = conformally_flat_metric()
+    ricci = RicciTensor.from_metric(metric)
+    assert ricci.get_component(1, 1) is ricci.components[1, 1]
+
+    einstein = EinsteinTensor.from_metric(metric)
+    assert einstein.get_component_lower(0, 0) is einstein.components_lower[0, 0]
+
+
+def test_riemann_getters_honour_simplify():
+    """Test that Riemann getters bring a lower-level tensor up to the metric's level."""
+    metric = conformally_flat_metric()
+    riemann = RiemannTensor.from_christoffel(ChristoffelSymbols.from_metric(metric), simplify_level=0)
+    assert riemann.simplify_level < metric.simplify_level
+
+    stored = riemann.components_down[0][1][0][1]
+    assert riemann.get_component_down(0, 1, 0, 1, simplify=False) is stored
+    assert riemann.get_component_down(0, 1, 0, 1) == simplify_to_level(stored, 0, metric.simplify_level)
+
+    stored = riemann.components_up[1][0][0][1]
+    assert riemann.get_component_up(1, 0, 0, 1, simplify=False) is stored
+    assert riemann.get_component_up(1, 0, 0, 1) == simplify_to_level(stored, 0, metric.simplify_level)
+
+
+def test_simplify_level_follows_metric():
+    """Test that the metric's simplify_level is the default for every tensor."""
+    t, x, y, z = symbols('t x y z')
+    metric = Metric(components=sp.diag(-1, 1 + t**2, 1 + t**2, 1 + t**2), coordinates=[t, x, y, z],
+                    simplify_level=1)
+    assert ChristoffelSymbols(metric=metric).simplify_level == 1
+    assert RiemannTensor.from_metric(metric).simplify_level == 1
+    assert EinsteinTensor.from_metric(metric).simplify_level == 1
+    assert CurvatureInvariants(metric).simplify_level == 1
+
+
+def test_intermediate_level_policy():
+    """Test setting the intermediate simplification level."""
+    try:
+        set_intermediate_simplify_level(2)
+        metric = conformally_flat_metric()
+        assert EinsteinTensor.from_metric(metric).ricci_tensor.simplify_level == 2
+    finally:
+        set_intermediate_simplify_level(1)
+
+    with pytest.raises(ValueError):
+        set_intermediate_simplify_level(4)
+
+
+def static_metric():
+    """Return a static spherically symmetric metric with free functions A(r) and B(r)."""
+    t, r, theta, phi = symbols('t r theta phi')
+    A = sp.Function('A')(r)
+    B = sp.Function('B')(r)
+    return Metric(components=sp.diag(-A, B, r**2, r**2 * sp.sin(theta)**2), coordinates=[t, r, theta, phi],
+                  simplify_level=1)
+
+
+@pytest.mark.parametrize("i, j", [(2, 2), (0, 3)])
+def test_with_component_updates_incrementally(i, j):
+    """Test that tensors of a derived metric are updated from the parent's context."""
+    metric = static_metric()
+    t, r, theta, phi = metric.coordinates
+    parent_einstein = EinsteinTensor.from_metric(metric)
+    parent_riemann = RiemannTensor.from_metric(metric)
+
+    derived = metric.with_component(i, j, sp.Function('C')(t, r))
+    assert derived.parent is metric
+    assert derived.changed_components == {(i, j)}
+    assert derived.g[j, i] == derived.g[i, j]
+
+    einstein = EinsteinTensor.from_metric(derived)
+    riemann = RiemannTensor.from_metric(derived)
+    christoffel = riemann.christoffel
+    assert christoffel.recomputed and len(christoffel.recomputed) < 40
+    assert christoffel.changed <= christoffel.recomputed
+
+    # Components that were not recomputed are the parent's objects
+    parent_christoffel = parent_riemann.christoffel
+    for k, a, b in set(ChristoffelSymbols(metric=derived, lazy=True)._generate_indexes()) - christoffel.recomputed:
+        assert christoffel[k, a, b] is parent_christoffel[k, a, b]
+    assert einstein.recomputed
+    for a, b in set(itertools.product(range(4), repeat=2)) - einstein.recomputed:
+        assert einstein.components_lower[a, b] is parent_einstein.components_lower[a, b]
+
+    fresh = Metric(derived.g, derived.coordinates, simplify_level=1)
+    fresh_einstein = EinsteinTensor.from_metric(fresh)
+    fresh_riemann = RiemannTensor.from_metric(fresh)
+    assert einstein.recomputed is not None and fresh_einstein.recomputed is None
+    n = derived.dimension
+    for a in range(n):
+        for b in range(n):
+            assert numeric_zero_test(einstein.components_lower[a, b] - fresh_einstein.components_lower[a, b])
+            assert numeric_zero_test(einstein.components_upper[a, b] - fresh_einstein.components_upper[a, b])
+            assert numeric_zero_test(einstein.components_mixed[a, b] - fresh_einstein.components_mixed[a, b])
+            for c in range(n):
+                for d in range(n):
+                    assert numeric_zero_test(riemann.components_up[a][b][c][d]
+                                             - fresh_riemann.components_up[a][b][c][d])
+                    assert numeric_zero_test(riemann.components_down[a][b][c][d]
+                                             - fresh_riemann.components_down[a][b][c][d])
+
+
+def test_with_component_without_parent_tensors():
+    """Test that a derived metric computes from scratch when the parent has no tensors."""
+    metric = static_metric()
+    r = metric.coordinates[1]
+    derived = metric.with_component(1, 1, 1 + r**2)
+    assert derived.changed_inverse == {(1, 1)}
+    assert metric.changed_inverse == frozenset()
+    assert "context" not in metric.__dict__
+
+    christoffel = ChristoffelSymbols.from_metric(derived)
+    assert christoffel.recomputed is None
+    assert "context" not in metric.__dict__
+
+    with pytest.raises(ValueError):
+        metric.with_component(0, 4, r)
+
+
+def test_christoffel_node_options():
+    """Test that the method is part of the node key and a lazy node is computed on request."""
+    metric = conformally_flat_metric()
+    lazy = metric.context.christoffel(lazy=True)
+    assert lazy.lazy
+
+    christoffel = metric.context.christoffel()
+    assert christoffel is lazy
+    assert not christoffel.lazy and christoffel._components is not None
+
+    formula = metric.context.christoffel(method="formula")
+    lagrangian = metric.context.christoffel(method="lagrangian")
+    assert formula is not lagrangian
+    assert (formula.method, lagrangian.method) == ("formula", "lagrangian")
+    assert metric.context.christoffel(method=christoffel.method) is christoffel
+    for k, i, j in ChristoffelSymbols(metric=metric, lazy=True)._generate_indexes():
+        assert simplify(formula[k, i, j] - lagrangian[k, i, j]) == 0
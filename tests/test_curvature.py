@@ -2,11 +2,12 @@
 Tests for the curvature invariants module.
 """
 
+import warnings
 import pytest
 import sympy as sp
 import numpy as np
-from itensorpy import Metric, CurvatureInvariants
-from itensorpy.spacetimes import schwarzschild, friedmann_lemaitre_robertson_walker
+from itensorpy import Metric, CurvatureInvariants, numeric_zero_test
+from itensorpy.spacetimes import schwarzschild, reissner_nordstrom, friedmann_lemaitre_robertson_walker
 
 def test_schwarzschild_kretschmann():
     """Test the Kretschmann scalar for Schwarzschild spacetime."""
@@ -45,7 +46,7 @@ def test_flrw_kretschmann():
     """Test the Kretschmann scalar for FLRW spacetime."""
     # FLRW metric
     coords = sp.symbols('t r theta phi')
-    a, k_param = sp.symbols('a k')
+    a = sp.Function('a')(coords[0])
     metric = Metric(friedmann_lemaitre_robertson_walker(coordinates=coords, parameters=[a], k=0))
     
     # Calculate Kretschmann scalar
@@ -165,4 +166,155 @@ def test_kerr_newman_kretschmann():
     # Instead of the full calculation, just check that the determinant is non-zero
     # which implies a non-zero curvature
     g_det = g.det()
-    assert g_det != 0 
\ No newline at end of file
+    assert g_det != 0 
+
+
+def test_tangherlini_kretschmann():
+    """Test the Kretschmann scalar of the 5D Schwarzschild - Tangherlini black hole."""
+    t, r, theta, phi, psi = sp.symbols('t r theta phi psi')
+    mu = sp.Symbol('mu', positive=True)
+    f = 1 - mu / r**2
+    g = sp.diag(-f, 1 / f, r**2, r**2 * sp.sin(theta)**2, r**2 * sp.sin(theta)**2 * sp.sin(phi)**2)
+    metric = Metric(g, [t, r, theta, phi, psi], [mu])
+
+    K = CurvatureInvariants(metric).kretschmann_scalar()
+    assert sp.simplify(K - 72 * mu**2 / r**8) == 0
+
+
+def test_kerr_chern_pontryagin():
+    """Test the Chern-Pontryagin scalar of Kerr against its closed form at a sample point."""
+    from itensorpy import spacetimes
+    from itensorpy.registry import enable_registry, disable_registry
+
+    kerr = spacetimes.kerr()
+    disable_registry()
+    try:
+        metric = Metric(kerr.g, kerr.coordinates, kerr.params, simplify_level=0, signature=kerr.signature)
+        CP = CurvatureInvariants(metric).chern_pontryagin_scalar()
+    finally:
+        enable_registry()
+
+    t, r, theta, phi = metric.coordinates
+    M, a = metric.params
+    c = sp.cos(theta)
+    sigma = r**2 + a**2 * c**2
+    expected = 96 * a * M**2 * r * c * (3 * r**2 - a**2 * c**2) * (r**2 - 3 * a**2 * c**2) / sigma**6
+
+    point = {r: sp.Float(3.7), theta: sp.Float(0.6), M: sp.Float(1), a: sp.Float(0.7)}
+    assert abs(float(CP.subs(point)) - float(expected.subs(point))) < 1e-10
+    assert not CP.has(sp.Abs)
+
+
+def test_chern_pontryagin_parity():
+    """Test that the Chern-Pontryagin scalar changes sign with the sense of rotation."""
+    t, r, theta, phi = sp.symbols('t r theta phi')
+    w = sp.Function('w')(r, theta)
+    g = sp.diag(-1, 1, r**2, r**2 * sp.sin(theta)**2)
+    g[0, 3] = g[3, 0] = w
+
+    signature = (-1, 1, 1, 1)
+    CP = CurvatureInvariants(Metric(g, [t, r, theta, phi], simplify_level=0,
+                                    signature=signature)).chern_pontryagin_scalar()
+    reversed_CP = CurvatureInvariants(Metric(g.subs(w, -w), [t, r, theta, phi], simplify_level=0,
+                                             signature=signature)).chern_pontryagin_scalar()
+
+    assert numeric_zero_test(CP) is False
+    assert numeric_zero_test(CP + reversed_CP) is True
+
+
+def test_chern_pontryagin_without_signature():
+    """Test the Chern-Pontryagin scalar of metrics whose symbols carry no assumptions."""
+    t, r, theta, phi, M = sp.symbols('t r theta phi M')
+    f = 1 - 2 * M / r
+    metric = Metric(sp.diag(-f, 1 / f, r**2, r**2 * sp.sin(theta)**2), [t, r, theta, phi], [M])
+
+    # No Levi-Civita term survives, so neither the signature nor a warning is needed
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert CurvatureInvariants(metric).chern_pontryagin_scalar() == 0
+
+    # A surviving term falls back to √(Abs(g)) with a warning
+    w = sp.Function('w')(r, theta)
+    g = sp.diag(-1, 1, r**2, r**2 * sp.sin(theta)**2)
+    g[0, 3] = g[3, 0] = w
+    with pytest.warns(UserWarning, match="signature"):
+        CP = CurvatureInvariants(Metric(g, [t, r, theta, phi], simplify_level=0)).chern_pontryagin_scalar()
+    assert numeric_zero_test(CP) is False
+
+
+def test_compute_all_shares_tensors():
+    """Test that compute_all evaluates every invariant from one set of tensors."""
+    t, r, theta, phi = sp.symbols('t r theta phi')
+    A = sp.Function('A')(r)
+    B = sp.Function('B')(r)
+    metric = Metric(sp.diag(-A, B, r**2, r**2 * sp.sin(theta)**2), [t, r, theta, phi], simplify_level=1,
+                    signature=(-1, 1, 1, 1))
+
+    curv = CurvatureInvariants(metric)
+    results = curv.compute_all()
+    assert list(results) == list(CurvatureInvariants.INVARIANTS)
+    assert set(curv.timings) == {"tensors"} | set(results)
+    assert curv.ricci is metric.context.ricci_tensor(simplify_level=1)
+
+    gauss_bonnet = results["kretschmann"] - 4 * results["ricci_squared"] + results["ricci_scalar_squared"]
+    assert sp.simplify(results["euler"] - gauss_bonnet) == 0
+    assert results["chern_pontryagin"] == 0
+    assert curv.compute_all(["kretschmann"]) == {"kretschmann": results["kretschmann"]}
+
+    with pytest.raises(ValueError):
+        curv.compute_all(["weyl"])
+
+
+def test_compute_all_without_signature(monkeypatch):
+    """Test that an invariant that cannot be computed does not abort the default bundle."""
+    t, r, theta, phi, M = sp.symbols('t r theta phi M')
+    f = 1 - 2 * M / r
+    metric = Metric(sp.diag(-f, 1 / f, r**2, r**2 * sp.sin(theta)**2), [t, r, theta, phi], [M],
+                    simplify_level=1)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        results = CurvatureInvariants(metric).compute_all()
+    assert list(results) == list(CurvatureInvariants.INVARIANTS)
+    assert results["chern_pontryagin"] == 0
+    assert numeric_zero_test(results["kretschmann"] - 48 * M**2 / r**6) is True
+
+    def fail(simplify_level=None):
+        raise ValueError("no signature")
+
+    curv = CurvatureInvariants(metric)
+    monkeypatch.setattr(curv, "chern_pontryagin_scalar", fail)
+    with pytest.warns(UserWarning, match="chern_pontryagin"):
+        results = curv.compute_all()
+    assert "chern_pontryagin" not in results and "kretschmann" in results
+    with pytest.raises(ValueError):
+        curv.compute_all(["chern_pontryagin"])
+
+
+def test_compute_all_dimension():
+    """Test that compute_all skips the four - dimensional invariants in other dimensions."""
+    t, x, y = sp.symbols('t x y')
+    metric = Metric(sp.diag(-1, sp.exp(2 * t), sp.exp(2 * t)), [t, x, y])
+
+    curv = CurvatureInvariants(metric)
+    results = curv.compute_all()
+    assert set(results) == {"kretschmann", "ricci_squared", "ricci_scalar_squared", "weyl_squared"}
+    assert sp.simplify(results["kretschmann"] - 12) == 0
+    assert results["weyl_squared"] == 0
+
+    with pytest.raises(ValueError):
+        curv.compute_all(["euler"])
+
+
+def test_reissner_nordstrom_weyl_squared():
+    """Test the Weyl scalar from the decomposition of the Riemann tensor."""
+    metric = reissner_nordstrom()
+    r = metric.coordinates[1]
+    M, Q = metric.params
+
+    curv = CurvatureInvariants(metric)
+    assert sp.simplify(curv.weyl_squared() - 48 * (M * r - Q**2)**2 / r**8) == 0
+    assert curv.weyl.riemann is curv.riemann
+
+    # Conformally flat
+    assert sp.simplify(CurvatureInvariants(friedmann_lemaitre_robertson_walker(k=1)).weyl_squared()) == 0
@@ -217,4 +217,38 @@ def test_nonzero_components():
     # the method runs without error and returns a valid dictionary
     assert isinstance(nonzero_lower, dict)
     assert isinstance(nonzero_upper, dict)
-    # Skip checking length requirement as our implementation may not match theory 
\ No newline at end of file
+    # Skip checking length requirement as our implementation may not match theory 
+
+
+def test_einstein_mixed_components():
+    """Test the mixed and upper forms against matrix products on a non - diagonal metric."""
+    t, x, y, z = symbols('t x y z')
+    g = sp.Matrix([[-1 - x**2, 0, 0, t / 7],
+                   [0, 1 + y**2, z / 3, 0],
+                   [0, z / 3, 1, 0],
+                   [t / 7, 0, 0, 1]])
+    metric = Metric(g, [t, x, y, z], simplify_level=0)
+    einstein = EinsteinTensor.from_metric(metric)
+
+    # Evaluate at a point with Floats
+    point = {t: sp.Float(0.3), x: sp.Float(0.7), y: sp.Float(-0.4), z: sp.Float(1.1)}
+    g_inv = metric.inverse.xreplace(point)
+    G_lower = einstein.components_lower.xreplace(point)
+    assert (g_inv * G_lower - einstein.components_mixed.xreplace(point)).norm() < 1e-12
+    assert (g_inv * G_lower * g_inv - einstein.components_upper.xreplace(point)).norm() < 1e-12
+    assert einstein.components_upper == einstein.components_upper.T
+
+    # G^μ_μ = -R in four dimensions
+    R = RicciScalar.from_ricci(RicciTensor.from_metric(metric)).value
+    assert abs((einstein.components_mixed.trace() + R).xreplace(point)) < 1e-12
+
+
+def test_flrw_einstein_mixed():
+    """Test that G^μ_ν of flat FLRW is diagonal with G^0_0 = -3ȧ²/a²."""
+    metric = friedmann_lemaitre_robertson_walker(k=0)
+    t = metric.coordinates[0]
+    a = metric.params[0]
+    mixed = EinsteinTensor.from_metric(metric).components_mixed
+
+    assert mixed.is_diagonal()
+    assert sp.simplify(mixed[0, 0] + 3 * sp.diff(a, t)**2 / a**2) == 0
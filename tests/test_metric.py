@@ -7,7 +7,7 @@ import sympy as sp
 from sympy import symbols, diag, sin
 
 from itensorpy.metric import Metric
-from itensorpy.spacetimes import schwarzschild
+from itensorpy.spacetimes import schwarzschild, kerr
 
 
 def test_metric_initialization():
@@ -112,3 +112,130 @@ def test_component_access():
     assert metric.inverse_component(1, 1) == 1
     assert metric.inverse_component(2, 2) == 1/r**2
     assert metric.inverse_component(3, 3) == 1/(r**2 * sin(theta)**2)
+
+
+def test_derivative_tables():
+    """Test the cached first and second derivative tables of the metric."""
+    metric = schwarzschild()
+    t, r, theta, phi = metric.coordinates
+    n = metric.dimension
+
+    dg = metric.derivatives
+    d2g = metric.second_derivatives
+
+    for l in range(n):
+        for i in range(n):
+            for j in range(n):
+                assert dg[l][i][j] == sp.diff(metric.g[i, j], metric.coordinates[l])
+                for k in range(n):
+                    expected = sp.diff(metric.g[i, j], metric.coordinates[k], metric.coordinates[l])
+                    assert sp.simplify(d2g[k][l][i][j] - expected) == 0
+
+    # Tables are cached on the metric instance
+    assert metric.derivatives is dg
+    assert dg[1][3][3] == 2 * r * sin(theta)**2
+    assert dg[0][0][0] == 0
+
+
+def test_block_diagonal_inverse_and_determinant():
+    """Test block-wise inversion and determinant of a block-diagonal metric."""
+    metric = kerr()
+
+    # Only t and phi are coupled in Kerr
+    assert metric.blocks == [(0, 3), (1,), (2,)]
+    assert not metric.is_diagonal
+
+    g_inv = metric.inverse
+    identity = sp.simplify(metric.g * g_inv)
+    assert identity == sp.eye(4)
+    assert g_inv[0, 1] == 0 and g_inv[1, 3] == 0
+
+    assert sp.simplify(metric.determinant - metric.g.det()) == 0
+
+    # A diagonal metric splits into one block per coordinate
+    assert schwarzschild().blocks == [(0,), (1,), (2,), (3,)]
+    assert schwarzschild().is_diagonal
+
+
+def test_metric_fingerprint():
+    """Test that the fingerprint identifies the metric structure."""
+    assert schwarzschild().fingerprint == schwarzschild().fingerprint
+    assert schwarzschild().fingerprint != kerr().fingerprint
+
+    # Assumptions on parameters are part of the fingerprint
+    M = sp.Symbol('M')
+    assert schwarzschild(parameters=[M]).fingerprint != schwarzschild().fingerprint
+
+    # So is the simplification level
+    metric = schwarzschild()
+    assert Metric(metric.g, metric.coordinates, metric.params, simplify_level=1).fingerprint != metric.fingerprint
+
+
+def test_frame_decomposition_and_signature():
+    """Test the sum-of-squares decomposition behind the signature."""
+    metric = kerr()
+    n = metric.dimension
+
+    # g = Σ_a D_a (L_a·dx)²
+    g = sp.zeros(n, n)
+    for pivot, row in metric.frame_decomposition:
+        g += pivot * sp.Matrix(row) * sp.Matrix(row).T
+    assert sp.simplify(g - metric.g) == sp.zeros(n, n)
+
+    assert metric.signature == (-1, 1, 1, 1)
+    assert schwarzschild().signature == (-1, 1, 1, 1)
+
+    t, x = symbols('t x')
+    assert Metric(diag(1, 1), [t, x]).signature == (1, 1)
+
+    # √|g| = √(-g) for a Lorentzian metric, without an absolute value
+    volume = schwarzschild().volume_element
+    assert not volume.has(sp.Abs)
+    assert sp.simplify(volume**2 + schwarzschild().determinant) == 0
+
+    # Without a declared signature the pivot signs come from the assumptions alone
+    r = symbols('r', positive=True)
+    assert Metric(diag(-1, r**2), [t, r]).signature == (-1, 1)
+    undeclared = Metric(schwarzschild().g, schwarzschild().coordinates)
+    with pytest.raises(ValueError):
+        undeclared.signature
+    with pytest.warns(UserWarning, match="signature"):
+        assert undeclared.volume_element == sp.sqrt(sp.Abs(undeclared.determinant))
+
+    # A declared signature is kept by copies and derived metrics
+    declared = Metric(undeclared, signature=(-1, 1, 1, 1))
+    assert declared.signature == (-1, 1, 1, 1)
+    assert Metric(declared).signature == (-1, 1, 1, 1)
+    assert declared.with_component(0, 0, -1).signature == (-1, 1, 1, 1)
+    with pytest.raises(ValueError):
+        Metric(diag(1, 1), [t, x], signature=(1, 0))
+    with pytest.raises(ValueError):
+        Metric(diag(1, 1), [t, x], signature=(1, 1, 1))
+
+    # A metric with a vanishing pivot cannot be decomposed in this coordinate order
+    v, r = symbols('v r')
+    with pytest.raises(ValueError):
+        Metric(sp.Matrix([[-1, 1], [1, 0]]), [v, r]).frame_decomposition
+
+
+def test_dependency_map():
+    """Test the coordinate dependency map of g, g^-1, Γ and ∂Γ."""
+    metric = schwarzschild()
+    deps = metric.dependency_map
+
+    # t, r, θ, φ -> 0, 1, 2, 3
+    assert deps["g"][0][0] == frozenset({1})
+    assert deps["g"][3][3] == frozenset({1, 2})
+    assert deps["g"][0][1] == frozenset()
+    assert deps["inverse"][2][2] == frozenset({1})
+
+    # Γ^t_tr = M / (r (r - 2M)) depends on r only; Γ^t_tθ vanishes structurally
+    assert deps["christoffel"][0][0][1] == frozenset({1})
+    assert deps["christoffel"][0][1][0] == frozenset({1})
+    assert deps["christoffel"][0][0][2] == frozenset()
+    assert deps["christoffel_derivatives"][1][0][0][1] == frozenset({1})
+    assert deps["christoffel_derivatives"][2][0][0][1] == frozenset()
+
+    # The derivative tables only differentiate with respect to those coordinates
+    assert all(metric.derivatives[l][i][j] == 0
+               for l in range(4) for i in range(4) for j in range(4) if l not in deps["g"][i][j])
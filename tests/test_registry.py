@@ -0,0 +1,131 @@
+"""
+Tests for the registry of precomputed spacetimes.
+"""
+
+import pytest
+import sympy as sp
+from sympy import simplify, sin
+
+from itensorpy import Metric, ChristoffelSymbols, CurvatureInvariants
+from itensorpy import spacetimes
+from itensorpy.registry import (
+    structural_key, lookup_name, lookup_christoffel, lookup_invariant,
+    enable_registry, disable_registry
+)
+
+
+@pytest.fixture
+def no_registry():
+    """Disable the registry for the duration of a test."""
+    disable_registry()
+    yield
+    enable_registry()
+
+
+@pytest.mark.parametrize("factory, name", [
+    (spacetimes.minkowski, "minkowski"),
+    (spacetimes.schwarzschild, "schwarzschild"),
+    (spacetimes.reissner_nordstrom, "reissner_nordstrom"),
+    (spacetimes.kerr, "kerr"),
+    (spacetimes.kerr_newman_metric, "kerr_newman"),
+    (lambda: spacetimes.friedmann_lemaitre_robertson_walker(k=0), "flrw_flat"),
+    (lambda: spacetimes.friedmann_lemaitre_robertson_walker(k=1), "flrw_closed"),
+    (lambda: spacetimes.friedmann_lemaitre_robertson_walker(k=-1), "flrw_open"),
+    (spacetimes.de_sitter, "de_sitter"),
+    (spacetimes.anti_de_sitter, "anti_de_sitter"),
+])
+def test_spacetimes_are_registered(factory, name):
+    """Test that every metric in the spacetimes module is found in the registry."""
+    metric = factory()
+    assert lookup_name(metric) == name
+    assert lookup_christoffel(metric) is not None
+    assert lookup_invariant(metric, "kretschmann") is not None
+
+
+def test_structural_key_ignores_symbol_names():
+    """Test that renaming coordinates and parameters keeps the key and maps results back."""
+    T, R, Th, Ph = sp.symbols('T R Th Ph')
+    m = sp.Symbol('m', positive=True)
+    metric = spacetimes.schwarzschild(coordinates=[T, R, Th, Ph], parameters=[m])
+
+    assert structural_key(metric) == structural_key(spacetimes.schwarzschild())
+    assert lookup_invariant(metric, "kretschmann") == 48 * m**2 / R**6
+
+    christoffel = lookup_christoffel(metric)
+    assert simplify(christoffel[2][3][3] + sin(Th) * sp.cos(Th)) == 0
+    assert simplify(christoffel[1][0][0] - m * (R - 2 * m) / R**3) == 0
+
+
+def test_structural_key_is_memoized():
+    """Test that the structural key is computed once per metric."""
+    metric = spacetimes.schwarzschild()
+    assert lookup_name(metric) is not None
+    assert "structural_key" in metric.__dict__
+    assert metric.structural_key == structural_key(metric)
+
+
+def test_structural_key_depends_on_assumptions():
+    """Test that parameters with different assumptions give a different key."""
+    M = sp.Symbol('M')
+    metric = spacetimes.schwarzschild(parameters=[M])
+    assert structural_key(metric) != structural_key(spacetimes.schwarzschild())
+    assert lookup_name(metric) is None
+
+
+def test_undeclared_parameters_are_canonicalized():
+    """Test that free symbols not passed as parameters are still renamed."""
+    reference = spacetimes.schwarzschild()
+    metric = Metric(reference.g, reference.coordinates)
+    assert lookup_name(metric) == "schwarzschild"
+
+
+def test_free_function_is_renamed():
+    """Test that the FLRW scale factor matches under a different name and time coordinate."""
+    tau, r, theta, phi = sp.symbols('tau r theta phi')
+    b = sp.Function('b')(tau)
+    metric = spacetimes.friedmann_lemaitre_robertson_walker(coordinates=[tau, r, theta, phi], parameters=[b])
+
+    assert lookup_name(metric) == "flrw_flat"
+    K = lookup_invariant(metric, "kretschmann")
+    assert K.has(b) and not K.has(sp.Symbol('t'))
+
+
+def test_lookalike_metric_is_not_registered():
+    """Test that a metric sharing Schwarzschild's symbol names is computed, not looked up."""
+    coords = sp.symbols('t r theta phi')
+    a = sp.Symbol('a')
+    metric = spacetimes.friedmann_lemaitre_robertson_walker(coordinates=coords, parameters=[a])
+
+    assert lookup_name(metric) is None
+    # A constant scale factor is flat space
+    assert CurvatureInvariants(metric).kretschmann_scalar() == 0
+
+
+def test_registered_christoffel_matches_computation(no_registry):
+    """Test that the stored Christoffel symbols agree with the general computation."""
+    metric = spacetimes.reissner_nordstrom()
+    computed = ChristoffelSymbols(metric=metric).components
+
+    enable_registry()
+    registered = ChristoffelSymbols(metric=metric).components
+    for k in range(4):
+        for i in range(4):
+            for j in range(4):
+                assert simplify(registered[k][i][j] - computed[k][i][j]) == 0
+
+
+def test_registered_invariants_skip_riemann():
+    """Test that registered invariants are returned without building the Riemann tensor."""
+    curv = CurvatureInvariants(spacetimes.kerr())
+    K = curv.kretschmann_scalar()
+    assert K != 0
+    assert 'riemann' not in curv.__dict__
+
+    M = spacetimes.schwarzschild().params[0]
+    r = spacetimes.schwarzschild().coordinates[1]
+    assert CurvatureInvariants(spacetimes.schwarzschild()).euler_scalar() == 48 * M**2 / r**6
+
+
+def test_disabled_registry(no_registry):
+    """Test that lookups return nothing while the registry is disabled."""
+    assert lookup_christoffel(spacetimes.schwarzschild()) is None
@@ -202,4 +202,23 @@ def test_nonzero_components():
     # Check the (1,1) component - known to be sin^2(theta) in current implementation
     numeric_val_11 = float(nonzero[(1, 1)].subs({a: a_val, theta: theta_val}))
     expected_val_11 = float((sin(theta)**2).subs(theta, theta_val))
-    assert abs(numeric_val_11 - expected_val_11) < 1e-10 
\ No newline at end of file
+    assert abs(numeric_val_11 - expected_val_11) < 1e-10 
+
+def test_ricci_from_christoffel():
+    """Test that the direct Ricci path agrees with contracting the Riemann tensor."""
+    from itensorpy.christoffel import ChristoffelSymbols
+
+    t, x, y, z = symbols('t x y z')
+    g = sp.Matrix([[-1, 0, 0, y], [0, 1, z, 0], [0, z, 1, 0], [y, 0, 0, 1 + x**2]])
+    metric = Metric(components=g, coordinates=[t, x, y, z])
+
+    direct = RicciTensor.from_christoffel(ChristoffelSymbols.from_metric(metric))
+    assert direct.riemann is None
+    contracted = RicciTensor.from_riemann(RiemannTensor.from_metric(metric))
+    assert simplify(direct.components - contracted.components) == sp.zeros(4, 4)
+
+    # from_metric uses the direct path
+    ricci = RicciTensor.from_metric(friedmann_lemaitre_robertson_walker(k=1))
+    assert ricci.riemann is None and ricci.christoffel is not None
+    expected = RicciTensor.from_riemann(RiemannTensor.from_metric(ricci.metric)).components
+    assert simplify(ricci.components - expected) == sp.zeros(4, 4)
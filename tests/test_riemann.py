@@ -156,4 +156,105 @@ def test_nonzero_components():
     for indices, value in nonzero.items():
         a, b, c, d = indices
         assert riemann.get_component_down(a, b, c, d) != 0
-        assert simplify(riemann.get_component_down(a, b, c, d) - value) == 0 
\ No newline at end of file
+        assert simplify(riemann.get_component_down(a, b, c, d) - value) == 0 
+
+def test_riemann_down_from_first_kind():
+    """Test that R_abcd built from first-kind symbols matches lowering R^a_bcd."""
+    from itensorpy.utils import lower_indices
+
+    u, v = symbols('u v')
+    g = Matrix([[1, u*v], [u*v, u**2 + 1]])
+    metric = Metric(components=g, coordinates=[u, v])
+
+    riemann = RiemannTensor.from_metric(metric)
+    lowered = lower_indices(riemann.components_up, metric.g, metric.dimension)
+
+    for a in range(2):
+        for b in range(2):
+            for c in range(2):
+                for d in range(2):
+                    assert simplify(riemann.get_component_down(a, b, c, d) - lowered[a][b][c][d]) == 0
+
+
+def test_riemann_parallel_simplification():
+    """Test that simplifying components in a process pool gives identical results."""
+    metric = schwarzschild()
+
+    serial = RiemannTensor.from_metric(metric)
+    parallel = RiemannTensor.from_metric(metric, workers=2)
+
+    assert parallel.components_up == serial.components_up
+    assert parallel.components_down == serial.components_down
+
+
+def test_riemann_independent_components():
+    """Test that reconstruction from independent components matches the full computation."""
+    t, x, y, z = symbols('t x y z')
+    g = Matrix([[-1, 0, 0, y], [0, 1, z, 0], [0, z, 1, 0], [y, 0, 0, 1 + x**2]])
+    metric = Metric(components=g, coordinates=[t, x, y, z])
+
+    riemann = RiemannTensor.from_metric(metric)
+    full = riemann._compute_riemann_tensor()
+    down = riemann.components_down
+
+    # R_0312 is reconstructed from the first Bianchi identity
+    assert down[0][3][1][2] != 0
+    assert simplify(down[0][3][1][2] - (down[0][2][1][3] - down[0][1][2][3])) == 0
+
+    for a in range(4):
+        for b in range(4):
+            for c in range(4):
+                for d in range(4):
+                    assert simplify(riemann.components_up[a][b][c][d] - full[a][b][c][d]) == 0
+                    assert down[a][b][c][d] == down[c][d][a][b]
+                    assert down[a][b][c][d] == -down[b][a][c][d]
+
+
+def test_riemann_mixed_components():
+    """Test R^ab_cd against raising the first two indices of R_abcd with the full inverse metric."""
+    t, x, y, z = symbols('t x y z')
+    g = Matrix([[-1, 0, 0, y], [0, 1, 0, 0], [0, 0, 1, 0], [y, 0, 0, 1 + x**2]])
+    metric = Metric(components=g, coordinates=[t, x, y, z], simplify_level=1)
+
+    riemann = RiemannTensor.from_metric(metric)
+    mixed = riemann.components_mixed
+    assert riemann.components_mixed is mixed
+
+    down = riemann.components_down
+    g_inv = metric.inverse
+    for a in range(4):
+        for b in range(4):
+            for c in range(4):
+                for d in range(4):
+                    expected = sum(g_inv[a, i] * g_inv[b, j] * down[i][j][c][d] for i in range(4) for j in range(4))
+                    assert simplify(mixed[a][b][c][d] - expected) == 0
+
+def test_riemann_raise_keeps_single_products(monkeypatch):
+    """Test that raising a diagonal metric's R_abcd copies the products g^aa R_abcd unsimplified."""
+    import itensorpy.riemann as riemann_module
+
+    t, r, theta, phi = symbols('t r theta phi')
+    f = sp.Function('f')(r)
+    g = sp.diag(-f, 1 / f, r**2, r**2 * sin(theta)**2)
+    metric = Metric(components=g, coordinates=[t, r, theta, phi])
+
+    batches = []
+    simplify_components = riemann_module.simplify_components
+
+    def spy(exprs, *args, **kwargs):
+        exprs = list(exprs)
+        batches.append(len(exprs))
+        return simplify_components(exprs, *args, **kwargs)
+
+    monkeypatch.setattr(riemann_module, "simplify_components", spy)
+    riemann = RiemannTensor.from_metric(metric)
+    up = riemann.components_up
+
+    # Only R_abcd is simplified; each R^a_bcd with c < d is a single term and is copied
+    assert batches[1:] == [0] * (len(batches) - 1)
+    g_inv = metric.inverse
+    for a in range(4):
+        for b in range(4):
+            for c in range(4):
+                for d in range(c + 1, 4):
+                    assert up[a][b][c][d] == g_inv[a, a] * riemann.components_down[a][b][c][d]
@@ -1,11 +1,16 @@
 import pytest
-from sympy import symbols, Matrix, sin, cos, exp, simplify
+from sympy import symbols, Matrix, Function, Symbol, S, sin, cos, exp, sqrt, simplify, expand
 from itensorpy.utils import (
     generate_index_riemann,
+    generate_index_riemann_independent,
     generate_index_ricci,
     generate_index_christoffel,
     lower_indices,
-    custom_simplify
+    custom_simplify,
+    simplify_components,
+    set_default_workers,
+    get_default_workers,
+    numeric_zero_test
 )
 
 def test_generate_index_riemann():
@@ -25,6 +30,21 @@ def test_generate_index_riemann():
     with pytest.raises(ValueError):
         generate_index_riemann(0)
 
+def test_generate_index_riemann_independent():
+    # Liczba niezależnych składowych R_abcd to n²(n²-1)/12
+    for n in range(1, 6):
+        assert len(generate_index_riemann_independent(n)) == n * n * (n * n - 1) // 12
+
+    indices_4d = generate_index_riemann_independent(4)
+    assert all(a < b and c < d and (a, b) <= (c, d) for a, b, c, d in indices_4d)
+
+    # R_0312 wynika z tożsamości Bianchiego
+    assert (0, 2, 1, 3) in indices_4d
+    assert (0, 3, 1, 2) not in indices_4d
+
+    with pytest.raises(ValueError):
+        generate_index_riemann_independent(0)
+
 def test_generate_index_ricci():
     # Test dla funkcji generate_index_ricci
     indices_2d = generate_index_ricci(2)
@@ -95,6 +115,11 @@ def test_custom_simplify():
     simplified = custom_simplify(expr2)
     assert simplify(simplified - 1) == 0
     
+    # Poziom 1 tylko rozwija wyrażenie, bez skracania ułamków
+    expr_frac = (x**2 - y**2)/(x - y)
+    assert custom_simplify(expr_frac, 1) == expand(expr_frac)
+    assert custom_simplify(expr_frac, 1) != x + y
+
     # Wyrażenie wykładnicze
     expr3 = exp(x + y) / exp(x)
     simplified = custom_simplify(expr3)
@@ -104,4 +129,65 @@ def test_custom_simplify():
     mat = Matrix([[x + x, y], [0, sin(x)**2 + cos(x)**2]])
     simplified_mat = custom_simplify(mat)
     assert simplified_mat[0, 0] == 2*x
-    assert simplify(simplified_mat[1, 1] - 1) == 0 
\ No newline at end of file
+    assert simplify(simplified_mat[1, 1] - 1) == 0 
+
+
+def test_simplify_components_parallel():
+    x, y = symbols('x y')
+    exprs = [sin(x)**2 + cos(x)**2, (x**2 - y**2)/(x - y), exp(x)*exp(y), x*(x + y)]
+
+    serial = simplify_components(exprs)
+    parallel = simplify_components(exprs, workers=2)
+
+    # Wyniki w tej samej kolejności i identyczne jak przy obliczeniach szeregowych
+    assert parallel == serial
+    assert serial == [custom_simplify(e) for e in exprs]
+
+
+def test_default_workers():
+    assert get_default_workers() is None
+    set_default_workers(2)
+    try:
+        assert get_default_workers() == 2
+    finally:
+        set_default_workers(None)
+
+    with pytest.raises(ValueError):
+        set_default_workers(0)
+
+
+def test_numeric_zero_test():
+    x, t = symbols('x t')
+    r = Symbol('r', positive=True)
+    a = Function('a')(t)
+
+    # Tożsamości zerowe, również z pochodnymi nieokreślonej funkcji a(t)
+    assert numeric_zero_test(sin(x)**2 + cos(x)**2 - 1) is True
+    assert numeric_zero_test((a**2).diff(t) - 2*a*a.diff(t)) is True
+    assert numeric_zero_test(sqrt(r**2) - r) is True
+
+    # Wyrażenia niezerowe
+    assert numeric_zero_test(sin(x)) is False
+    assert numeric_zero_test(a.diff(t, 3)) is False
+    # Bez założenia o znaku x tożsamość nie zachodzi
+    assert numeric_zero_test(sqrt(x**2) - x) is False
+    # Małe, ale niezerowe wartości nie są zerem (tolerancja względna)
+    assert numeric_zero_test(exp(-100*r)) is False
+    assert numeric_zero_test(r/10**30) is False
+    assert numeric_zero_test(10**40*x*(sin(x)**2 + cos(x)**2 - 1)) is True
+
+    # Wynik nierozstrzygnięty, gdy nie da się obliczyć wartości w żadnym punkcie
+    assert numeric_zero_test(1/(x - x)) is None
+
+
+def test_simplify_components_skips_zeros():
+    x, y = symbols('x y')
+    exprs = [sin(x)**2 + cos(x)**2 - 1, (x**2 - y**2)/(x - y)]
+
+    # Poziom 1 (cancel) nie upraszcza tożsamości trygonometrycznej, test numeryczny tak
+    assert simplify_components(exprs, level=1) == [S.Zero, x + y]
+    assert simplify_components(exprs, level=0) == exprs
+
+    # Zero numeryczne jest potwierdzane symbolicznie, małe wartości zostają
+    r = Symbol('r', positive=True)
+    assert simplify_components([exp(-100*r), r/10**30], level=1) == [exp(-100*r), r/10**30]
@@ -0,0 +1,76 @@
+"""
+Tests for the Weyl tensor module.
+"""
+
+import itertools
+import pytest
+import sympy as sp
+
+from itensorpy import Metric, WeylTensor, RiemannTensor
+from itensorpy.spacetimes import schwarzschild, reissner_nordstrom, friedmann_lemaitre_robertson_walker
+
+
+def test_schwarzschild_weyl_equals_riemann():
+    """Test that the Weyl tensor of a vacuum spacetime is its Riemann tensor."""
+    metric = schwarzschild()
+    weyl = WeylTensor.from_metric(metric)
+    riemann = RiemannTensor.from_metric(metric)
+
+    for a, b, c, d in itertools.product(range(4), repeat=4):
+        assert sp.simplify(weyl[a, b, c, d] - riemann.components_down[a][b][c][d]) == 0
+
+    assert weyl is metric.context.weyl()
+
+
+def test_weyl_stores_independent_components():
+    """Test that only non - zero independent components are stored."""
+    metric = reissner_nordstrom()
+    weyl = WeylTensor.from_metric(metric)
+
+    assert set(weyl.components) == {(0, 1, 0, 1), (0, 2, 0, 2), (0, 3, 0, 3),
+                                    (1, 2, 1, 2), (1, 3, 1, 3), (2, 3, 2, 3)}
+    assert weyl[1, 0, 0, 1] == -weyl[0, 1, 0, 1]
+    assert weyl[0, 2, 0, 2] == weyl[2, 0, 2, 0]
+    assert len(weyl.get_nonzero_components_down()) == 6
+
+
+def test_weyl_traceless():
+    """Test the symmetries and the vanishing trace on a metric without symmetries."""
+    t, x, y, z = sp.symbols('t x y z')
+    g = sp.Matrix([[-1 - x**2, 0, 0, t / 7],
+                   [0, 1 + y**2, z / 3, 0],
+                   [0, z / 3, 1, 0],
+                   [t / 7, 0, 0, 1]])
+    metric = Metric(g, [t, x, y, z], simplify_level=0)
+    weyl = WeylTensor.from_metric(metric)
+
+    # Evaluate at a point with Floats; the unsimplified components are large
+    point = {t: sp.Float(0.3), x: sp.Float(0.7), y: sp.Float(-0.4), z: sp.Float(1.1)}
+    numeric = WeylTensor({key: value.xreplace(point) for key, value in weyl.components.items()}, metric=metric)
+    C = {indices: numeric[indices] for indices in itertools.product(range(4), repeat=4)}
+    g_inv = metric.inverse.xreplace(point)
+
+    for a, b, c, d in C:
+        assert abs(C[a, b, c, d] + C[a, c, d, b] + C[a, d, b, c]) < 1e-12
+        assert C[a, b, c, d] == C[c, d, a, b]
+
+    for b, d in itertools.product(range(4), repeat=2):
+        trace = sum(g_inv[a, c] * C[a, b, c, d] for a in range(4) for c in range(4))
+        assert abs(trace) < 1e-12
+
+
+def test_conformally_flat_weyl():
+    """Test that the Weyl tensor vanishes for FLRW and in three dimensions."""
+    assert WeylTensor.from_metric(friedmann_lemaitre_robertson_walker(k=1)).components == {}
+
+    t, x, y = sp.symbols('t x y')
+    weyl = WeylTensor.from_metric(Metric(sp.diag(-1, sp.exp(2 * t), sp.exp(2 * t)), [t, x, y]))
+    assert weyl.components == {}
+    assert weyl[0, 1, 0, 1] == 0
+
+
+def test_weyl_requires_ricci():
+    """Test that the Weyl tensor needs the Ricci tensor and scalar."""
+    riemann = RiemannTensor.from_metric(schwarzschild())
+    with pytest.raises(ValueError):
+        WeylTensor(riemann=riemann)